@@ -39,7 +39,9 @@ del get_config
 backend = None
 _init_params = None
 _SPECIAL_ATTRS = {
+    "Executor",
     "Matrix",
+    "Profiler",
     "Recorder",
     "Scalar",
     "Vector",
@@ -52,6 +54,7 @@ _SPECIAL_ATTRS = {
     "io",
     "monoid",
     "op",
+    "prepare",
     "select",
     "semiring",
     "ss",
@@ -202,7 +205,7 @@ _STANDARD_OPERATOR_NAMES = set()
 
 
 def _load(name):
-    if name in {"Matrix", "Vector", "Scalar", "Recorder"}:
+    if name in {"Matrix", "Vector", "Scalar", "Recorder", "Profiler", "Executor", "prepare"}:
         module = _import_module(f".core.{name.lower()}", __name__)
         globals()[name] = getattr(module, name)
     else:
@@ -49,6 +49,9 @@ Composite aggregators (require multiple aggregation steps):
     - harmonic_mean
     - root_mean_square
 
+Fused aggregators (compute several statistics from one pass over the values):
+    - describe, record of count, sum, sum_of_squares, min, max, first, last
+
 Custom recipes (specific to SuiteSparse:GraphBLAS):
     - ss.first
     - ss.last
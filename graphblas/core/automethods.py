@@ -8,10 +8,13 @@ $ python -m graphblas.core.automethods
 
 """
 from .. import config
+from .deferred import deferred_method, is_deferred
 
 
 def _get_value(self, attr=None, default=None):
-    if config.get("autocompute"):
+    if is_deferred(self, attr):
+        return deferred_method(self, attr)
+    if config.get("autocompute") or config.get("defer"):
         if self._value is None:
             self._value = self.new()
         if attr is None:
@@ -149,6 +152,10 @@ def apply(self):
     return self._get_value("apply")
 
 
+def closure(self):
+    return self._get_value("closure")
+
+
 def diag(self):
     return self._get_value("diag")
 
@@ -173,6 +180,10 @@ def get(self):
     return self._get_value("get")
 
 
+def groupby(self):
+    return self._get_value("groupby")
+
+
 def inner(self):
     return self._get_value("inner")
 
@@ -217,6 +228,10 @@ def power(self):
     return self._get_value("power")
 
 
+def power_series(self):
+    return self._get_value("power_series")
+
+
 def reduce(self):
     return self._get_value("reduce")
 
@@ -394,6 +409,7 @@ def _main():
         "__rmatmul__",
         "_carg",
         "diag",
+        "groupby",
         "reposition",
         "ss",
         "to_coo",
@@ -411,10 +427,12 @@ def _main():
     matrix = {
         "_as_vector",
         "T",
+        "closure",
         "kronecker",
         "mxm",
         "mxv",
         "power",
+        "power_series",
         "reduce_columnwise",
         "reduce_rowwise",
         "reduce_scalar",
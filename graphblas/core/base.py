@@ -1,4 +1,5 @@
 from contextvars import ContextVar
+from time import perf_counter
 
 from .. import backend, config
 from .. import replace as replace_singleton
@@ -13,6 +14,8 @@ from .utils import _Pointer, libget, output_type
 
 _recorder = ContextVar("recorder")
 _prev_recorder = None
+_profiler = ContextVar("profiler")
+_prev_profiler = None
 
 
 def record_raw(text):
@@ -23,8 +26,15 @@ def record_raw(text):
 def call(cfunc_name, args):
     call_args = [getattr(x, "_carg", x) if x is not None else NULL for x in args]
     cfunc = libget(cfunc_name)
+    prof = _profiler.get(_prev_profiler)
     try:
-        err_code = cfunc(*call_args)
+        if prof is None:
+            err_code = cfunc(*call_args)
+        else:
+            inputs = prof._describe_inputs(args)
+            start = perf_counter()
+            err_code = cfunc(*call_args)
+            stop = perf_counter()
     except TypeError as exc:
         # We should strive to not encounter this during normal usage
         from .recorder import gbstr
@@ -51,6 +61,8 @@ def call(cfunc_name, args):
     rec = _recorder.get(_prev_recorder)
     if rec is not None:
         rec.record(cfunc_name, args)
+    if prof is not None:
+        prof.record(cfunc_name, args, start, stop, inputs)
     return rv
 
 
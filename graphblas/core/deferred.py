@@ -0,0 +1,262 @@
+"""Deferred evaluation of chained expressions.
+
+Enable with ``graphblas.config.set(defer=True)``.  Calling a method such as ``apply``,
+``select``, ``ewise_add`` or ``reduce_rowwise`` on an expression then returns a new expression
+that holds the whole chain instead of computing the intermediate result.  The chain is only
+computed when ``.new()`` is called, when it is used to update an object (``C << expr``), or when
+data is accessed (e.g. ``nvals``, ``wait``, or ``to_coo``).
+
+Before dispatching to GraphBLAS, chains are rewritten to do less work:
+
+- a positional ``select`` (such as ``"tril"``) is moved before a preceding ``apply``
+- ``apply`` with a right-bound BinaryOp followed by ``reduce_rowwise`` or ``reduce_columnwise``
+  with a Monoid is computed as a single ``mxv`` with the matching semiring
+- a mask used when computing a chain of element-wise operations is pushed down to every step
+- a final ``ewise_add`` is computed with ``accum`` directly into the output
+- intermediate results are cleared as soon as they are consumed
+
+A ``select`` followed by a reduction is not fused: GraphBLAS has no call that reduces only the
+entries a ``select`` would keep, so the selected temporary is computed and then cleared as soon
+as the reduction consumes it.
+"""
+
+from .. import config
+
+_deferred_methods = {
+    "apply",
+    "ewise_add",
+    "ewise_mult",
+    "ewise_union",
+    "inner",
+    "kronecker",
+    "mxm",
+    "mxv",
+    "outer",
+    "power",
+    "reduce",
+    "reduce_columnwise",
+    "reduce_rowwise",
+    "reduce_scalar",
+    "reposition",
+    "select",
+    "vxm",
+}
+_elementwise_methods = {"apply", "ewise_add", "ewise_mult", "ewise_union", "select"}
+
+
+def is_deferred(expr, attr):
+    """Whether ``getattr(expr, attr)`` should extend a deferred chain."""
+    return attr in _deferred_methods and not expr._is_scalar and config.get("defer")
+
+
+def deferred_method(expr, attr):
+    """Return a function that appends ``attr`` to the chain of ``expr``."""
+
+    def method(*args, **kwargs):
+        return _defer(expr, attr, args, kwargs)
+
+    return method
+
+
+def _defer(expr, attr, args, kwargs):
+    from .expr import AmbiguousAssignOrExtract
+
+    if isinstance(expr, AmbiguousAssignOrExtract):
+        expr = expr._extract_delayed()
+    if expr.cfunc_name is None and expr.args[-2] is _compute_chain:
+        steps = expr.args[-1][0]
+    else:
+        steps = ((expr, expr.construct_output(name="defer_temp")),)
+    temp = steps[-1][1]
+    new_expr = getattr(temp, attr)(*args, **kwargs)
+    # Format with the chain so far in place of the temporary
+    name = temp.name
+    temp.name = expr._format_expr()
+    try:
+        expr_repr = new_expr._format_expr()
+    finally:
+        temp.name = name
+    return _chain_expression(_append(steps[:-1], steps[-1], new_expr), expr_repr)
+
+
+def _chain_expression(steps, expr_repr):
+    from .matrix import MatrixExpression
+    from .scalar import ScalarExpression
+    from .vector import VectorExpression
+
+    expr = steps[-1][0]
+    args = [_compute_chain, (steps,)]  # [func, args]
+    expr_repr = expr_repr.replace("{", "{{").replace("}", "}}")
+    if expr.output_type._is_scalar:
+        return ScalarExpression(
+            expr.method_name,
+            None,
+            args,
+            dtype=expr.dtype,
+            expr_repr=expr_repr,
+            is_cscalar=expr._is_cscalar,
+        )
+    if expr.ndim == 1:
+        return VectorExpression(
+            expr.method_name, None, args, dtype=expr.dtype, expr_repr=expr_repr, size=expr._size
+        )
+    return MatrixExpression(
+        expr.method_name,
+        None,
+        args,
+        dtype=expr.dtype,
+        expr_repr=expr_repr,
+        nrows=expr._nrows,
+        ncols=expr._ncols,
+    )
+
+
+def _append(steps, prev, new_expr):
+    """Add ``new_expr``, which reads the output of step ``prev``, to the chain of steps.
+
+    ``steps`` are the ``(expr, temp)`` pairs that come before ``prev``.
+    """
+    from .base import _Pointer
+
+    prev_expr = prev[0]
+    if _is_positional_select(new_expr) and _is_plain(prev_expr, "apply"):
+        # A positional select doesn't depend on values, so select before apply
+        operand = _operand(prev_expr)
+        if operand is not None and type(new_expr.args[1]) is not _Pointer:
+            select_expr = operand.select(new_expr.op.parent, new_expr.args[1])
+            if steps:
+                steps = _append(steps[:-1], steps[-1], select_expr)
+            else:
+                steps = ((select_expr, select_expr.construct_output(name="defer_temp")),)
+            apply_expr = _replace_arg(prev_expr, operand, steps[-1][1])
+            return (*steps, (apply_expr, apply_expr.construct_output(name="defer_temp")))
+    fused = _fuse_apply_reduce(prev_expr, new_expr)
+    if fused is not None:
+        return (*steps, (fused, fused.construct_output(name="defer_temp")))
+    return (*steps, prev, (new_expr, new_expr.construct_output(name="defer_temp")))
+
+
+def _is_plain(expr, method_name):
+    """Is ``expr`` a simple GraphBLAS call (not a recipe or aggregator) for ``method_name``?"""
+    return (
+        expr.method_name == method_name
+        and expr.cfunc_name is not None
+        and not expr.at
+        and not expr.bt
+        and expr.op is not None
+        and expr.op.opclass != "Aggregator"
+    )
+
+
+def _is_positional_select(expr):
+    return _is_plain(expr, "select") and expr.op.is_positional
+
+
+def _operand(expr):
+    """The single Vector or Matrix argument of ``expr``, or None."""
+    operands = [arg for arg in expr.args if getattr(arg, "ndim", 0) > 0]
+    if len(operands) != 1:
+        return None
+    return operands[0]
+
+
+def _replace_arg(expr, old, new):
+    """Create a copy of ``expr`` that uses ``new`` in place of ``old``."""
+    args = [new if arg is old else arg for arg in expr.args]
+    kwargs = (
+        {"size": expr._size} if expr.ndim == 1 else {"nrows": expr._nrows, "ncols": expr._ncols}
+    )
+    return type(expr)(
+        expr.method_name,
+        expr.cfunc_name,
+        args,
+        at=expr.at,
+        bt=expr.bt,
+        op=expr.op,
+        dtype=expr.dtype,
+        expr_repr=expr.expr_repr,
+        **kwargs,
+    )
+
+
+def _fuse_apply_reduce(apply_expr, reduce_expr):
+    """Compute ``A.apply(binop, right=s).reduce_rowwise(monoid)`` as one ``mxv``.
+
+    Every row of ``A`` is multiplied by a full iso-valued vector of ``s``.
+    """
+    from .operator import get_semiring
+    from .scalar import Scalar
+    from .vector import Vector
+
+    if (
+        reduce_expr.method_name not in {"reduce_rowwise", "reduce_columnwise"}
+        or reduce_expr.cfunc_name is None
+        or reduce_expr.at != (reduce_expr.method_name == "reduce_columnwise")
+        or reduce_expr.op.opclass != "Monoid"
+        or not _is_plain(apply_expr, "apply")
+        or "BinaryOp2nd" not in apply_expr.cfunc_name
+        or apply_expr.ndim != 2
+        or type(apply_expr.args[1]) is not Scalar
+    ):
+        return None
+    A, right = apply_expr.args
+    try:
+        semiring = get_semiring(reduce_expr.op, apply_expr.op)
+    except (TypeError, ValueError):  # pragma: no cover (safety)
+        return None
+    if reduce_expr.method_name == "reduce_rowwise":
+        v = Vector.from_scalar(right, A._ncols, name="defer_temp")
+        expr = A.mxv(v, semiring)
+    else:
+        v = Vector.from_scalar(right, A._nrows, name="defer_temp")
+        expr = A.T.mxv(v, semiring)
+    if expr.dtype != reduce_expr.dtype:  # pragma: no cover (safety)
+        return None
+    return expr
+
+
+def _compute_chain(updater, steps):
+    parent = updater.parent
+    kwargs = updater.kwargs
+    opts = updater.opts
+    mask = kwargs.get("mask")
+    prev_temp = steps[-2][1] if len(steps) > 1 else None
+    last_expr = steps[-1][0]
+    if (
+        prev_temp is not None
+        and _is_plain(last_expr, "ewise_add")
+        and last_expr.args[0] is prev_temp
+        and last_expr.args[1] is not parent
+        and kwargs.get("accum") is None
+        and getattr(mask, "parent", mask) is not parent
+        and not parent._is_scalar
+        and parent.dtype == last_expr.dtype == prev_temp.dtype == last_expr.args[1].dtype
+    ):
+        # C << T.ewise_add(B, op)  ->  C << T ; C(accum=op) << B
+        op = last_expr.op
+        if op.opclass == "Monoid":
+            op = op.binaryop
+        steps = steps[:-1]
+        tail = last_expr.args[1]
+    else:
+        op = tail = None
+    if mask is not None and all(
+        _is_plain(expr, expr.method_name) and expr.method_name in _elementwise_methods
+        for expr, _ in steps
+    ):
+        temp_kwargs = {"mask": mask}
+    else:
+        temp_kwargs = {}
+    prev_temp = None
+    try:
+        for expr, temp in steps[:-1]:
+            temp(**temp_kwargs, **opts) << expr
+            if prev_temp is not None:
+                prev_temp.clear()
+            prev_temp = temp
+        updater << steps[-1][0]
+        if tail is not None:
+            parent(mask=mask, accum=op, **opts) << tail
+    finally:
+        for _, temp in steps:
+            temp.clear()
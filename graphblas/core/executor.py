@@ -0,0 +1,171 @@
+"""Run GraphBLAS operations in a pool of threads."""
+
+import asyncio
+import contextvars
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import backend
+from .base import BaseType
+
+
+def _make_context(nthreads, chunk):
+    if backend != "suitesparse":
+        return None
+    from .ss import _IS_SSGB7
+
+    if _IS_SSGB7 or (nthreads is None and chunk is None):
+        return None
+    from .ss.context import Context
+
+    # Each worker thread gets its own context; this keeps a reference to it
+    return Context(nthreads=nthreads, chunk=chunk)
+
+
+class Executor(ThreadPoolExecutor):
+    """Run GraphBLAS operations in a pool of worker threads and return futures.
+
+    Calls into GraphBLAS release the GIL, so long-running operations submitted to an
+    executor don't block the calling thread (such as an asyncio event loop), and
+    independent operations may run concurrently.  This is a
+    ``concurrent.futures.ThreadPoolExecutor``, so it may also be passed to
+    ``loop.run_in_executor``.
+
+    With SuiteSparse:GraphBLAS 8 or later, each worker thread engages its own
+    ``gb.ss.Context`` with the given ``nthreads`` and ``chunk`` so that concurrent
+    operations share the machine instead of each using every core.
+
+    The pending operation holds references to its inputs, so they stay alive until it's
+    done.  Inputs should not be modified until the operation is done, and outputs of
+    ``update`` should not be used until then.  The active ``Recorder`` and ``Profiler``
+    of the caller are also used by the operation.
+
+    >>> with gb.Executor(4, nthreads=2) as executor:
+    ...     future = executor.new(A.mxm(B))
+    ...     C = future.result()
+    >>> C = await executor.new_async(A.mxm(B))  # from a coroutine
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of worker threads; see ``concurrent.futures.ThreadPoolExecutor``.
+    nthreads : int, optional
+        Number of threads each worker may use in GraphBLAS.  Default is to divide the
+        global ``gb.ss.config["nthreads"]`` among the workers, such as 4 threads each for
+        8 workers on 32 cores.
+    chunk : float, optional
+        Chunk size for each worker; see ``gb.ss.Context``.
+    thread_name_prefix : str, default="graphblas"
+    """
+
+    def __init__(self, max_workers=None, *, nthreads=None, chunk=None, thread_name_prefix=None):
+        if thread_name_prefix is None:
+            thread_name_prefix = "graphblas"
+        super().__init__(max_workers, thread_name_prefix, initializer=self._initialize)
+        self._extra_threads = 0
+        if nthreads is None and backend == "suitesparse":
+            from ..ss import config
+
+            nthreads, self._extra_threads = divmod(config["nthreads"], self._max_workers)
+            if nthreads == 0:
+                nthreads, self._extra_threads = 1, 0
+        self.nthreads = nthreads
+        self.chunk = chunk
+        self._worker_ids = itertools.count()
+
+    def _initialize(self):
+        nthreads = self.nthreads
+        if next(self._worker_ids) < self._extra_threads:
+            # Give threads left over from dividing evenly to the first workers
+            nthreads += 1
+        _make_context(nthreads, self.chunk)
+
+    def submit(self, fn, /, *args, **kwargs):
+        """Call ``fn(*args, **kwargs)`` in a worker thread and return a Future.
+
+        The call uses the ``contextvars`` context of the caller.
+        """
+        context = contextvars.copy_context()
+        return super().submit(context.run, fn, *args, **kwargs)
+
+    def run(self, tasks):
+        """Compute a batch of independent expressions or callables and return their results.
+
+        Each task is an expression, which is computed with ``.new()``, or a function that
+        takes no arguments.  Tasks run concurrently in the worker threads, so they should
+        not depend on each other.
+
+        >>> with gb.Executor(8) as executor:
+        ...     results = executor.run([A.mxm(A) for A in graphs])
+
+        Parameters
+        ----------
+        tasks : iterable of expressions or callables
+
+        Returns
+        -------
+        list
+            The results in the same order as ``tasks``.
+        """
+        futures = []
+        for task in tasks:
+            if not isinstance(task, BaseType) and hasattr(task, "new"):
+                futures.append(self.submit(task.new))
+            elif callable(task) and not isinstance(task, BaseType):
+                futures.append(self.submit(task))
+            else:
+                for future in futures:
+                    future.cancel()
+                raise TypeError(f"Executor.run expects expressions or callables; got {type(task)}")
+        return [future.result() for future in futures]
+
+    def new(self, expr, *args, **kwargs):
+        """Compute ``expr.new(*args, **kwargs)`` in a worker thread and return a Future.
+
+        See Also
+        --------
+        new_async
+        """
+        if isinstance(expr, BaseType) or not hasattr(expr, "new"):
+            raise TypeError(
+                f"Executor.new expects an expression such as `A.mxm(B)`; got {type(expr)}"
+            )
+        return self.submit(expr.new, *args, **kwargs)
+
+    def update(self, target, expr, **opts):
+        """Compute ``target.update(expr)`` in a worker thread and return a Future.
+
+        ``target`` may be a Vector, Matrix, or Scalar or an updater such as ``C(mask.S)``.
+        The result of the Future is the Vector, Matrix, or Scalar that was updated.
+
+        See Also
+        --------
+        update_async
+        """
+        if isinstance(target, BaseType):
+            return self.submit(_update_collection, target, expr, opts)
+        if opts:
+            raise TypeError("Options may not be given when updating with an updater")
+        return self.submit(_update, target, expr)
+
+    def new_async(self, expr, *args, **kwargs):
+        """Like ``new``, but return an awaitable for use with asyncio."""
+        return asyncio.wrap_future(self.new(expr, *args, **kwargs))
+
+    def update_async(self, target, expr, **opts):
+        """Like ``update``, but return an awaitable for use with asyncio."""
+        return asyncio.wrap_future(self.update(target, expr, **opts))
+
+    def __repr__(self):
+        return f"<gb.Executor max_workers={self._max_workers} nthreads={self.nthreads}>"
+
+
+def _update_collection(target, expr, opts):
+    target.update(expr, **opts)
+    return target
+
+
+def _update(updater, expr):
+    updater.update(expr)
+    # Updater or Assigner
+    return getattr(updater, "updater", updater).parent
@@ -0,0 +1,200 @@
+"""Aggregate the values of a Vector or Matrix by group labels.
+
+Values are grouped with an iso-valued indicator Matrix ``P`` of shape ``(ngroups, n)``
+that has ``P[label[i], i]`` for each labeled index ``i``.  Monoids and Aggregators that
+reduce with a semiring (which includes composite Aggregators such as ``agg.mean``) are
+computed in a single ``mxv``, ``vxm``, or ``mxm`` with ``P``.  This is faster than sorting
+by label for any number of groups.  Aggregators that can't be computed with a semiring,
+such as ``agg.first`` and ``agg.argmax``, instead use a segmented reduction: the values
+are sorted into a Matrix with one row for each group (and column of the input) that is
+then reduced rowwise.
+"""
+
+import numpy as np
+
+from .. import backend, binary
+from ..dtypes import BOOL
+from ..exceptions import DimensionMismatch
+from .operator import get_semiring, get_typed_op
+from .utils import get_order
+
+
+def groupby(x, labels, op, *, axis, ngroups, name):
+    """Implementation of ``Vector.groupby`` and ``Matrix.groupby``."""
+    grouper = _Grouper(x, labels, axis, ngroups)
+    if isinstance(op, (list, tuple)):
+        return [grouper.reduce(grouper.typed_op(item)) for item in op]
+    return grouper.reduce(grouper.typed_op(op), name)
+
+
+class _Grouper:
+    def __init__(self, x, labels, axis, ngroups):
+        self.x = x
+        self.is_vector = x.ndim == 1
+        if self.is_vector:
+            self.rowwise = True
+            n = x._size
+        else:
+            self.rowwise = get_order(axis) == "rowwise"
+            n = x._nrows if self.rowwise else x._ncols
+        self.n = n
+        self.indices, self.groups = _normalize_labels(labels, n)
+        if ngroups is None:
+            ngroups = int(self.groups.max()) + 1 if self.groups.size > 0 else 0
+        elif ngroups < 0:
+            raise ValueError(f"ngroups must be non-negative; got {ngroups}")
+        elif self.groups.size > 0 and self.groups.max() >= ngroups:
+            raise ValueError(f"labels must be less than ngroups={ngroups}; got {self.groups.max()}")
+        self.ngroups = ngroups
+        self._indicators = {}
+        self._segments = None
+
+    def typed_op(self, op):
+        op = get_typed_op(op, self.x.dtype, kind="binary|aggregator")
+        if op.opclass == "BinaryOp" and op.monoid is not None:
+            return op.monoid
+        self.x._expect_op(op, ("Monoid", "Aggregator"), within="groupby", argname="op")
+        return op
+
+    def reduce(self, op, name=None):
+        if op.opclass == "Monoid":
+            semiring = get_semiring(op, binary.first[op.type])
+            return self._indicator_reduce(self.x, semiring, False, True, BOOL, name)
+        agg = op.parent
+        if agg._monoid is not None:
+            return self.reduce(agg._monoid[op.type], name)
+        if agg._composite is not None:
+            results = [self.reduce(cur_agg[op.type]) for cur_agg in agg._composite]
+            return agg._finalize(*results, {}).new(name=name)
+        if agg._custom is not None:
+            return self._segmented_reduce(op, name)
+        x = self.x
+        if agg._applybegin is not None:
+            x = agg._applybegin(x).new()
+        semiring = get_typed_op(agg._semiring, op.type, agg._initdtype)
+        rv = self._indicator_reduce(x, semiring, agg._switch, agg._initval, agg._initdtype, name)
+        if agg._finalize is not None:
+            finalize = agg._finalize[semiring.return_type]
+            if rv.dtype == finalize.return_type:
+                rv << finalize(rv)
+            else:
+                rv = finalize(rv).new(finalize.return_type, name=name)
+        return rv
+
+    def _indicator(self, value, dtype):
+        key = (value, dtype)
+        if key not in self._indicators:
+            from .matrix import Matrix
+
+            indptr = np.zeros(self.n + 1, np.uint64)
+            indptr[self.indices + 1] = 1
+            np.cumsum(indptr, out=indptr)
+            self._indicators[key] = Matrix.from_csc(
+                indptr, self.groups, value, dtype, nrows=self.ngroups, ncols=self.n, name="P_temp"
+            )
+        return self._indicators[key]
+
+    def _indicator_reduce(self, x, semiring, switch, value, dtype, name):
+        # The semiring multiplies values of `x` by the value of `P` (or the reverse if `switch`)
+        P = self._indicator(value, dtype)
+        if self.is_vector:
+            expr = semiring(P @ x) if switch else semiring(x @ P.T)
+            return expr.new(name=name)
+        if self.rowwise != switch:
+            # Multiply `P` on the other side of `x` with the commuted semiring if possible
+            semiring_ = semiring.commutes_to
+            if semiring_ is None:
+                expr = semiring(x.T @ P.T) if self.rowwise else semiring(P @ x.T)
+                return expr.new(name="groupby_temp").T.new(name=name)
+            semiring = semiring_
+        expr = semiring(P @ x) if self.rowwise else semiring(x @ P.T)
+        return expr.new(name=name)
+
+    def _segmented_reduce(self, op, name):
+        if self._segments is None:
+            self._segments = self._build_segments()
+        if self.is_vector:
+            return self._segments.reduce_rowwise(op).new(name=name)
+        w = self._segments.reduce_rowwise(op).new(name="groupby_temp")
+        if self.rowwise:
+            return _reshape(w, self.ngroups, self.x._ncols, name)
+        return _reshape(w, self.x._nrows, self.ngroups, name)
+
+    def _build_segments(self):
+        """Matrix with a row for each group and column of ``x`` and a column for each member.
+
+        Columns are the index of the member within ``x``, so positional aggregators such
+        as ``agg.first`` and ``agg.argmax`` give results relative to the input.
+        """
+        from .matrix import Matrix
+
+        x = self.x
+        is_labeled = np.zeros(self.n, bool)
+        is_labeled[self.indices] = True
+        group_of = np.zeros(self.n, np.uint64)
+        group_of[self.indices] = self.groups
+        if self.is_vector:
+            members, values = x.to_coo()
+            keys = group_of[members]
+            nkeys = self.ngroups
+        else:
+            rows, cols, values = x.to_coo()
+            if self.rowwise:
+                members = rows
+                keys = group_of[rows] * np.uint64(x._ncols) + cols
+                nkeys = self.ngroups * x._ncols
+            else:
+                members = cols
+                keys = rows * np.uint64(self.ngroups) + group_of[cols]
+                nkeys = x._nrows * self.ngroups
+        keep = is_labeled[members]
+        return Matrix.from_coo(
+            keys[keep],
+            members[keep],
+            values[keep],
+            x.dtype,
+            nrows=nkeys,
+            ncols=self.n,
+            name="groupby_segments",
+        )
+
+
+def _normalize_labels(labels, n):
+    """Return the labeled indices and their group labels as uint64 arrays."""
+    from .vector import Vector
+
+    if isinstance(labels, Vector):
+        if labels._size != n:
+            raise DimensionMismatch(f"labels must have size {n}; got {labels._size}")
+        if labels.dtype.np_type.kind not in "iu":
+            raise TypeError(f"labels must be integers; got dtype {labels.dtype}")
+        indices, groups = labels.to_coo()
+    else:
+        groups = np.asarray(labels)
+        if groups.ndim != 1 or groups.size != n:
+            raise DimensionMismatch(f"labels must have size {n}; got shape {groups.shape}")
+        if groups.size == 0:
+            groups = groups.astype(np.int64)
+        elif groups.dtype.kind not in "iu":
+            raise TypeError(f"labels must be integers; got dtype {groups.dtype}")
+        indices = np.arange(n, dtype=np.uint64)
+    if groups.size > 0 and groups.dtype.kind == "i" and groups.min() < 0:
+        raise ValueError(f"labels must be non-negative; got {groups.min()}")
+    return indices, groups.astype(np.uint64, copy=False)
+
+
+def _reshape(w, nrows, ncols, name):
+    if backend == "suitesparse":
+        return w.ss.reshape(nrows, ncols, name=name)
+    from .matrix import Matrix
+
+    indices, values = w.to_coo()
+    return Matrix.from_coo(
+        indices // np.uint64(ncols),
+        indices % np.uint64(ncols),
+        values,
+        w.dtype,
+        nrows=nrows,
+        ncols=ncols,
+        name=name,
+    )
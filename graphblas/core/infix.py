@@ -194,6 +194,7 @@ class VectorInfixExpr(InfixExprBase):
     ewise_union = wrapdoc(Vector.ewise_union)(property(automethods.ewise_union))
     gb_obj = wrapdoc(Vector.gb_obj)(property(automethods.gb_obj))
     get = wrapdoc(Vector.get)(property(automethods.get))
+    groupby = wrapdoc(Vector.groupby)(property(automethods.groupby))
     inner = wrapdoc(Vector.inner)(property(automethods.inner))
     isclose = wrapdoc(Vector.isclose)(property(automethods.isclose))
     isequal = wrapdoc(Vector.isequal)(property(automethods.isequal))
@@ -317,12 +318,14 @@ class MatrixInfixExpr(InfixExprBase):
     _name_html = wrapdoc(Matrix._name_html)(property(automethods._name_html))
     _nvals = wrapdoc(Matrix._nvals)(property(automethods._nvals))
     apply = wrapdoc(Matrix.apply)(property(automethods.apply))
+    closure = wrapdoc(Matrix.closure)(property(automethods.closure))
     diag = wrapdoc(Matrix.diag)(property(automethods.diag))
     ewise_add = wrapdoc(Matrix.ewise_add)(property(automethods.ewise_add))
     ewise_mult = wrapdoc(Matrix.ewise_mult)(property(automethods.ewise_mult))
     ewise_union = wrapdoc(Matrix.ewise_union)(property(automethods.ewise_union))
     gb_obj = wrapdoc(Matrix.gb_obj)(property(automethods.gb_obj))
     get = wrapdoc(Matrix.get)(property(automethods.get))
+    groupby = wrapdoc(Matrix.groupby)(property(automethods.groupby))
     isclose = wrapdoc(Matrix.isclose)(property(automethods.isclose))
     isequal = wrapdoc(Matrix.isequal)(property(automethods.isequal))
     kronecker = wrapdoc(Matrix.kronecker)(property(automethods.kronecker))
@@ -331,6 +334,7 @@ class MatrixInfixExpr(InfixExprBase):
     name = wrapdoc(Matrix.name)(property(automethods.name)).setter(automethods._set_name)
     nvals = wrapdoc(Matrix.nvals)(property(automethods.nvals))
     power = wrapdoc(Matrix.power)(property(automethods.power))
+    power_series = wrapdoc(Matrix.power_series)(property(automethods.power_series))
     reduce_columnwise = wrapdoc(Matrix.reduce_columnwise)(property(automethods.reduce_columnwise))
     reduce_rowwise = wrapdoc(Matrix.reduce_rowwise)(property(automethods.reduce_rowwise))
     reduce_scalar = wrapdoc(Matrix.reduce_scalar)(property(automethods.reduce_scalar))
@@ -1,16 +1,19 @@
 import itertools
+import pickle
 import warnings
 from collections.abc import Sequence
+from contextlib import ExitStack
 
 import numpy as np
 
-from .. import backend, binary, monoid, select, semiring
+from .. import backend, binary, config, monoid, select, semiring
 from ..dtypes import _INDEX, FP64, INT64, lookup_dtype, unify
 from ..exceptions import DimensionMismatch, InvalidValue, NoValue, check_status
-from . import _supports_udfs, automethods, ffi, lib, utils
+from . import _supports_udfs, automethods, ffi, lib, utils, workspace
 from .base import BaseExpression, BaseType, _check_mask, call
 from .descriptor import lookup as descriptor_lookup
 from .expr import _ALL_INDICES, AmbiguousAssignOrExtract, IndexerResolver, Updater
+from .groupby import groupby
 from .mask import Mask, StructuralMask, ValueMask
 from .operator import UNKNOWN_OPCLASS, find_opclass, get_semiring, get_typed_op, op_from_string
 from .scalar import (
@@ -47,6 +50,17 @@ _CSR_FORMAT = Scalar.from_value(
 _CSC_FORMAT = Scalar.from_value(
     lib.GrB_CSC_FORMAT, dtype=_INDEX, name="GrB_CSC_FORMAT", is_cscalar=True
 )
+_GROUPBY_AXES = {
+    "row",
+    "rows",
+    "rowwise",
+    "col",
+    "cols",
+    "column",
+    "columns",
+    "colwise",
+    "columnwise",
+}
 # COO format is not used yet.
 # _COO_FORMAT = Scalar.from_value(
 #     lib.GrB_COO_FORMAT, dtype=_INDEX, name="GrB_COO_FORMAT", is_cscalar=True
@@ -100,58 +114,146 @@ def _power(updater, A, n, op):
     # Use repeated squaring: compute A^2, A^4, A^8, etc., and combine terms as needed.
     # See `numpy.linalg.matrix_power` for a simpler implementation to understand how this works.
     # We reuse `result` and `square` outputs, and use `square_expr` so masks can be applied.
-    result = square = square_expr = None
-    n, bit = divmod(n, 2)
-    while True:
-        if bit != 0:
-            # Need to multiply `square_expr` or `A` into the result
-            if square_expr is not None:
-                # Need to evaluate `square_expr`; either into final result, or into `square`
-                if n == 0 and result is None:
-                    # Handle `updater << A @ A` without an intermediate value
-                    updater << square_expr
+    # `result` and `square` are borrowed from the workspace pool and returned when done.
+    new_matrix = op(A @ A)._new_matrix
+    with ExitStack() as temporaries:
+
+        def temporary(expr, name):
+            rv = temporaries.enter_context(
+                workspace.borrow(new_matrix, expr.dtype, A.shape, name=name)
+            )
+            rv(**opts) << expr
+            return rv
+
+        result = square = square_expr = None
+        n, bit = divmod(n, 2)
+        while True:
+            if bit != 0:
+                # Need to multiply `square_expr` or `A` into the result
+                if square_expr is not None:
+                    # Need to evaluate `square_expr`; either into final result, or into `square`
+                    if n == 0 and result is None:
+                        # Handle `updater << A @ A` without an intermediate value
+                        updater << square_expr
+                        return
+                    if square is None:
+                        # Create `square = A @ A`
+                        square = temporary(square_expr, "Squares")
+                    else:
+                        # Compute `square << square @ square`
+                        square(**opts) << square_expr
+                    square_expr = None
+                if result is None:
+                    # First time needing the intermediate result!
+                    if square is None:
+                        # Use `A` if possible to avoid unnecessary copying
+                        # We will detect and handle `result is A` below
+                        result = A
+                    else:
+                        # Copy square as intermediate result
+                        result = temporary(square, "Power")
+                elif n == 0:
+                    # All done! No more terms to compute
+                    updater << op(result @ square)
                     return
-                if square is None:
-                    # Create `square = A @ A`
-                    square = square_expr.new(name="Squares", **opts)
+                elif result is A:
+                    # Now we need to create a new matrix for the intermediate result
+                    result = temporary(op(result @ square), "Power")
                 else:
-                    # Compute `square << square @ square`
-                    square(**opts) << square_expr
-                square_expr = None
-            if result is None:
-                # First time needing the intermediate result!
+                    # Main branch: multiply `square` into `result`
+                    result(**opts) << op(result @ square)
+            n, bit = divmod(n, 2)
+            if square_expr is not None:
+                # We need to perform another squaring, so evaluate current `square_expr` first
                 if square is None:
-                    # Use `A` if possible to avoid unnecessary copying
-                    # We will detect and handle `result is A` below
-                    result = A
+                    # Create `square`
+                    square = temporary(square_expr, "Squares")
                 else:
-                    # Copy square as intermediate result
-                    result = square.dup(name="Power", **opts)
-            elif n == 0:
-                # All done! No more terms to compute
-                updater << op(result @ square)
-                return
-            elif result is A:
-                # Now we need to create a new matrix for the intermediate result
-                result = op(result @ square).new(name="Power", **opts)
-            else:
-                # Main branch: multiply `square` into `result`
-                result(**opts) << op(result @ square)
-        n, bit = divmod(n, 2)
-        if square_expr is not None:
-            # We need to perform another squaring, so evaluate current `square_expr` first
+                    # Compute `square`
+                    square << square_expr
             if square is None:
-                # Create `square`
-                square = square_expr.new(name="Squares", **opts)
+                # First iteration! Create expression for first square
+                square_expr = op(A @ A)
             else:
-                # Compute `square`
-                square << square_expr
-        if square is None:
-            # First iteration! Create expression for first square
-            square_expr = op(A @ A)
+                # Expression for repeated squaring
+                square_expr = op(square @ square)
+
+
+def _power_series(updater, A, k, beta, op, mask):
+    opts = updater.opts
+    # Use Horner's scheme: `S << A + S @ B` repeated `k - 1` times (where `B` is `beta * A`)
+    # needs one matrix multiply and one accumulation per term, and it reuses `S` in-place.
+    # Multiplying on the right means each row of `S` only depends on the same row of `S`,
+    # so intermediate results only need the rows of the mask; the mask is applied last.
+    accum = op.monoid.binaryop
+    new_matrix = op(A @ A)._new_matrix
+    with ExitStack() as temporaries:
+
+        def temporary(name):
+            return temporaries.enter_context(
+                workspace.borrow(new_matrix, op.return_type, A.shape, name=name)
+            )
+
+        if k > 1 and mask is not None and not mask.complement:
+            rows = mask.parent.reduce_rowwise(monoid.any).new(name="rows")
+            left = temporary("Rows")
+            left(**opts) << get_semiring(monoid.any, binary.second)(rows.diag() @ A)
+        else:
+            left = A
+        if beta is None:
+            right = A
         else:
-            # Expression for repeated squaring
-            square_expr = op(square @ square)
+            right = temporary("Scaled")
+            right(**opts) << op.binaryop(A, beta)
+        result = temporary("PowerSeries")
+        result(mask=mask if k == 1 else None, **opts) << left
+        for i in range(1, k):
+            cur_mask = mask if i == k - 1 else None
+            result(mask=cur_mask, replace=cur_mask is not None, **opts) << op(result @ right)
+            result(mask=cur_mask, accum=accum, **opts) << left
+        updater << result
+
+
+def _closure(updater, A, op, max_iter, mask):
+    opts = updater.opts
+    # Squaring with `R << R + R @ R` reaches paths twice as long each iteration, but it is
+    # only valid for idempotent monoids (it counts paths more than once) and it uses elements
+    # outside of the mask.  Otherwise, extend paths by one edge with `R << A + R @ A`.
+    # Iterate between two borrowed temporaries so the previous result can be compared.
+    squaring = mask is None and op.monoid.is_idempotent
+    accum = op.monoid.binaryop
+    new_matrix = op(A @ A)._new_matrix
+    with ExitStack() as temporaries:
+        prev, cur = (
+            temporaries.enter_context(
+                workspace.borrow(new_matrix, op.return_type, A.shape, name=name)
+            )
+            for name in ["Closure_prev", "Closure"]
+        )
+        cur(mask=mask, **opts) << A
+        niters = 0
+        while max_iter is None or niters < max_iter:
+            niters += 1
+            prev, cur = cur, prev
+            if squaring:
+                cur(**opts) << op(prev @ prev)
+                cur(accum=accum, **opts) << prev
+            else:
+                cur(mask=mask, replace=mask is not None, **opts) << op(prev @ A)
+                cur(mask=mask, accum=accum, **opts) << A
+            if _is_unchanged(prev, cur):
+                break
+        updater << cur
+
+
+def _is_unchanged(prev, cur):
+    # Results only grow, so the structure is unchanged if nvals is unchanged
+    if prev._nvals != cur._nvals:
+        return False
+    # Avoid comparing values (such as for reachability) if both are iso-valued
+    if backend == "suitesparse" and prev.ss.is_iso and cur.ss.is_iso and prev._nvals > 0:
+        return prev.ss.iso_value.value == cur.ss.iso_value.value
+    return prev.isequal(cur)
 
 
 class Matrix(BaseType):
@@ -254,9 +356,16 @@ class Matrix(BaseType):
             return self._parent._name_html
         return super()._name_html
 
-    def __reduce__(self):
-        # TODO: we should probably use (or compare to) GraphBLAS serialize methods
+    def __reduce_ex__(self, protocol):
+        # With protocol 5, numpy arrays and PickleBuffers are pickled out-of-band if
+        # the pickler has a ``buffer_callback``, so the data isn't copied into the stream.
         if backend == "suitesparse":
+            compression = config.get("pickle_compression")
+            if compression is not None:
+                blob = self.ss.serialize(compression)
+                if protocol >= 5:
+                    blob = pickle.PickleBuffer(blob)
+                return self._deserialize_blob, (blob, self.dtype, self.name)
             pieces = self.ss.export(raw=True)
         else:
             rows, cols, vals = self.to_coo(sort=False)
@@ -266,10 +375,15 @@ class Matrix(BaseType):
     @staticmethod
     def _deserialize(pieces, name):
         if backend == "suitesparse":
-            return Matrix.ss.import_any(name=name, **pieces)
+            # Arrays unpickled in-band own their data, so GraphBLAS can take it without copying
+            return Matrix.ss.import_any(name=name, take_ownership=True, **pieces)
         rows, cols, vals, dtype, nrows, ncols = pieces
         return Matrix.from_coo(rows, cols, vals, dtype, nrows=nrows, ncols=ncols, name=name)
 
+    @staticmethod
+    def _deserialize_blob(blob, dtype, name):
+        return Matrix.ss.deserialize(blob, dtype, name=name)
+
     @property
     def S(self):
         """Create a Mask based on the structure of the Matrix."""
@@ -540,7 +654,7 @@ class Matrix(BaseType):
         )
         return self.to_coo(dtype, rows=rows, columns=columns, values=values, sort=sort)
 
-    def to_coo(self, dtype=None, *, rows=True, columns=True, values=True, sort=True):
+    def to_coo(self, dtype=None, *, rows=True, columns=True, values=True, sort=True, index=None):
         """Extract the indices and values as a 3-tuple of numpy arrays
         corresponding to the COO format of the Matrix.
 
@@ -558,6 +672,8 @@ class Matrix(BaseType):
             Whether to require sorted indices.
             If internally stored rowwise, the sorting will be first by rows, then by column.
             If internally stored columnwise, the sorting will be first by column, then by row.
+        index : :class:`~graphblas.io.NodeIndex`, optional
+            If given, return the node keys of the rows and columns instead of indices.
 
         See Also
         --------
@@ -571,6 +687,15 @@ class Matrix(BaseType):
         np.ndarray[dtype=uint64] : Columns
         np.ndarray : Values
         """
+        if index is not None:
+            rows, columns, values = self.to_coo(
+                dtype, rows=rows, columns=columns, values=values, sort=sort
+            )
+            return (
+                None if rows is None else index.take(rows),
+                None if columns is None else index.take(columns),
+                values,
+            )
         if sort and backend == "suitesparse":
             self.wait()  # sort in SS
         nvals = self._nvals
@@ -610,7 +735,7 @@ class Matrix(BaseType):
             c_values if values else None,
         )
 
-    def to_edgelist(self, dtype=None, *, values=True, sort=True):
+    def to_edgelist(self, dtype=None, *, values=True, sort=True, index=None):
         """Extract the indices and values as a 2-tuple of numpy arrays.
 
         This calls ``to_coo`` then transforms the data into an edgelist.
@@ -625,6 +750,8 @@ class Matrix(BaseType):
             Whether to require sorted indices.
             If internally stored rowwise, the sorting will be first by rows, then by column.
             If internally stored columnwise, the sorting will be first by column, then by row.
+        index : :class:`~graphblas.io.NodeIndex`, optional
+            If given, return the node keys of the rows and columns instead of indices.
 
         See Also
         --------
@@ -637,7 +764,7 @@ class Matrix(BaseType):
         np.ndarray[dtype=uint64] : Edgelist
         np.ndarray : Values
         """
-        rows, columns, values = self.to_coo(dtype, values=values, sort=sort)
+        rows, columns, values = self.to_coo(dtype, values=values, sort=sort, index=index)
         return (np.column_stack([rows, columns]), values)
 
     def build(self, rows, columns, values, *, dup_op=None, clear=False, nrows=None, ncols=None):
@@ -969,6 +1096,7 @@ class Matrix(BaseType):
         nrows=None,
         ncols=None,
         dup_op=None,
+        index=None,
         name=None,
     ):
         """Create a new Matrix from edgelist of (row, col) pairs or (row, col, value) triples.
@@ -995,6 +1123,10 @@ class Matrix(BaseType):
         dup_op : :class:`~graphblas.core.operator.BinaryOp`, optional
             Function used to combine values if duplicate indices are found.
             Leaving ``dup_op=None`` will raise an error if duplicates are found.
+        index : :class:`~graphblas.io.NodeIndex`, optional
+            If given, rows and columns in ``edgelist`` are node keys, which are translated
+            to indices with ``index.extend``, so new keys are added to ``index``.
+            ``nrows`` and ``ncols`` default to the size of ``index``.
         name : str, optional
             Name to give the Matrix.
 
@@ -1049,6 +1181,15 @@ class Matrix(BaseType):
             raise TypeError(
                 "Too many sources of values: from `edgelist` triples and from `values=` argument"
             )
+        if index is not None:
+            # Interleave so keys are added in the order they appear in the edgelist
+            ids = index.extend(np.column_stack([rows, cols]).ravel())
+            rows = ids[0::2]
+            cols = ids[1::2]
+            if nrows is None:
+                nrows = len(index)
+            if ncols is None:
+                ncols = len(index)
         return cls.from_coo(
             rows, cols, values, dtype, nrows=nrows, ncols=ncols, dup_op=dup_op, name=name
         )
@@ -1851,7 +1992,7 @@ class Matrix(BaseType):
             values = normalize_values(self, values, dtype)
         return compressed_cols, indptr, rows, values
 
-    def to_dicts(self, order="rowwise"):
+    def to_dicts(self, order="rowwise", *, index=None):
         """Return Matrix as a dict of dicts in the form ``{row: {col: val}}``.
 
         Parameters
@@ -1860,6 +2001,8 @@ class Matrix(BaseType):
             "rowwise" returns dict of dicts as ``{row: {col: val}}``.
             "columnwise" returns dict of dicts as ``{col: {row: val}}``.
             The default is "rowwise".
+        index : :class:`~graphblas.io.NodeIndex`, optional
+            If given, use the node keys of the rows and columns instead of indices.
 
         See Also
         --------
@@ -1875,6 +2018,9 @@ class Matrix(BaseType):
         else:
             # Names are wrong, but works for logic below
             compressed_rows, indptr, cols, values = self.to_dcsc()
+        if index is not None:
+            compressed_rows = index.take(compressed_rows)
+            cols = index.take(cols)
         # This is pretty fast, but can anybody make it faster? ;)
         cols = cols.tolist()
         values = values.tolist()
@@ -2805,6 +2951,191 @@ class Matrix(BaseType):
             dtype=self.dtype,
         )
 
+    def power_series(self, k, beta=None, op=semiring.plus_times, *, mask=None):
+        """Sum of the powers of a square Matrix: ``A + beta*A^2 + ... + beta^(k-1)*A^k``.
+
+        This is computed with Horner's scheme as ``S = A + S @ (beta * A)`` repeated
+        ``k - 1`` times, which uses one matrix multiply and one accumulation per term.
+        For a graph as an adjacency matrix, the result counts walks up to length ``k``
+        with walks of length ``n`` weighted by ``beta^(n-1)``, as used for Katz-style scores.
+
+        *Note*: This is not a standard GraphBLAS method.
+
+        Parameters
+        ----------
+        k : int
+            The largest power; must be a positive integer.
+        beta : scalar, optional
+            Each additional factor of ``A`` is multiplied by ``beta`` using the
+            multiplication of the semiring.  No scaling is done if not given.
+        op : :class:`~graphblas.core.operator.Semiring`
+            Semiring used in the computation
+        mask : Mask, optional
+            Restrict the result to the elements of the mask, such as a set of candidate
+            pairs.  Intermediate results only include the rows of the mask (unless the
+            mask is complemented), which avoids computing rows that are not needed.
+
+        Returns
+        -------
+        MatrixExpression
+
+        Examples
+        --------
+        .. code-block:: python
+
+            C << A.power_series(3, beta=0.5)
+
+            # Is equivalent to (but more efficient than):
+            C << A
+            for n in range(2, 4):
+                C(binary.plus) << binary.times(A.power(n).new(), 0.5 ** (n - 1))
+        """
+        method_name = "power_series"
+        if self._nrows != self._ncols:
+            raise DimensionMismatch(
+                f"power_series only works for square Matrix; shape is {self.shape}"
+            )
+        if (N := maybe_integral(k)) is None:
+            raise TypeError(f"k must be a positive integer; got bad type: {type(k)}")
+        if N <= 0:
+            raise ValueError(f"k must be a positive integer; got: {N}")
+        if mask is not None:
+            mask = _check_mask(mask)
+        dtype = self.dtype
+        if beta is not None:
+            beta = _as_scalar(beta, is_cscalar=True)
+            dtype = unify(dtype, beta.dtype, is_right_scalar=True)
+        op = get_typed_op(op, dtype, kind="semiring")
+        self._expect_op(op, "Semiring", within=method_name, argname="op")
+        return MatrixExpression(
+            "power_series",
+            None,
+            [self, _power_series, (self, N, beta, op, mask)],  # [*expr_args, func, args]
+            expr_repr=f"{{0.name}}.power_series({N}, op={op})",
+            nrows=self._nrows,
+            ncols=self._ncols,
+            dtype=op.return_type,
+        )
+
+    def closure(self, op=semiring.lor_land, *, max_iter=None, mask=None):
+        """Transitive closure of a square Matrix: sum of all powers until the result is unchanged.
+
+        Computes ``A + A^2 + A^3 + ...`` (where ``+`` is the monoid of the semiring) by
+        iterating until the result stops changing.  For a graph as an adjacency matrix,
+        the default ``lor_land`` semiring computes reachability, and ``min_plus``
+        computes all-pairs shortest path lengths.  The diagonal is not included unless
+        there is a cycle.
+
+        If the monoid of the semiring is idempotent (such as ``lor``, ``min``, and
+        ``max``), then the result is computed by repeated squaring and converges in
+        a logarithmic number of iterations.  Otherwise, such as with ``plus_times``,
+        paths are extended by one edge each iteration, which only converges if the
+        result does (for example, for a directed acyclic graph).
+
+        *Note*: This is not a standard GraphBLAS method.
+
+        Parameters
+        ----------
+        op : :class:`~graphblas.core.operator.Semiring`
+            Semiring used in the computation
+        max_iter : int, optional
+            Stop after this many matrix multiplications even if the result is still
+            changing.  This is needed if the result does not converge, such as
+            ``min_plus`` with negative cycles.  With repeated squaring, ``max_iter=k``
+            includes paths of up to ``2**k`` edges; when extending paths one edge at
+            a time (a non-idempotent monoid or a mask), it includes paths of up to
+            ``k + 1`` edges.
+        mask : Mask, optional
+            Structural or value mask that restricts every intermediate result, which
+            bounds the size of the temporaries.  Paths are extended by one edge at a
+            time, and only paths whose every prefix is in the mask are found.
+            This is exact when the mask selects whole rows, such as to compute what
+            is reachable from a few source nodes.
+
+        Returns
+        -------
+        MatrixExpression
+
+        Examples
+        --------
+        .. code-block:: python
+
+            # Which nodes can reach which nodes?
+            R = A.closure().new()
+
+            # All-pairs shortest path lengths from nodes 0 and 1
+            rows = Matrix(bool, A.nrows, A.ncols)
+            rows[[0, 1], :] << True
+            D = A.closure(semiring.min_plus, mask=rows.S).new()
+        """
+        method_name = "closure"
+        if self._nrows != self._ncols:
+            raise DimensionMismatch(f"closure only works for square Matrix; shape is {self.shape}")
+        if max_iter is not None:
+            if (N := maybe_integral(max_iter)) is None:
+                raise TypeError(
+                    f"max_iter must be a positive integer; got bad type: {type(max_iter)}"
+                )
+            if N <= 0:
+                raise ValueError(f"max_iter must be a positive integer; got: {N}")
+            max_iter = N
+        if mask is not None:
+            mask = _check_mask(mask)
+        op = get_typed_op(op, self.dtype, kind="semiring")
+        self._expect_op(op, "Semiring", within=method_name, argname="op")
+        return MatrixExpression(
+            "closure",
+            None,
+            [self, _closure, (self, op, max_iter, mask)],  # [*expr_args, func, args]
+            expr_repr=f"{{0.name}}.closure(op={op})",
+            nrows=self._nrows,
+            ncols=self._ncols,
+            dtype=op.return_type,
+        )
+
+    def groupby(self, labels, op=monoid.plus, *, axis="rows", ngroups=None, name=None):
+        """Aggregate the rows (or columns) of the Matrix for each group in ``labels``.
+
+        With ``axis="rows"``, ``labels`` has a label for each row, and the result has
+        shape ``(ngroups, ncols)``: element ``[g, j]`` is reduced from the values in
+        column ``j`` of the rows ``i`` where ``labels[i] == g``.  With ``axis="columns"``,
+        ``labels`` has a label for each column, and the result has shape
+        ``(nrows, ngroups)``.  Rows (or columns) without a label are ignored.
+
+        *Note*: This is not a standard GraphBLAS method.  Monoids and most Aggregators are
+        computed with a matrix multiply by an iso-valued indicator Matrix of the groups.
+
+        Parameters
+        ----------
+        labels : Vector or array-like of non-negative ints
+            Group label for each row (or column); missing values in a Vector have no group.
+        op : Monoid, Aggregator, or list of Monoids and Aggregators, default=monoid.plus
+            Reduction operator.  If a list, aggregate with each and return a list.
+        axis : {"rows", "columns"} or {0, 1}, default="rows"
+            Whether ``labels`` groups the rows or the columns.
+        ngroups : int, optional
+            Number of groups.  Default is one more than the largest label.
+        name : str, optional
+            Name of the new Matrix.
+
+        Returns
+        -------
+        Matrix or list of Matrices
+
+        Examples
+        --------
+        .. code-block:: python
+
+            # Sum the edge weights from each community to each node
+            C = A.groupby(community, monoid.plus)
+            count, mean = A.groupby(community, [agg.count, agg.mean], axis="columns")
+        """
+        if axis in (0, 1):
+            axis = "rows" if axis == 0 else "columns"
+        elif not isinstance(axis, str) or axis.lower() not in _GROUPBY_AXES:
+            raise ValueError(f'axis must be "rows" or "columns"; got {axis!r}')
+        return groupby(self, labels, op, axis=axis, ngroups=ngroups, name=name)
+
     ##################################
     # Extract and Assign index methods
     ##################################
@@ -3460,12 +3791,14 @@ class MatrixExpression(BaseExpression):
     _name_html = wrapdoc(Matrix._name_html)(property(automethods._name_html))
     _nvals = wrapdoc(Matrix._nvals)(property(automethods._nvals))
     apply = wrapdoc(Matrix.apply)(property(automethods.apply))
+    closure = wrapdoc(Matrix.closure)(property(automethods.closure))
     diag = wrapdoc(Matrix.diag)(property(automethods.diag))
     ewise_add = wrapdoc(Matrix.ewise_add)(property(automethods.ewise_add))
     ewise_mult = wrapdoc(Matrix.ewise_mult)(property(automethods.ewise_mult))
     ewise_union = wrapdoc(Matrix.ewise_union)(property(automethods.ewise_union))
     gb_obj = wrapdoc(Matrix.gb_obj)(property(automethods.gb_obj))
     get = wrapdoc(Matrix.get)(property(automethods.get))
+    groupby = wrapdoc(Matrix.groupby)(property(automethods.groupby))
     isclose = wrapdoc(Matrix.isclose)(property(automethods.isclose))
     isequal = wrapdoc(Matrix.isequal)(property(automethods.isequal))
     kronecker = wrapdoc(Matrix.kronecker)(property(automethods.kronecker))
@@ -3474,6 +3807,7 @@ class MatrixExpression(BaseExpression):
     name = wrapdoc(Matrix.name)(property(automethods.name)).setter(automethods._set_name)
     nvals = wrapdoc(Matrix.nvals)(property(automethods.nvals))
     power = wrapdoc(Matrix.power)(property(automethods.power))
+    power_series = wrapdoc(Matrix.power_series)(property(automethods.power_series))
     reduce_columnwise = wrapdoc(Matrix.reduce_columnwise)(property(automethods.reduce_columnwise))
     reduce_rowwise = wrapdoc(Matrix.reduce_rowwise)(property(automethods.reduce_rowwise))
     reduce_scalar = wrapdoc(Matrix.reduce_scalar)(property(automethods.reduce_scalar))
@@ -3561,12 +3895,14 @@ class MatrixIndexExpr(AmbiguousAssignOrExtract):
     _name_html = wrapdoc(Matrix._name_html)(property(automethods._name_html))
     _nvals = wrapdoc(Matrix._nvals)(property(automethods._nvals))
     apply = wrapdoc(Matrix.apply)(property(automethods.apply))
+    closure = wrapdoc(Matrix.closure)(property(automethods.closure))
     diag = wrapdoc(Matrix.diag)(property(automethods.diag))
     ewise_add = wrapdoc(Matrix.ewise_add)(property(automethods.ewise_add))
     ewise_mult = wrapdoc(Matrix.ewise_mult)(property(automethods.ewise_mult))
     ewise_union = wrapdoc(Matrix.ewise_union)(property(automethods.ewise_union))
     gb_obj = wrapdoc(Matrix.gb_obj)(property(automethods.gb_obj))
     get = wrapdoc(Matrix.get)(property(automethods.get))
+    groupby = wrapdoc(Matrix.groupby)(property(automethods.groupby))
     isclose = wrapdoc(Matrix.isclose)(property(automethods.isclose))
     isequal = wrapdoc(Matrix.isequal)(property(automethods.isequal))
     kronecker = wrapdoc(Matrix.kronecker)(property(automethods.kronecker))
@@ -3575,6 +3911,7 @@ class MatrixIndexExpr(AmbiguousAssignOrExtract):
     name = wrapdoc(Matrix.name)(property(automethods.name)).setter(automethods._set_name)
     nvals = wrapdoc(Matrix.nvals)(property(automethods.nvals))
     power = wrapdoc(Matrix.power)(property(automethods.power))
+    power_series = wrapdoc(Matrix.power_series)(property(automethods.power_series))
     reduce_columnwise = wrapdoc(Matrix.reduce_columnwise)(property(automethods.reduce_columnwise))
     reduce_rowwise = wrapdoc(Matrix.reduce_rowwise)(property(automethods.reduce_rowwise))
     reduce_scalar = wrapdoc(Matrix.reduce_scalar)(property(automethods.reduce_scalar))
@@ -3661,9 +3998,9 @@ class TransposedMatrix:
         return self._matrix.dtype
 
     @wrapdoc(Matrix.to_coo)
-    def to_coo(self, dtype=None, *, rows=True, columns=True, values=True, sort=True):
+    def to_coo(self, dtype=None, *, rows=True, columns=True, values=True, sort=True, index=None):
         rows, cols, vals = self._matrix.to_coo(
-            dtype, rows=rows, columns=columns, values=values, sort=sort
+            dtype, rows=rows, columns=columns, values=values, sort=sort, index=index
         )
         return cols, rows, vals
 
@@ -3712,9 +4049,9 @@ class TransposedMatrix:
         return rv.swapaxes(0, 1)
 
     @wrapdoc(Matrix.to_dicts)
-    def to_dicts(self, order="rowwise"):
+    def to_dicts(self, order="rowwise", *, index=None):
         order = "columnwise" if get_order(order) == "rowwise" else "rowwise"
-        return self._matrix.to_dicts(order)
+        return self._matrix.to_dicts(order, index=index)
 
     # Properties
     nrows = Matrix.ncols
@@ -3737,6 +4074,9 @@ class TransposedMatrix:
     reduce_scalar = Matrix.reduce_scalar
     reposition = Matrix.reposition
     power = Matrix.power
+    closure = Matrix.closure
+    power_series = Matrix.power_series
+    groupby = Matrix.groupby
 
     # Operator sugar
     __or__ = Matrix.__or__
@@ -4,8 +4,22 @@ from operator import getitem
 import numpy as np
 
 from ... import agg, backend, binary, monoid, semiring, unary
-from ...dtypes import INT64, lookup_dtype
-from .. import _supports_udfs
+from ...dtypes import (
+    BOOL,
+    FP32,
+    FP64,
+    INT8,
+    INT16,
+    INT32,
+    INT64,
+    UINT8,
+    UINT16,
+    UINT32,
+    UINT64,
+    lookup_dtype,
+    register_anonymous,
+)
+from .. import _supports_udfs, workspace
 from ..utils import output_type
 
 
@@ -136,6 +150,38 @@ class Aggregator:
         )
 
 
+# Reducing a Matrix to a Scalar along its storage orientation is only competitive with
+# reducing its values array when the semiring multiply is `first` or `second` (which
+# SuiteSparse:GraphBLAS reduces as fast as a monoid) and each row (or column) has at
+# least this many values on average.  See `scripts/bench_reduce_scalar.py`.
+_VALUES_PER_VECTOR = 64
+
+
+def _plan_matrix_reduce(semiring, A):
+    """Choose how to reduce Matrix ``A`` to a Scalar with a semiring aggregator.
+
+    Returns one of:
+        - "structure": the result depends only on the number of values (such as count)
+        - "values": reduce the (possibly iso) values array as a Vector
+        - "rowwise": reduce each row with ``semiring``, then reduce the result
+        - "columnwise": reduce each column with ``semiring``, then reduce the result
+    """
+    nvals = A._nvals
+    if semiring.binaryop.name == "pair" and semiring.monoid.name in {"plus", "any"}:
+        return "structure"
+    if backend != "suitesparse":
+        return "rowwise" if A._nrows <= A._ncols else "columnwise"
+    if A.ss.is_iso:
+        return "values"
+    orientation = A.ss.orientation
+    nvectors = A._nrows if orientation == "rowwise" else A._ncols
+    if semiring.binaryop.name not in {"first", "second"} or (
+        nvals < _VALUES_PER_VECTOR * min(nvectors, nvals)
+    ):
+        return "values"
+    return orientation
+
+
 class TypedAggregator:
     opclass = "Aggregator"
 
@@ -216,13 +262,13 @@ class TypedAggregator:
                 updater = step1(mask=updater.kwargs.get("mask"), **opts)
             if expr.method_name == "reduce_columnwise":
                 A = A.T
-            size = A._ncols
-            init = expr._new_vector(agg._initdtype, size=size)
-            init(**opts)[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
-            if agg._switch:
-                updater << semiring(init @ A.T)
-            else:
-                updater << semiring(A @ init)
+            with workspace.borrow(
+                expr._new_vector, agg._initdtype, (A._ncols,), agg._initval
+            ) as init:
+                if agg._switch:
+                    updater << semiring(init @ A.T)
+                else:
+                    updater << semiring(A @ init)
             if agg._finalize is not None:
                 orig_updater << agg._finalize[semiring.return_type](step1)
             if in_composite:
@@ -233,12 +279,13 @@ class TypedAggregator:
             if agg._applybegin is not None:
                 v = agg._applybegin(v).new(**opts)
             step1 = expr._new_vector(semiring.return_type, size=1)
-            init = expr._new_matrix(agg._initdtype, nrows=v._size, ncols=1)
-            init(**opts)[...] = agg._initval  # O(1) dense column vector in SuiteSparse 5
-            if agg._switch:
-                step1(**opts) << semiring(init.T @ v)
-            else:
-                step1(**opts) << semiring(v @ init)
+            with workspace.borrow(
+                expr._new_matrix, agg._initdtype, (v._size, 1), agg._initval
+            ) as init:
+                if agg._switch:
+                    step1(**opts) << semiring(init.T @ v)
+                else:
+                    step1(**opts) << semiring(v @ init)
             if agg._finalize is not None:
                 finalize = agg._finalize[semiring.return_type]
                 if step1.dtype == finalize.return_type:
@@ -251,23 +298,54 @@ class TypedAggregator:
         elif expr.cfunc_name.startswith("GrB_Matrix_reduce"):
             # Matrix -> Scalar
             A = expr.args[0]
+            if A._is_transposed:
+                A = A._matrix  # Same values
             if agg._applybegin is not None:
                 A = agg._applybegin(A).new(**opts)
-            # We need to compute in two steps: Matrix -> Vector -> Scalar.
-            # This has not been benchmarked or optimized.
-            # We may be able to intelligently choose the faster path.
-            init1 = expr._new_vector(agg._initdtype, size=A._ncols)
-            init1(**opts)[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
-            step1 = expr._new_vector(semiring.return_type, size=A._nrows)
-            if agg._switch:
-                step1(**opts) << semiring(init1 @ A.T)
-            else:
-                step1(**opts) << semiring(A @ init1)
-            init2 = expr._new_matrix(agg._initdtype, nrows=A._nrows, ncols=1)
-            init2(**opts)[...] = agg._initval  # O(1) dense vector in SuiteSparse 5
             semiring2 = agg._semiring2[semiring.return_type]
             step2 = expr._new_vector(semiring2.return_type, size=1)
-            step2(**opts) << semiring2(step1 @ init2)
+            # Choose the fastest way to reduce; an empty Matrix gives an empty Scalar
+            path = _plan_matrix_reduce(semiring, A) if A._nvals > 0 else None
+            if path == "structure":
+                # count or exists
+                step2[0] = A._nvals if semiring.monoid.name == "plus" else 1
+            elif path == "values":
+                from ..vector import Vector
+
+                if A.ss.is_iso:
+                    # O(1) dense iso Vector in SuiteSparse:GraphBLAS
+                    values = Vector(A.dtype, size=A._nvals)
+                    values[:] = A.ss.iso_value
+                else:
+                    values = A.to_coo(rows=False, columns=False, sort=False)[2]
+                    values = Vector.ss.import_full(values, dtype=A.dtype, take_ownership=True)
+                binop = semiring.binaryop
+                if agg._switch:
+                    expr2 = values.apply(binop, left=agg._initval)
+                else:
+                    expr2 = values.apply(binop, right=agg._initval)
+                if values.dtype == binop.return_type:
+                    values(**opts) << expr2
+                else:
+                    values = expr2.new(**opts)
+                step2[0] = values.reduce(semiring.monoid).new(**opts)
+            elif path is not None:
+                # Matrix -> Vector -> Scalar
+                B = A if path == "rowwise" else A.T
+                with (
+                    workspace.borrow(
+                        expr._new_vector, agg._initdtype, (B._ncols,), agg._initval
+                    ) as init1,
+                    workspace.borrow(expr._new_vector, semiring.return_type, (B._nrows,)) as step1,
+                    workspace.borrow(
+                        expr._new_matrix, agg._initdtype, (B._nrows, 1), agg._initval
+                    ) as init2,
+                ):
+                    if agg._switch:
+                        step1(**opts) << semiring(init1 @ B.T)
+                    else:
+                        step1(**opts) << semiring(B @ init1)
+                    step2(**opts) << semiring2(step1 @ init2)
             if agg._finalize is not None:
                 finalize = agg._finalize[semiring2.return_type]
                 if step2.dtype == finalize.return_type:
@@ -495,9 +573,8 @@ def _argminmaxij(
 
             masked = semiring.any_eq(D @ A).new(**opts)
             masked(mask=masked.V, replace=True, **opts) << masked  # Could use select
-            init = expr._new_vector(bool, size=A._ncols)
-            init(**opts)[...] = False  # O(1) dense vector in SuiteSparse 5
-            updater << row_semiring(masked @ init)
+            with workspace.borrow(expr._new_vector, bool, (A._ncols,), False) as init:
+                updater << row_semiring(masked @ init)
             if in_composite:
                 return updater.parent
         else:
@@ -507,9 +584,8 @@ def _argminmaxij(
 
             masked = semiring.any_eq(A @ D).new(**opts)
             masked(mask=masked.V, replace=True, **opts) << masked  # Could use select
-            init = expr._new_vector(bool, size=A._nrows)
-            init(**opts)[...] = False  # O(1) dense vector in SuiteSparse 5
-            updater << col_semiring(init @ masked)
+            with workspace.borrow(expr._new_vector, bool, (A._nrows,), False) as init:
+                updater << col_semiring(init @ masked)
             if in_composite:
                 return updater.parent
     elif expr.cfunc_name.startswith("GrB_Vector_reduce"):
@@ -517,9 +593,8 @@ def _argminmaxij(
         step1 = v.reduce(monoid, allow_empty=False).new(**opts)
         masked = binary.eq(v, step1).new(**opts)
         masked(mask=masked.V, replace=True, **opts) << masked  # Could use select
-        init = expr._new_matrix(bool, nrows=v._size, ncols=1)
-        init(**opts)[...] = False  # O(1) dense column vector in SuiteSparse 5
-        step2 = col_semiring(masked @ init).new(**opts)
+        with workspace.borrow(expr._new_matrix, bool, (v._size, 1), False) as init:
+            step2 = col_semiring(masked @ init).new(**opts)
         if in_composite:
             return step2
         updater << step2[0]
@@ -584,9 +659,8 @@ def _first_last(agg, updater, expr, opts, *, in_composite, semiring_):
         A = expr.args[0]
         if expr.method_name == "reduce_columnwise":
             A = A.T
-        init = expr._new_vector(bool, size=A._ncols)
-        init(**opts)[...] = False  # O(1) dense vector in SuiteSparse 5
-        step1 = semiring_(A @ init).new(**opts)
+        with workspace.borrow(expr._new_vector, bool, (A._ncols,), False) as init:
+            step1 = semiring_(A @ init).new(**opts)
         Is, Js = step1.to_coo()
 
         Matrix_ = type(expr._new_matrix(bool))
@@ -599,9 +673,8 @@ def _first_last(agg, updater, expr, opts, *, in_composite, semiring_):
             return updater.parent
     elif expr.cfunc_name.startswith("GrB_Vector_reduce"):
         v = expr.args[0]
-        init = expr._new_matrix(bool, nrows=v._size, ncols=1)
-        init(**opts)[...] = False  # O(1) dense matrix in SuiteSparse 5
-        step1 = semiring_(v @ init).new(**opts)
+        with workspace.borrow(expr._new_matrix, bool, (v._size, 1), False) as init:
+            step1 = semiring_(v @ init).new(**opts)
         index = step1[0].new().value
         # `==` instead of `is` automatically triggers index.compute() in dask-graphblas:
         if index == None:  # noqa: E711
@@ -611,12 +684,10 @@ def _first_last(agg, updater, expr, opts, *, in_composite, semiring_):
         updater << v[index]
     else:  # GrB_Matrix_reduce
         A = expr.args[0]
-        init1 = expr._new_matrix(bool, nrows=A._ncols, ncols=1)
-        init1(**opts)[...] = False  # O(1) dense matrix in SuiteSparse 5
-        step1 = semiring_(A @ init1).new(**opts)
-        init2 = expr._new_vector(bool, size=A._nrows)
-        init2(**opts)[...] = False  # O(1) dense vector in SuiteSparse 5
-        step2 = semiring_(step1.T @ init2).new(**opts)
+        with workspace.borrow(expr._new_matrix, bool, (A._ncols, 1), False) as init1:
+            step1 = semiring_(A @ init1).new(**opts)
+        with workspace.borrow(expr._new_vector, bool, (A._nrows,), False) as init2:
+            step2 = semiring_(step1.T @ init2).new(**opts)
         i = step2[0].new().value
         # `==` instead of `is` automatically triggers i.compute() in dask-graphblas:
         if i == None:  # noqa: E711
@@ -647,17 +718,14 @@ def _first_last_index(agg, updater, expr, opts, *, in_composite, semiring):
         A = expr.args[0]
         if expr.method_name == "reduce_columnwise":
             A = A.T
-        init = expr._new_vector(bool, size=A._ncols)
-        init(**opts)[...] = False  # O(1) dense vector in SuiteSparse 5
-        expr = semiring(A @ init)
-        updater << expr
+        with workspace.borrow(expr._new_vector, bool, (A._ncols,), False) as init:
+            updater << semiring(A @ init)
         if in_composite:
             return updater.parent
     elif expr.cfunc_name.startswith("GrB_Vector_reduce"):
         v = expr.args[0]
-        init = expr._new_matrix(bool, nrows=v._size, ncols=1)
-        init(**opts)[...] = False  # O(1) dense matrix in SuiteSparse 5
-        step1 = semiring(v @ init).new(**opts)
+        with workspace.borrow(expr._new_matrix, bool, (v._size, 1), False) as init:
+            step1 = semiring(v @ init).new(**opts)
         if in_composite:
             return step1
         updater << step1[0]
@@ -679,6 +747,98 @@ _last_index = Aggregator(
     types=[semiring._deprecated["min_secondi"]],
     any_dtype=INT64,
 )
+
+
+class _DescribeTypes:
+    """The record dtype returned by ``agg.describe`` for each input dtype."""
+
+    _fields = ("count", "sum", "sum_of_squares", "min", "max", "first", "last")
+
+    def __init__(self):
+        self._types = None
+
+    @property
+    def types(self):
+        if self._types is None:
+            self._types = {}
+            for dtype in [BOOL, INT8, INT16, INT32, INT64, UINT8, UINT16, UINT32, UINT64]:
+                sum_dtype = UINT64 if dtype.name.startswith("UINT") else INT64
+                self._types[dtype] = self._record(dtype, sum_dtype)
+            for dtype in [FP32, FP64]:
+                self._types[dtype] = self._record(dtype, FP64)
+        return self._types
+
+    @staticmethod
+    def _record(dtype, sum_dtype):
+        fields = [
+            ("count", INT64.np_type),
+            ("sum", sum_dtype.np_type),
+            ("sum_of_squares", sum_dtype.np_type),
+        ]
+        fields.extend((name, dtype.np_type) for name in ["min", "max", "first", "last"])
+        # Not aligned, so the dtype is short enough to be the name of the UDT
+        return register_anonymous(np.dtype(fields))
+
+
+def _describe_segments(indptr, values, return_type):
+    """Compute all statistics for each non-empty segment ``values[indptr[i]:indptr[i+1]]``.
+
+    The values are extracted from GraphBLAS once, and every statistic is computed from them.
+    """
+    indptr = indptr.astype(np.intp, copy=False)
+    nonempty = np.flatnonzero(np.diff(indptr))
+    rv = np.empty(nonempty.size, return_type.np_type)
+    if nonempty.size == 0:
+        return nonempty, rv
+    starts = indptr[nonempty]
+    ends = indptr[nonempty + 1]
+    rv["count"] = ends - starts
+    wide = values.astype(rv.dtype["sum"], copy=False)
+    rv["sum"] = np.add.reduceat(wide, starts)
+    rv["sum_of_squares"] = np.add.reduceat(wide * wide, starts)
+    # fmin and fmax ignore NaN like the min and max monoids
+    rv["min"] = np.fmin.reduceat(values, starts)
+    rv["max"] = np.fmax.reduceat(values, starts)
+    rv["first"] = values[starts]
+    rv["last"] = values[ends - 1]
+    return nonempty, rv
+
+
+def _describe(agg, updater, expr, opts, *, in_composite):
+    from ..scalar import Scalar
+    from ..vector import Vector
+
+    return_type = agg.return_type
+    if expr.cfunc_name == "GrB_Matrix_reduce_Aggregator":
+        A = expr.args[0]
+        if expr.method_name == "reduce_rowwise":
+            indptr, _, values = A.to_csr(agg.type)
+            size = A._nrows
+        else:
+            indptr, _, values = A.to_csc(agg.type)
+            size = A._ncols
+        indices, records = _describe_segments(indptr, values, return_type)
+        updater << Vector.from_coo(indices, records, return_type, size=size)
+        if in_composite:
+            return updater.parent
+        return
+    if expr.cfunc_name.startswith("GrB_Vector_reduce"):
+        _, values = expr.args[0].to_coo(agg.type, indices=False)
+    elif expr.cfunc_name.startswith("GrB_Matrix_reduce"):
+        # Row-major order, so "first" and "last" match `agg.ss.first` and `agg.ss.last`
+        _, _, values = expr.args[0].to_csr(agg.type)
+    else:  # pragma: no cover (sanity)
+        raise NotImplementedError(f"{agg.name} with {expr.cfunc_name}")
+    _, records = _describe_segments(np.array([0, values.size]), values, return_type)
+    result = Vector.from_coo(np.arange(records.size), records, return_type, size=1)
+    if in_composite:
+        return result
+    updater << (result[0] if records.size else Scalar(return_type))
+
+
+agg.describe = Aggregator("describe", custom=_describe, types=[_DescribeTypes()])
+
+
 agg._deprecated = {
     "argmin": _argmin,
     "argmax": _argmax,
@@ -0,0 +1,356 @@
+"""Trace functions of GraphBLAS operations once and replay the C calls for new inputs."""
+
+from time import perf_counter
+from weakref import ref as weakref
+
+from ..exceptions import NoValue, check_status
+from . import base, ffi
+from .base import BaseExpression, BaseType, _profiler, _recorder
+from .mask import Mask
+from .profiler import _shape
+from .recorder import Recorder
+from .utils import _Pointer, libget, output_type
+
+ffi_new = ffi.new
+
+
+def prepare(func):
+    """Prepare a function of GraphBLAS operations to be called repeatedly with little overhead.
+
+    The first time the prepared function is called with inputs of a given type, dtype,
+    and shape, ``func`` is run normally while its GraphBLAS calls are traced.  The typed
+    operators, descriptors, and C function names resolved while tracing are then reused,
+    so later calls with inputs of the same kind only make the same sequence of C calls
+    with the new inputs substituted in.
+
+    ``func`` should take Vector, Matrix, and Scalar objects as positional arguments and
+    return a Vector, Matrix, Scalar, expression, or a tuple of these (expressions are
+    computed with ``.new()``).  Because only the GraphBLAS calls are replayed, Python
+    control flow in ``func`` that depends on the values of the inputs (such as ``nvals``)
+    is fixed by the first call, as are values copied in Python such as C scalars
+    (``is_cscalar=True``).  Other Python arguments are part of the cache key, so ``func``
+    is traced again for each distinct value.
+
+    Parameters
+    ----------
+    func : callable
+        Function to prepare.  May also be used as a decorator.
+
+    Returns
+    -------
+    PreparedFunction
+
+    Examples
+    --------
+    >>> @gb.prepare
+    ... def masked_mxm(A, B, M):
+    ...     return A.mxm(B, semiring.min_plus).new(mask=M.S)
+    >>> C = masked_mxm(A, B, M)  # traced
+    >>> C = masked_mxm(A2, B2, M2)  # replayed
+    """
+    return PreparedFunction(func)
+
+
+class PreparedFunction:
+    """A function prepared with :func:`prepare`."""
+
+    __slots__ = "func", "_traces", "__weakref__"
+
+    def __init__(self, func):
+        self.func = func
+        self._traces = {}
+
+    def __call__(self, *args):
+        key = tuple(_signature(i, arg, args) for i, arg in enumerate(args))
+        trace = self._traces.get(key)
+        if trace is None:
+            trace, result = _trace_function(self.func, args)
+            self._traces[key] = trace
+            return result
+        return trace.run_function(args)
+
+    def clear(self):
+        """Remove all cached traces, so the function is traced again on the next call."""
+        self._traces.clear()
+
+    def __repr__(self):
+        return f"<PreparedFunction {getattr(self.func, '__name__', self.func)!r}>"
+
+
+def _signature(i, arg, args):
+    if isinstance(arg, BaseType):
+        # Include which argument was first passed as this object to handle aliasing
+        first = next(j for j, other in enumerate(args) if other is arg)
+        if arg._is_scalar:
+            return type(arg), arg.dtype, arg._is_cscalar, first
+        return type(arg), arg.dtype, arg.shape, first
+    if isinstance(arg, (BaseExpression, Mask)) or output_type(arg).__name__ in {
+        "Vector",
+        "Matrix",
+        "TransposedMatrix",
+    }:
+        raise TypeError(
+            f"Bad type for argument {i} of prepared function: {type(arg).__name__}.  "
+            "Use Vector, Matrix, or Scalar objects (expressions should be computed first)."
+        )
+    try:
+        hash(arg)
+    except TypeError:
+        raise TypeError(
+            f"Bad type for argument {i} of prepared function: {type(arg).__name__}.  "
+            "Python arguments are part of the cache key, so they must be hashable "
+            "(for example, use a tuple instead of a list)."
+        ) from None
+    return type(arg), arg
+
+
+class _Tracer(Recorder):
+    __slots__ = ("trace",)
+
+    def __init__(self, trace):
+        self.trace = trace
+        super().__init__()
+
+    def record(self, cfunc_name, args, *, exc=None):
+        if exc is None:
+            self.trace.add(cfunc_name, args)
+        if self._prev_recorder is not None:
+            self._prev_recorder.record(cfunc_name, args, exc=exc)
+
+    def record_raw(self, text):
+        if self._prev_recorder is not None:
+            self._prev_recorder.record_raw(text)
+
+
+def _factory(obj):
+    """Return a function that creates a new, uninitialized object like ``obj``.
+
+    This is called right after ``obj`` was created in C, so it may not be fully constructed.
+    """
+    cls = type(obj)
+    dtype = obj.dtype
+    name = obj.name
+    if obj._is_scalar and obj._is_cscalar:
+        return lambda: cls(dtype, is_cscalar=True, name=name)
+    ctype = ffi.typeof(obj.gb_obj)
+    if obj._is_scalar:
+        return lambda: cls._from_obj(ffi_new(ctype), dtype, is_cscalar=False, name=name)
+    if obj.ndim == 1:
+        (size,) = _shape(obj)
+        return lambda: cls._from_obj(ffi_new(ctype), dtype, size, name=name)
+    nrows, ncols = _shape(obj)
+    return lambda: cls._from_obj(ffi_new(ctype), dtype, nrows, ncols, name=name)
+
+
+def _trace_function(func, args):
+    trace = _Trace(args)
+    with _Tracer(trace):
+        result = func(*args)
+        is_tuple = type(result) is tuple
+        results = list(result) if is_tuple else [result]
+        for i, val in enumerate(results):
+            if isinstance(val, BaseExpression) or output_type(val).__name__ in {
+                "Vector",
+                "Matrix",
+                "Scalar",
+            }:
+                if not isinstance(val, BaseType):
+                    results[i] = val = val.new()
+            elif val is not None:
+                raise TypeError(
+                    "Prepared functions must return Vector, Matrix, or Scalar objects "
+                    f"(or a tuple of them); got {type(val).__name__}"
+                )
+    trace.is_tuple = is_tuple
+    trace.outputs = []
+    for val in results:
+        if val is None:
+            trace.outputs.append((None, None))
+        elif (slot := trace.get_slot(val)) is not None:
+            trace.outputs.append((slot, None))
+        elif val._is_scalar and val._is_cscalar:
+            raise TypeError(
+                "Prepared functions may not return C scalars whose values are set in Python; "
+                "use `is_cscalar=False` to return a GrB_Scalar instead"
+            )
+        else:
+            # Not created or passed in, so must have been captured by the function
+            trace.outputs.append((None, val))
+    trace.finish({slot for slot, _ in trace.outputs if slot is not None})
+    return trace, (tuple(results) if is_tuple else results[0])
+
+
+class _Trace:
+    """The C calls made by a function, with inputs and new objects as numbered slots.
+
+    If ``args`` is None, objects that weren't created while tracing are added as inputs.
+    """
+
+    __slots__ = (
+        "steps",
+        "nslots",
+        "inputs",
+        "names",
+        "outputs",
+        "is_tuple",
+        "_slots",
+        "_last_use",
+        "_new_inputs",
+        "_compiled",
+    )
+
+    def __init__(self, args=None):
+        self.steps = []
+        self.inputs = []  # (slot, weakref, signature) for inputs found while tracing
+        self.names = []  # name of the traced object in each slot
+        self.outputs = []
+        self.is_tuple = False
+        self._slots = {}  # id(obj) -> (slot, weakref)
+        self._last_use = {}
+        self._new_inputs = args is None
+        self._compiled = None
+        if args is not None:
+            for i, arg in enumerate(args):
+                self.names.append(getattr(arg, "name", None))
+                if isinstance(arg, BaseType) and id(arg) not in self._slots:
+                    self._slots[id(arg)] = (i, weakref(arg))
+        self.nslots = len(self.names)
+
+    def get_slot(self, obj):
+        item = self._slots.get(id(obj))
+        if item is not None and item[1]() is obj:
+            return item[0]
+        return None
+
+    def _new_slot(self, obj):
+        slot = self.nslots
+        self.nslots += 1
+        self._slots[id(obj)] = (slot, weakref(obj))
+        self.names.append(obj.name)
+        return slot
+
+    def add(self, cfunc_name, call_args):
+        """Add a call made with Python objects, which are replaced by slots."""
+        cargs = []
+        pyargs = list(call_args)
+        refs = []
+        create = written = None
+        for pos, arg in enumerate(call_args):
+            is_pointer = type(arg) is _Pointer
+            obj = arg.val if is_pointer else arg
+            if isinstance(obj, Mask):
+                obj = obj.parent
+            cargs.append(None)
+            if not isinstance(obj, BaseType):
+                cargs[pos] = getattr(arg, "_carg", arg) if arg is not None else base.NULL
+                continue
+            slot = self.get_slot(obj)
+            ctype = None
+            if slot is None:
+                parent = getattr(obj, "_parent", None)
+                if parent is not None and (slot := self.get_slot(parent)) is not None:
+                    # A cast of another object, such as ``Scalar._as_vector()``
+                    ctype = ffi.typeof(obj.gb_obj)
+                elif is_pointer and pos == 0:
+                    slot = self._new_slot(obj)
+                    create = (slot, _factory(obj))
+                elif self._new_inputs and not (obj._is_scalar and obj._is_cscalar):
+                    slot = self._new_slot(obj)
+                    self.inputs.append((slot, weakref(obj), _signature(0, obj, [obj])))
+                else:
+                    cargs[pos] = arg._carg
+                    continue
+            if is_pointer and obj._is_scalar and obj._is_cscalar:
+                written = slot
+            refs.append((pos, slot, ctype, is_pointer))
+            pyargs[pos] = None
+            self._last_use[slot] = len(self.steps)
+        self.steps.append(
+            (
+                libget(cfunc_name),
+                cfunc_name,
+                tuple(cargs),
+                tuple(pyargs),
+                tuple(refs),
+                create,
+                written,
+            )
+        )
+        self._compiled = None
+
+    def finish(self, keep=()):
+        """Prepare to run, and release new objects after their last use unless in ``keep``."""
+        ninputs = len(self.names) if not self._new_inputs else 0
+        input_slots = {slot for slot, _, _ in self.inputs}
+        releases = {}
+        for slot, step in self._last_use.items():
+            if slot >= ninputs and slot not in input_slots and slot not in keep:
+                releases.setdefault(step, []).append(slot)
+        self._compiled = [(*step, tuple(releases.get(i, ()))) for i, step in enumerate(self.steps)]
+
+    def run_function(self, args):
+        objs = [*args, *([None] * (self.nslots - len(args)))]
+        self.run(objs)
+        rv = [val if slot is None else objs[slot] for slot, val in self.outputs]
+        return tuple(rv) if self.is_tuple else rv[0]
+
+    def run(self, objs, times=None):
+        """Make the C calls using the objects in ``objs``, which is updated with new objects.
+
+        If ``times`` is a list, the wall time of each call is appended to it.
+        """
+        rec = _recorder.get(base._prev_recorder)
+        prof = _profiler.get(base._prev_profiler)
+        timed = prof is not None or times is not None
+        for cfunc, cfunc_name, cargs, pyargs, refs, create, written, release in self._compiled:
+            if create is not None:
+                objs[create[0]] = create[1]()
+            if refs:
+                cargs = list(cargs)
+                for pos, slot, ctype, is_pointer in refs:
+                    obj = objs[slot]
+                    if ctype is not None:
+                        ptr = ffi.cast(ctype, obj.gb_obj)
+                        cargs[pos] = ptr if is_pointer else ptr[0]
+                    elif is_pointer:
+                        cargs[pos] = obj.gb_obj
+                    else:
+                        cargs[pos] = obj._carg
+            if not timed:
+                err_code = cfunc(*cargs)
+            else:
+                if prof is not None:
+                    call_args = _call_args(pyargs, refs, objs)
+                    inputs = prof._describe_inputs(call_args)
+                start = perf_counter()
+                err_code = cfunc(*cargs)
+                stop = perf_counter()
+                if times is not None:
+                    times.append(stop - start)
+            if err_code or rec is not None:
+                if prof is None:
+                    call_args = _call_args(pyargs, refs, objs)
+                try:
+                    rv = check_status(err_code, call_args)
+                except Exception as exc:
+                    if rec is not None:
+                        rec.record(cfunc_name, call_args, exc=exc)
+                    raise
+                if rec is not None:
+                    rec.record(cfunc_name, call_args)
+            else:
+                rv = None
+            if prof is not None:
+                prof.record(cfunc_name, call_args, start, stop, inputs)
+            if written is not None and rv is not NoValue:
+                objs[written]._empty = False
+            for slot in release:
+                objs[slot] = None
+
+
+def _call_args(pyargs, refs, objs):
+    """The objects for a call, which are only needed for recording and errors."""
+    call_args = list(pyargs)
+    for pos, slot, _, is_pointer in refs:
+        call_args[pos] = _Pointer(objs[slot]) if is_pointer else objs[slot]
+    return call_args
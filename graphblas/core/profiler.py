@@ -0,0 +1,285 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+from .. import backend
+from ..exceptions import check_status
+from . import base, ffi, lib
+from .base import BaseType, _profiler
+from .mask import Mask
+from .utils import _Pointer
+
+ffi_new = ffi.new
+_package_dir = f"{Path(__file__).parent.parent}{os.sep}"
+_tests_dir = f"{_package_dir}tests{os.sep}"
+
+
+def _callsite():
+    """The first frame outside of graphblas as ``"filename:lineno (function)"``."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_package_dir) or filename.startswith(_tests_dir):
+            return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return None  # pragma: no cover (safety)
+
+
+def _shape(obj):
+    # Use the C API, because the output of e.g. ``GrB_Matrix_new`` isn't fully constructed
+    if obj._is_scalar:
+        return ()
+    n = ffi_new("GrB_Index*")
+    if obj.ndim == 1:
+        check_status(lib.GrB_Vector_size(n, obj._carg), obj)
+        return (n[0],)
+    check_status(lib.GrB_Matrix_nrows(n, obj._carg), obj)
+    nrows = n[0]
+    check_status(lib.GrB_Matrix_ncols(n, obj._carg), obj)
+    return (nrows, n[0])
+
+
+def _describe(obj):
+    """Information about a Vector, Matrix, or Scalar that doesn't record calls."""
+    info = {
+        "name": obj.name,
+        "type": type(obj).__name__,
+        "dtype": obj.dtype.name,
+        "shape": _shape(obj),
+        "nvals": obj._nvals,
+    }
+    if backend == "suitesparse" and (ss := getattr(obj, "ss", None)) is not None:
+        info["format"] = ss.format
+    return info
+
+
+def _chrome_trace(events, path):
+    rv = {"traceEvents": events, "displayTimeUnit": "ms"}
+    if path is not None:
+        with Path(path).open("w") as f:
+            json.dump(rv, f)
+    return rv
+
+
+class ProfileRecord:
+    """Information about a single GraphBLAS call made while profiling.
+
+    Attributes
+    ----------
+    cfunc_name : str
+        Name of the C function that was called.
+    start : float
+        Start time in seconds from ``time.perf_counter``.
+    duration : float
+        Wall time of the C call in seconds.
+    thread_id : int
+        Identifier of the thread that made the call.
+    callsite : str or None
+        The first location outside of graphblas as ``"filename:lineno (function)"``.
+    output : dict or None
+        The name, type, dtype, shape, nvals, and (for SuiteSparse) format of the
+        output after the call.  This is None if ``details=False``.
+    inputs : list of dict
+        The same information for the other arguments before the call.
+    """
+
+    __slots__ = "cfunc_name", "start", "duration", "thread_id", "callsite", "output", "inputs"
+
+    def __init__(self, cfunc_name, start, duration, thread_id, callsite, output, inputs):
+        self.cfunc_name = cfunc_name
+        self.start = start
+        self.duration = duration
+        self.thread_id = thread_id
+        self.callsite = callsite
+        self.output = output
+        self.inputs = inputs
+
+    def __repr__(self):
+        return (
+            f"ProfileRecord({self.cfunc_name}, duration={self.duration:.3g}, "
+            f"callsite={self.callsite!r})"
+        )
+
+
+class Profiler:
+    """Profile GraphBLAS C calls.
+
+    Each call records the C function name, wall time, the Python call site, and (if
+    ``details`` is True) the name, dtype, shape, nvals, and storage format of its inputs
+    and output.  The profiler can use ``.start()`` and ``.stop()`` to enable/disable
+    profiling, or it can be used as a context manager.
+
+    For example,
+
+    >>> with Profiler() as prof:
+    ...     C = A.mxm(B).new()
+    >>> prof.summary()  # time by cfunc_name
+    >>> prof.summary(by="callsite")
+    >>> prof.to_chrome_trace("trace.json")  # view with Perfetto or chrome://tracing
+
+    Getting nvals may finish pending work when GraphBLAS is non-blocking, so use
+    ``details=False`` to only measure time.  Only one profiler will profile at a time.
+
+    Parameters
+    ----------
+    start : bool, default=True
+        Whether to start profiling immediately.
+    details : bool, default=True
+        Whether to record information about the inputs and output of each call.
+    """
+
+    __slots__ = "records", "details", "_token", "_prev_profiler", "__weakref__"
+    # Whether profilers started later should still forward calls to this one
+    _chained = False
+
+    def __init__(self, *, start=True, details=True):
+        self.records = []
+        self.details = details
+        self._token = None
+        self._prev_profiler = None
+        if start:
+            self.start()
+
+    def _describe_inputs(self, args):
+        if self._prev_profiler is not None and self._prev_profiler._chained:
+            self._prev_profiler._describe_inputs(args)
+        if not self.details:
+            return None
+        return [
+            _describe(arg.parent if isinstance(arg, Mask) else arg)
+            for arg in args[1:]
+            if isinstance(arg, (BaseType, Mask))
+        ]
+
+    def record(self, cfunc_name, args, start, stop, inputs):
+        if self._prev_profiler is not None and self._prev_profiler._chained:
+            self._prev_profiler.record(cfunc_name, args, start, stop, None)
+        if self.details:
+            output = args[0] if args else None
+            if type(output) is _Pointer:
+                output = output.val
+            output = _describe(output) if isinstance(output, BaseType) else None
+        else:
+            output = None
+        self.records.append(
+            ProfileRecord(
+                cfunc_name,
+                start,
+                stop - start,
+                threading.get_ident(),
+                _callsite(),
+                output,
+                inputs if inputs is not None else [],
+            )
+        )
+
+    def start(self):
+        if self._token is None:
+            self._prev_profiler = _profiler.get(base._prev_profiler)
+            self._token = _profiler.set(self)
+        base._prev_profiler = self
+
+    def stop(self):
+        if self._token is not None:
+            _profiler.reset(self._token)
+            self._token = None
+        if base._prev_profiler is self or base._prev_profiler is None:
+            base._prev_profiler = _profiler.get(self._prev_profiler)
+        self._prev_profiler = None
+
+    def clear(self):
+        self.records.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.stop()
+
+    def __iter__(self):
+        yield from self.records
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def is_profiling(self):
+        return self._token is not None and _profiler.get(base._prev_profiler) is self
+
+    @property
+    def total_time(self):
+        """Total wall time in seconds of all recorded calls."""
+        return sum(record.duration for record in self.records)
+
+    def summary(self, by="cfunc_name"):
+        """Aggregate the wall time of calls into a pandas DataFrame.
+
+        Parameters
+        ----------
+        by : {"cfunc_name", "callsite"}
+            Attribute of the records to group by.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The count, total, mean, and max time in seconds, sorted by total time.
+        """
+        import pandas as pd
+
+        if by not in {"cfunc_name", "callsite"}:
+            raise ValueError(f'`by` argument must be "cfunc_name" or "callsite"; got {by!r}')
+        df = pd.DataFrame(
+            {
+                by: [getattr(record, by) for record in self.records],
+                "time": [record.duration for record in self.records],
+            }
+        )
+        rv = df.groupby(by)["time"].agg(["count", "sum", "mean", "max"])
+        rv = rv.rename(columns={"sum": "total"})
+        return rv.sort_values("total", ascending=False)
+
+    def to_chrome_trace(self, path=None):
+        """Convert the records to the Chrome Trace Event format.
+
+        The trace can be viewed with Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+        Parameters
+        ----------
+        path : str or Path, optional
+            If given, write the trace to this file as JSON.
+
+        Returns
+        -------
+        dict
+        """
+        pid = os.getpid()
+        t0 = min((record.start for record in self.records), default=0)
+        events = []
+        for record in self.records:
+            args = {"callsite": record.callsite}
+            if record.output is not None:
+                args["output"] = record.output
+            if record.inputs:
+                args["inputs"] = record.inputs
+            events.append(
+                {
+                    "name": record.cfunc_name,
+                    "cat": "graphblas",
+                    "ph": "X",
+                    "ts": (record.start - t0) * 1e6,
+                    "dur": record.duration * 1e6,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": args,
+                }
+            )
+        return _chrome_trace(events, path)
+
+    def __repr__(self):
+        lines = [f'gb.Profiler ({"" if self.is_profiling else "not "}profiling)']
+        lines.append("-" * len(lines[0]))
+        lines.append(f"  {len(self.records)} calls in {self.total_time:.6g} seconds")
+        return "\n".join(lines)
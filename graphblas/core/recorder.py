@@ -2,7 +2,7 @@ import collections
 
 from ..dtypes import DataType
 from . import base, lib
-from .base import _recorder
+from .base import BaseType, _recorder
 from .mask import Mask
 from .matrix import TransposedMatrix
 from .operator import TypedOpBase
@@ -45,19 +45,25 @@ class Recorder:
     'GrB_mxm(C, NULL, NULL, GrB_PLUS_TIMES_SEMIRING_INT64, A, B, NULL)'
 
     Currently, only one recorder will record at a time within a context.
+
+    Use ``trace=True`` to also record the calls in a structured form that can be
+    replayed with new inputs using :meth:`replay`.
     """
 
-    __slots__ = "data", "_token", "max_rows", "_prev_recorder", "__weakref__"
+    __slots__ = "data", "_token", "max_rows", "_prev_recorder", "_trace", "__weakref__"
 
-    def __init__(self, *, start=True, max_rows=20):
+    def __init__(self, *, start=True, max_rows=20, trace=False):
         self.data = []
         self._token = None
         self._prev_recorder = None
         self.max_rows = max_rows
+        self._trace = _new_trace() if trace else None
         if start:
             self.start()
 
     def record(self, cfunc_name, args, *, exc=None):
+        if self._trace is not None and exc is None:
+            self._trace.add(cfunc_name, args)
         if not hasattr(lib, cfunc_name):
             cfunc_name = f"GxB_{cfunc_name[4:]}"
         val = f'{cfunc_name}({", ".join(gbstr(x) for x in args)});'
@@ -86,6 +92,104 @@ class Recorder:
 
     def clear(self):
         self.data.clear()
+        if self._trace is not None:
+            self._trace = _new_trace()
+
+    @property
+    def trace(self):
+        """The recorded calls in a structured form (requires ``trace=True``).
+
+        This is a list of ``(cfunc_name, args)`` tuples.  Arguments that are Vector,
+        Matrix, or Scalar objects are dicts with the ``"slot"`` number that identifies
+        the object, its ``"name"``, whether it is an ``"input"`` (i.e., it was not created
+        while recording), and whether it is passed as a ``"pointer"``.  Other arguments,
+        such as operators and descriptors, are given by their names in the C API.
+        """
+        trace = self._check_trace()
+        input_slots = {slot for slot, _, _ in trace.inputs}
+        rv = []
+        for _, cfunc_name, _, pyargs, refs, _, _ in trace.steps:
+            args = [gbstr(arg) for arg in pyargs]
+            for pos, slot, _, is_pointer in refs:
+                args[pos] = {
+                    "slot": slot,
+                    "name": trace.names[slot],
+                    "input": slot in input_slots,
+                    "pointer": is_pointer,
+                }
+            rv.append((cfunc_name, args))
+        return rv
+
+    def replay(self, inputs=None, *, outputs=None, **kwargs):
+        """Replay the recorded calls, optionally with new inputs, and time each call.
+
+        This requires the Recorder to be created with ``trace=True`` and to not be recording.
+        Objects that were used but not created while recording are inputs.  New objects are
+        created for all objects that were created while recording.
+
+        Parameters
+        ----------
+        inputs : dict, optional
+            Map the names of inputs to new objects of the same type, dtype, and shape.
+            Inputs that are not given are the original objects, which may be updated.
+        outputs : list of str, optional
+            Names of the new objects to return.  Other new objects are freed after their
+            last use.  By default, all new objects are returned.
+        **kwargs :
+            Inputs given as keyword arguments.
+
+        Returns
+        -------
+        Replay
+        """
+        from .prepare import _signature
+
+        trace = self._check_trace()
+        if self.is_recording:
+            raise RuntimeError("Recorder may not replay calls while recording")
+        inputs = dict(inputs or {}, **kwargs)
+        objs = [None] * trace.nslots
+        input_slots = {}
+        for slot, orig_ref, signature in trace.inputs:
+            name = trace.names[slot]
+            if name in inputs:
+                if name in input_slots:
+                    raise ValueError(f"Unable to replace input {name!r}; multiple inputs have it")
+                obj = inputs[name]
+                if not isinstance(obj, BaseType) or _signature(0, obj, [obj]) != signature:
+                    raise ValueError(
+                        f"Input {name!r} must have the same type, dtype, and shape as the "
+                        "recorded input"
+                    )
+            else:
+                obj = orig_ref()
+                if obj is None:
+                    raise ValueError(f"Input {name!r} no longer exists, so it must be given")
+            input_slots[name] = slot
+            objs[slot] = obj
+        if unknown := inputs.keys() - input_slots.keys():
+            raise ValueError(f"Unknown inputs: {sorted(unknown)}")
+        new_slots = {
+            slot: name for slot, name in enumerate(trace.names) if slot not in input_slots.values()
+        }
+        if outputs is None:
+            keep = set(new_slots)
+        else:
+            keep = {slot for slot, name in new_slots.items() if name in outputs}
+            if missing := set(outputs) - {new_slots[slot] for slot in keep}:
+                raise ValueError(f"Unknown outputs: {sorted(missing)}")
+        trace.finish(keep)
+        times = []
+        trace.run(objs, times)
+        return Replay(
+            {trace.names[slot]: objs[slot] for slot in sorted(keep)},
+            [(step[1], time) for step, time in zip(trace.steps, times)],
+        )
+
+    def _check_trace(self):
+        if self._trace is None:
+            raise ValueError("Recorder must be created with `trace=True` to use traces")
+        return self._trace
 
     def __enter__(self):
         self.start()
@@ -178,5 +282,37 @@ class Recorder:
         return "\n".join(lines)
 
 
+class Replay:
+    """The result of :meth:`Recorder.replay`.
+
+    Attributes
+    ----------
+    outputs : dict
+        New objects by name for the objects created while recording.
+    times : list
+        ``(cfunc_name, seconds)`` for each call.
+    """
+
+    __slots__ = "outputs", "times"
+
+    def __init__(self, outputs, times):
+        self.outputs = outputs
+        self.times = times
+
+    @property
+    def total_time(self):
+        """Total wall time in seconds of all calls."""
+        return sum(time for _, time in self.times)
+
+    def __repr__(self):
+        return f"Replay({len(self.times)} calls in {self.total_time:.6g} seconds)"
+
+
+def _new_trace():
+    from .prepare import _Trace
+
+    return _Trace()
+
+
 skip_record = Recorder(start=False)
 skip_record.data = collections.deque([], 0)
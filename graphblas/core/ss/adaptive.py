@@ -0,0 +1,239 @@
+import math
+from pathlib import Path
+from time import perf_counter
+
+from ... import config as _config
+from ..base import BaseType
+from ..mask import Mask
+from ..profiler import Profiler
+from . import _IS_SSGB7
+
+
+def _work(args):
+    """Estimate the work of a call as the number of values in its inputs."""
+    work = 0
+    for arg in args[1:]:
+        if isinstance(arg, Mask):
+            arg = arg.parent
+        if isinstance(arg, BaseType) and not arg._is_scalar:
+            work += arg._nvals
+    return work
+
+
+class _AdaptiveHook(Profiler):
+    """Set the number of threads before each call; this doesn't record anything."""
+
+    __slots__ = ("context",)
+    _chained = True
+
+    def __init__(self, context):
+        self.context = context
+        super().__init__(start=False, details=False)
+
+    def _describe_inputs(self, args):
+        if self._prev_profiler is not None:
+            rv = self._prev_profiler._describe_inputs(args)
+        else:
+            rv = None
+        self.context._set_nthreads(self.context.nthreads_for(_work(args)))
+        return rv
+
+    def record(self, cfunc_name, args, start, stop, inputs):
+        if self._prev_profiler is not None:
+            self._prev_profiler.record(cfunc_name, args, start, stop, inputs)
+
+
+class AdaptiveContext:
+    """Choose the number of threads for each GraphBLAS call from the size of its inputs.
+
+    SuiteSparse:GraphBLAS may use many threads for small operations, where starting the
+    threads costs more than it saves.  While engaged, each call uses
+
+        ``min(max_nthreads, ceil(work / work_per_thread))``
+
+    threads, where ``work`` is the total number of values in the Vector and Matrix
+    inputs of the call.  Defaults come from ``gb.config["adaptive_context"]``, which may
+    be set for this machine with :meth:`calibrate`.
+
+    With SuiteSparse:GraphBLAS 8 or later, the number of threads is set on a
+    ``gb.ss.Context`` for the current thread.  Otherwise, the global
+    ``gb.ss.config["nthreads"]`` is changed and then restored when disengaged, so don't
+    use an AdaptiveContext while other threads run GraphBLAS operations.
+
+    >>> with gb.ss.AdaptiveContext(work_per_thread=100_000):
+    ...     w = v.ewise_add(v).new()  # small, so 1 thread
+    ...     C = A.mxm(B).new()  # large, so more threads
+
+    Parameters
+    ----------
+    engage : bool, default=True
+        Whether to engage immediately.  May also be used as a context manager.
+    work_per_thread : int, optional
+        Number of input values per thread.
+    max_nthreads : int, optional
+        Maximum number of threads to use.  Default is the number of threads when engaged.
+    chunk : float, optional
+        Chunk size given to SuiteSparse:GraphBLAS; see ``gb.ss.Context``.
+    """
+
+    def __init__(self, engage=True, *, work_per_thread=None, max_nthreads=None, chunk=None):
+        defaults = _config.get("adaptive_context", None) or {}
+        if work_per_thread is None:
+            work_per_thread = defaults.get("work_per_thread", 65536)
+        if max_nthreads is None:
+            max_nthreads = defaults.get("max_nthreads")
+        if work_per_thread <= 0:
+            raise ValueError(f"work_per_thread must be positive; got {work_per_thread}")
+        self.work_per_thread = work_per_thread
+        self.max_nthreads = max_nthreads
+        self.chunk = chunk
+        self._hook = _AdaptiveHook(self)
+        self._context = None
+        self._nthreads = None  # currently set
+        self._prev_settings = None
+        if engage:
+            self.engage()
+
+    def nthreads_for(self, work):
+        """The number of threads to use for ``work`` input values."""
+        nthreads = max(1, math.ceil(work / self.work_per_thread))
+        if self._max_nthreads is not None:
+            nthreads = min(nthreads, self._max_nthreads)
+        return nthreads
+
+    @property
+    def _max_nthreads(self):
+        if self.max_nthreads is not None:
+            return self.max_nthreads
+        if self._prev_settings is not None:
+            return self._prev_settings[0]
+        return None
+
+    def _set_nthreads(self, nthreads):
+        if nthreads == self._nthreads:
+            return
+        if self._context is not None:
+            self._context["nthreads"] = nthreads
+        else:
+            from ...ss import config
+
+            config["nthreads"] = nthreads
+        self._nthreads = nthreads
+
+    @property
+    def is_engaged(self):
+        return self._prev_settings is not None
+
+    def engage(self):
+        if self._prev_settings is not None:
+            return
+        from ...ss import config
+
+        if _IS_SSGB7:
+            self._prev_settings = (config["nthreads"], config["chunk"])
+            if self.chunk is not None:
+                config["chunk"] = self.chunk
+        else:
+            from .context import Context, threadlocal
+
+            context = threadlocal.context
+            self._prev_settings = (context["nthreads"] or config["nthreads"], context["chunk"])
+            self._context = Context(chunk=self.chunk)
+        self._nthreads = None
+        self._hook.start()
+
+    def disengage(self):
+        if self._prev_settings is None:
+            return
+        self._hook.stop()
+        if self._context is not None:
+            self._context.disengage()
+            self._context = None
+        else:
+            from ...ss import config
+
+            config["nthreads"], config["chunk"] = self._prev_settings
+        self._prev_settings = None
+        self._nthreads = None
+
+    def __enter__(self):
+        self.engage()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb):
+        self.disengage()
+
+    def __repr__(self):
+        return (
+            f"gb.ss.AdaptiveContext(work_per_thread={self.work_per_thread}, "
+            f"max_nthreads={self.max_nthreads}, chunk={self.chunk})"
+        )
+
+    @classmethod
+    def calibrate(cls, *, sizes=None, repeat=5, save=True, path=None):
+        """Benchmark this machine to find ``work_per_thread`` and return a new AdaptiveContext.
+
+        For increasing sizes, this times adding two vectors with one thread and with
+        ``gb.ss.config["nthreads"]`` threads.  The smallest size where more threads are
+        faster determines ``work_per_thread``.  If more threads are never faster (such as
+        on a machine with a single core), ``work_per_thread`` is the largest work tried.
+
+        Parameters
+        ----------
+        sizes : list of int, optional
+            Vector sizes to try.  Default is powers of 4 from 1024 to about 4 million.
+        repeat : int, default=5
+            Number of times to repeat each measurement; the fastest time is used.
+        save : bool, default=True
+            Whether to save the result to ``gb.config["adaptive_context"]`` and to a YAML
+            file so it is used by default in future sessions.
+        path : str or Path, optional
+            File to save to.  Default is ``adaptive_context.yaml`` in the user config
+            directory of ``gb.config``, such as ``~/.config/graphblas``.
+
+        Returns
+        -------
+        AdaptiveContext
+            Not engaged.
+        """
+        import numpy as np
+
+        from ...ss import config
+        from ..vector import Vector
+
+        if sizes is None:
+            sizes = [4**i for i in range(5, 12)]
+        max_nthreads = prev = config["nthreads"]
+        work_per_thread = None
+        try:
+            for size in sizes:
+                v = Vector.from_dense(np.arange(size, dtype=np.float64))
+                times = {}
+                for nthreads in {1, max_nthreads}:
+                    config["nthreads"] = nthreads
+                    best = math.inf
+                    for _ in range(repeat):
+                        start = perf_counter()
+                        v.ewise_add(v).new()
+                        best = min(best, perf_counter() - start)
+                    times[nthreads] = best
+                if max_nthreads > 1 and times[max_nthreads] < times[1]:
+                    # Two inputs of `size` values; use 2 or more threads from here
+                    work_per_thread = size
+                    break
+        finally:
+            config["nthreads"] = prev
+        if work_per_thread is None:
+            work_per_thread = 2 * max(sizes)
+        settings = {"work_per_thread": work_per_thread, "max_nthreads": max_nthreads}
+        if save:
+            import yaml
+
+            _config.set({"adaptive_context": settings})
+            if path is None:
+                path = Path(_config.paths[-1]) / "adaptive_context.yaml"
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w") as f:
+                yaml.safe_dump({"adaptive_context": settings}, f)
+        return cls(False, **settings)
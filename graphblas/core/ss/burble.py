@@ -0,0 +1,335 @@
+import ctypes
+import os
+import re
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter
+
+from ..profiler import Profiler, _callsite, _chrome_trace
+
+_entry_pattern = re.compile(r" ?\[ |\s*([-+.0-9eE]+) sec \]\n?")
+_method_pattern = re.compile(
+    r"\b(saxpy\d?|dot\d?|dot_product|hash|gustavson|heap)\b", re.IGNORECASE
+)
+_conversion_pattern = re.compile(
+    r"\b(sparse|hypersparse|hyper|bitmap|full) to (sparse|hypersparse|hyper|bitmap|full)\b"
+)
+_jit_pattern = re.compile(r"\bjit: *([^)]*?) *\)")
+
+try:
+    _fflush = ctypes.CDLL(None).fflush
+except (OSError, AttributeError):  # pragma: no cover (platform)
+    _fflush = None
+
+
+def _flush():
+    sys.stdout.flush()
+    if _fflush is not None:
+        _fflush(None)
+
+
+class BurbleRecord:
+    """A diagnostic message ("burble") printed by SuiteSparse:GraphBLAS.
+
+    Attributes
+    ----------
+    function : str
+        The GraphBLAS function or internal step, such as ``"GrB_mxm"``.
+    text : str
+        The rest of the message.
+    time : float
+        Time in seconds reported by SuiteSparse:GraphBLAS.
+    methods : tuple of str
+        Kernel methods mentioned in the message: "saxpy", "dot", "hash", "gustavson", or "heap".
+    conversions : tuple of str
+        Format conversions, such as ``"sparse to bitmap"``, and ``"transpose"`` if the
+        function transposed an input.
+    jit : str or None
+        What the JIT did, such as ``"load"`` or ``"compile and load"``.
+    cfunc_name : str or None
+        The C function called by python-graphblas that printed this message, or None
+        if it was printed by a call that didn't go through python-graphblas.
+    callsite : str or None
+        The first location outside of graphblas as ``"filename:lineno (function)"``.
+    depth : int
+        How many messages this message is nested in.
+    start : float or None
+        Estimated start time in seconds from ``time.perf_counter``.  Burble only reports
+        durations, so this is computed from when the message was read by
+        :class:`BurbleCapture`; it is None for messages from :func:`parse_burble`.
+    """
+
+    __slots__ = (
+        "function",
+        "text",
+        "time",
+        "methods",
+        "conversions",
+        "jit",
+        "cfunc_name",
+        "callsite",
+        "depth",
+        "start",
+    )
+
+    def __init__(self, message, time, depth=0, cfunc_name=None, callsite=None):
+        function, _, text = " ".join(message.split()).partition(" ")
+        self.function = function
+        self.text = text
+        self.time = time
+        methods = []
+        for match in _method_pattern.finditer(text):
+            method = match.group(1).lower()
+            if method.startswith("saxpy"):
+                method = "saxpy"
+            elif method.startswith("dot"):
+                method = "dot"
+            if method not in methods:
+                methods.append(method)
+        self.methods = tuple(methods)
+        conversions = [" to ".join(match.groups()) for match in _conversion_pattern.finditer(text)]
+        if "transpose" not in function and "transpose" in text:
+            conversions.append("transpose")
+        self.conversions = tuple(conversions)
+        match = _jit_pattern.search(text)
+        self.jit = match.group(1) if match else None
+        self.cfunc_name = cfunc_name
+        self.callsite = callsite
+        self.depth = depth
+        self.start = None
+
+    @property
+    def jit_hit(self):
+        """Whether an already-compiled JIT kernel was used, or None if the JIT wasn't used."""
+        if self.jit is None:
+            return None
+        return "compile" not in self.jit
+
+    def __repr__(self):
+        return f"BurbleRecord({self.function!r}, {self.text!r}, time={self.time})"
+
+
+def _parse(text):
+    """Split text into (records, other text, start of an incomplete message)."""
+    records = []
+    stack = []  # (index of "[", pieces of the message)
+    other = []
+    pos = 0
+    for match in _entry_pattern.finditer(text):
+        piece = text[pos : match.start()]
+        if stack:
+            stack[-1][1].append(piece)
+        else:
+            other.append(piece)
+        pos = match.end()
+        if match.group(1) is None:
+            stack.append((match.start(), []))
+        elif stack:
+            message = "".join(stack.pop()[1])
+            records.append(BurbleRecord(message, float(match.group(1)), len(stack)))
+        else:
+            other.append(match.group(0))
+    if stack:
+        return records, "".join(other), text[stack[0][0] :]
+    other.append(text[pos:])
+    return records, "".join(other), ""
+
+
+def parse_burble(text):
+    """Parse diagnostic messages printed by SuiteSparse:GraphBLAS into a list of BurbleRecord.
+
+    Nested messages are included before the messages that contain them, and any other
+    text is ignored.
+    """
+    return _parse(text)[0]
+
+
+class BurbleCapture(Profiler):
+    """Capture and parse diagnostic messages ("burble") from SuiteSparse:GraphBLAS.
+
+    While capturing, burble is enabled and everything written to the stdout file
+    descriptor is redirected.  Burble messages are parsed into :class:`BurbleRecord`
+    objects and joined to the python-graphblas call that printed them; any other output
+    is written to stdout as usual.  This shows which kernels were chosen and when
+    objects were converted between formats or transposed.
+
+    Because stdout is redirected for the whole process, only one BurbleCapture should be
+    used at a time.
+
+    >>> with gb.ss.BurbleCapture() as burble:
+    ...     C = A.mxm(B).new()
+    >>> [record.methods for record in burble.records]
+    [('saxpy',)]
+    """
+
+    __slots__ = "_saved_fd", "_file", "_buffer", "_prev_burble"
+    _chained = True
+
+    def __init__(self, *, start=True):
+        self._saved_fd = None
+        self._file = None
+        self._buffer = ""
+        self._prev_burble = None
+        super().__init__(start=start, details=False)
+
+    def _describe_inputs(self, args):
+        # Messages from before this call weren't printed by python-graphblas
+        self._read(None, _callsite())
+        if self._prev_profiler is not None:
+            return self._prev_profiler._describe_inputs(args)
+        return None
+
+    def record(self, cfunc_name, args, start, stop, inputs):
+        if self._prev_profiler is not None:
+            self._prev_profiler.record(cfunc_name, args, start, stop, inputs)
+        self._read(cfunc_name, _callsite(), stop)
+
+    def _read(self, cfunc_name=None, callsite=None, stop=None):
+        if self._file is None:
+            return
+        if stop is None:
+            stop = perf_counter()
+        _flush()
+        chunks = []
+        while chunk := os.read(self._file, 65536):
+            chunks.append(chunk)
+        if not chunks:
+            return
+        text = self._buffer + b"".join(chunks).decode(errors="replace")
+        records, other, self._buffer = _parse(text)
+        # Messages were printed in order and each ended before the one that contains it,
+        # so go backwards from when they were read to estimate when each started.
+        ends = [stop]
+        for record in reversed(records):
+            record.cfunc_name = cfunc_name
+            record.callsite = callsite
+            del ends[record.depth + 1 :]
+            while len(ends) <= record.depth:
+                ends.append(ends[-1])
+            end = ends[record.depth]
+            record.start = ends[record.depth] = end - record.time
+            # Messages nested in this one end when it ends
+            ends.append(end)
+        self.records.extend(records)
+        if other:
+            # Pass through output that isn't burble
+            os.write(self._saved_fd, other.encode())
+
+    def start(self):
+        from ...ss import config
+
+        super().start()
+        if self._file is None:
+            _flush()
+            fd, path = tempfile.mkstemp()
+            # Read with a separate file offset from the one used to write
+            self._file = os.open(path, os.O_RDONLY)
+            Path(path).unlink()
+            self._saved_fd = os.dup(1)
+            os.dup2(fd, 1)
+            os.close(fd)
+            self._prev_burble = config["burble"]
+            config["burble"] = True
+
+    def stop(self):
+        from ...ss import config
+
+        if self._file is not None:
+            self._read()
+            config["burble"] = self._prev_burble
+            _flush()
+            os.dup2(self._saved_fd, 1)
+            os.close(self._saved_fd)
+            os.close(self._file)
+            if self._buffer:
+                os.write(1, self._buffer.encode())
+                self._buffer = ""
+            self._file = self._saved_fd = None
+        super().stop()
+
+    @property
+    def is_capturing(self):
+        return self._file is not None
+
+    @property
+    def total_time(self):
+        """Total time in seconds reported in the burble, not including nested messages."""
+        return sum(record.time for record in self.records if record.depth == 0)
+
+    def summary(self, by="function"):
+        """Aggregate the time reported in the burble into a pandas DataFrame.
+
+        Nested messages are included, so the time of a message may also be counted
+        in the time of the message that contains it.
+
+        Parameters
+        ----------
+        by : {"function", "cfunc_name", "callsite"}
+            Attribute of the records to group by.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The count, total, mean, and max time in seconds, sorted by total time.
+        """
+        import pandas as pd
+
+        if by not in {"function", "cfunc_name", "callsite"}:
+            raise ValueError(
+                f'`by` argument must be "function", "cfunc_name", or "callsite"; got {by!r}'
+            )
+        df = pd.DataFrame(
+            {
+                by: [getattr(record, by) for record in self.records],
+                "time": [record.time for record in self.records],
+            }
+        )
+        rv = df.groupby(by, dropna=False)["time"].agg(["count", "sum", "mean", "max"])
+        rv = rv.rename(columns={"sum": "total"})
+        return rv.sort_values("total", ascending=False)
+
+    def to_chrome_trace(self, path=None):
+        """Convert the records to the Chrome Trace Event format.
+
+        Start times are estimated from when each message was read, and nested messages
+        are shown inside the messages that contain them.  The trace can be viewed with
+        Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+        Parameters
+        ----------
+        path : str or Path, optional
+            If given, write the trace to this file as JSON.
+
+        Returns
+        -------
+        dict
+        """
+        pid = os.getpid()
+        tid = threading.get_ident()
+        t0 = min((record.start for record in self.records), default=0)
+        events = [
+            {
+                "name": record.function,
+                "cat": "burble",
+                "ph": "X",
+                "ts": (record.start - t0) * 1e6,
+                "dur": record.time * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": {
+                    "text": record.text,
+                    "cfunc_name": record.cfunc_name,
+                    "callsite": record.callsite,
+                },
+            }
+            for record in self.records
+        ]
+        return _chrome_trace(events, path)
+
+    def __repr__(self):
+        lines = [f'gb.ss.BurbleCapture ({"" if self.is_capturing else "not "}capturing)']
+        lines.append("-" * len(lines[0]))
+        lines.extend(f"  {record.function} {record.text}".rstrip() for record in self.records)
+        return "\n".join(lines)
@@ -7,7 +7,13 @@ import graphblas as gb
 
 from ... import binary, monoid
 from ...dtypes import _INDEX, BOOL, INT64, UINT64, lookup_dtype
-from ...exceptions import _error_code_lookup, check_status, check_status_carg
+from ...exceptions import (
+    DimensionMismatch,
+    IndexOutOfBound,
+    _error_code_lookup,
+    check_status,
+    check_status_carg,
+)
 from .. import NULL, _has_numba, ffi, lib
 from ..base import call
 from ..dtypes import _string_to_dtype
@@ -27,6 +33,8 @@ from ..utils import (
 )
 from .config import BaseConfig
 from .descriptor import get_descriptor
+from .shared import from_shared_memory, to_shared_memory
+from .storage import load, save
 
 if _has_numba:
     from numba import njit, prange
@@ -41,6 +49,24 @@ else:
 ffi_new = ffi.new
 
 
+def _check_weights(values, dtype, argname):
+    if values.dtype.kind not in "biuf":
+        raise TypeError(f"{argname} requires real-valued weights; got {dtype}")
+    if values.size > 0 and not (values >= 0).all():
+        raise ValueError(f"{argname} requires non-negative weights")
+
+
+def _row_seeds(seed, rows):
+    """Mix ``seed`` with each row index (splitmix64) to seed the random numbers of each row."""
+    x = rows.astype(np.uint64) + np.uint64(seed * 0x9E3779B97F4A7C15 % 2**64)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return (x >> np.uint64(32)).astype(np.uint32)
+
+
 def head(matrix, n=10, dtype=None, *, sort=False):
     """Like ``matrix.to_coo()``, but only returns the first n elements.
 
@@ -3818,15 +3844,22 @@ class ss:
         Parameters
         ----------
         how : str
-            "random": choose k elements with equal probability
-            "first": choose the first k elements
-            "last": choose the last k elements
+            - "random": choose k elements with equal probability
+            - "first": choose the first k elements
+            - "last": choose the last k elements
+            - "largest": choose the k largest elements.  If tied, any may be chosen.
+              NaN is ordered after all numbers as in ``np.sort``, so NaN values are
+              chosen first.
+            - "smallest": choose the k smallest elements.  If tied, any may be chosen.
+              NaN values are chosen last, only if there are fewer than k numbers.
+            - "random_weighted": choose k elements without replacement with probability
+              proportional to their values, which must be non-negative.  Elements with
+              value 0 are never chosen.
         k : int
             The number of elements to choose from each row
 
         **THIS API IS EXPERIMENTAL AND MAY CHANGE**
         """
-        # TODO: largest, smallest, random_weighted
         order = get_order(order)
         how = how.lower()
         if order == "rowwise":
@@ -3849,8 +3882,23 @@ class ss:
             choose_func = choose_last
             is_random = False
             do_sort = True
+        elif how == "largest":
+            choose_func = choose_largest
+            is_random = False
+            do_sort = False
+        elif how == "smallest":
+            choose_func = choose_smallest
+            is_random = False
+            do_sort = False
+        elif how == "random_weighted":
+            choose_func = choose_random_weighted
+            is_random = False
+            do_sort = False
         else:
-            raise ValueError('`how` argument must be one of: "random", "first", "last"')
+            raise ValueError(
+                '`how` argument must be one of: "random", "first", "last", '
+                '"largest", "smallest", "random_weighted"'
+            )
         return self._select_random(
             k, fmt, indices, sort_axis, choose_func, is_random, do_sort, name
         )
@@ -3859,7 +3907,30 @@ class ss:
         if k < 0:
             raise ValueError("negative k is not allowed")
         info = self._parent.ss.export(fmt, sort=do_sort)
-        choices, indptr = choose_func(info["indptr"], k)
+        if choose_func is choose_random_weighted:
+            values = info["values"]
+            _check_weights(values, self._parent.dtype, '"random_weighted"')
+            if info["is_iso"]:
+                # All weights are equal, so choose uniformly unless all are 0
+                if values.size > 0 and values[0] == 0:
+                    k = 0
+                choose_func = choose_random
+                is_random = True
+        elif choose_func is choose_largest or choose_func is choose_smallest:
+            if info["is_iso"]:
+                # All values are tied, so the cheapest choice is fine
+                choose_func = choose_first
+            elif info["values"].dtype.kind not in "biuf":
+                raise TypeError(
+                    f"largest and smallest require real-valued elements; got {self._parent.dtype}"
+                )
+        if choose_func in {choose_largest, choose_smallest, choose_random_weighted}:
+            values = info["values"]
+            if values.dtype.kind == "b":
+                values = values.view(np.uint8)
+            choices, indptr = choose_func(info["indptr"], values, k)
+        else:
+            choices, indptr = choose_func(info["indptr"], k)
         newinfo = dict(info, indptr=indptr)
         newinfo[indices] = info[indices][choices]
         if not info["is_iso"]:
@@ -3874,6 +3945,111 @@ class ss:
             name=name,
         )
 
+    def sample_neighbors(self, seeds, fanout, *, replace=False, weights=None, seed=None, name=None):
+        """Sample (up to) ``fanout`` elements from each row given by ``seeds``.
+
+        This is one hop of neighbor sampling for mini-batch training of graph neural
+        networks.  Only the rows of the seeds are extracted and sampled, so the cost
+        depends on the degrees of the seeds and not the size of the Matrix.
+
+        Parameters
+        ----------
+        seeds : Vector or array-like
+            The rows to sample from.  If a Vector, the indices of its elements are used.
+        fanout : int
+            The number of elements to sample from each row.
+        replace : bool, default False
+            Whether to sample with replacement.  An element drawn more than once
+            appears only once in the result.
+        weights : Matrix, optional
+            Non-negative sampling weights with the same structure as this Matrix, which
+            may be this Matrix itself.  Elements with weight 0 are never chosen.
+            Sample uniformly if not given.
+        seed : int, optional
+            Seed for the random number generator.  Each row is sampled with its own seed
+            derived from ``seed`` and the row index, so results are reproducible for any
+            number of threads.
+
+        Returns
+        -------
+        Matrix
+            The sampled elements, the same shape as this Matrix.
+        Vector[dtype=BOOL]
+            The frontier: the column indices of the sampled elements, which may be
+            used as the seeds of the next hop.
+
+        **THIS API IS EXPERIMENTAL AND MAY CHANGE**
+        """
+        from ..vector import Vector
+
+        parent = self._parent
+        if fanout < 0:
+            raise ValueError("negative fanout is not allowed")
+        if isinstance(seeds, Vector):
+            if seeds._size != parent._nrows:
+                raise DimensionMismatch(
+                    f"seeds must have size {parent._nrows} (nrows); got {seeds._size}"
+                )
+            rows = seeds.to_coo(values=False)[0]
+        else:
+            rows = np.unique(np.asarray(seeds, dtype=np.int64))
+            if rows.size > 0 and (rows[0] < 0 or rows[-1] >= parent._nrows):
+                raise IndexOutOfBound(f"seeds must be between 0 and {parent._nrows - 1}")
+            rows = rows.astype(np.uint64)
+        B = parent[rows, :].new(name="sample_temp")
+        info = B.ss.export("hypercsr", sort=weights is not None, give_ownership=True)
+        indptr = info["indptr"]
+        row_seeds = None if seed is None else _row_seeds(seed, rows[info["rows"]])
+        if weights is None:
+            is_weighted = False
+        elif weights is parent:
+            is_weighted = not info["is_iso"]
+            values = info["values"]
+        else:
+            if weights.shape != parent.shape:
+                raise DimensionMismatch(
+                    f"weights must have shape {parent.shape}; got {weights.shape}"
+                )
+            W = weights[rows, :].new(name="sample_temp")
+            winfo = W.ss.export("hypercsr", sort=True, give_ownership=True)
+            if not (
+                np.array_equal(winfo["indptr"], indptr)
+                and np.array_equal(winfo["rows"], info["rows"])
+                and np.array_equal(winfo["col_indices"], info["col_indices"])
+            ):
+                raise ValueError("weights must have the same structure as the Matrix")
+            is_weighted = not winfo["is_iso"]
+            values = winfo["values"]
+        if weights is not None:
+            _check_weights(values, weights.dtype, "weights")
+            if values.dtype.kind == "b":
+                values = values.view(np.uint8)
+            if not is_weighted and values.size > 0 and values[0] == 0:
+                fanout = 0
+        if replace:
+            choices, new_indptr = choose_with_replacement(
+                indptr, values if is_weighted else None, fanout, row_seeds
+            )
+        elif is_weighted:
+            choices, new_indptr = choose_random_weighted(indptr, values, fanout, row_seeds)
+        else:
+            choices, new_indptr = choose_random(indptr, fanout, row_seeds)
+        col_indices = info["col_indices"][choices]
+        newinfo = dict(
+            info,
+            indptr=new_indptr,
+            rows=rows[info["rows"]],
+            col_indices=col_indices,
+            nrows=parent._nrows,
+        )
+        if not info["is_iso"]:
+            newinfo["values"] = info["values"][choices]
+        if not replace and not is_weighted and fanout > 1:
+            newinfo["sorted_cols"] = False
+        A = self.import_any(**newinfo, take_ownership=True, name=name)
+        frontier = Vector.from_coo(np.unique(col_indices), True, size=parent._ncols)
+        return A, frontier
+
     def compactify(
         self, how="first", k=None, order="rowwise", *, reverse=False, asindex=False, name=None
     ):
@@ -4155,6 +4331,101 @@ class ss:
         rv._ncols = rv.ncols
         return rv
 
+    def to_shared_memory(self, format=None, **opts):
+        """Copy the data of the Matrix into ``multiprocessing.shared_memory`` segments.
+
+        The Matrix is unpacked without copying, its buffers are copied once into shared
+        memory, and it is packed back, so it is unchanged.  The returned handle may be
+        pickled and sent to other processes, which can create a new Matrix from it with
+        ``Matrix.ss.from_shared_memory(handle)``.  This avoids pickling the data, which
+        is expensive for large objects.
+
+        The segments are not freed until ``handle.unlink()`` is called (or the handle is
+        used as a context manager in the creating process).
+
+        Examples
+        --------
+        >>> with A.ss.to_shared_memory() as handle:
+        ...     results = pool.map(func, [handle] * nworkers)
+
+        and in ``func``:
+
+        >>> A = Matrix.ss.from_shared_memory(handle)
+
+        Parameters
+        ----------
+        format : str, optional
+            The format of the buffers; see ``Matrix.ss.export``.
+
+        Returns
+        -------
+        gb.ss.SharedMemoryHandle
+        """
+        return to_shared_memory(self, format, opts)
+
+    @classmethod
+    def from_shared_memory(cls, handle, *, name=None, **opts):
+        """Create a new Matrix from a handle returned by ``Matrix.ss.to_shared_memory``.
+
+        The data is copied once from shared memory, because SuiteSparse:GraphBLAS must
+        own the memory of the new Matrix.  This does not free the shared memory.
+
+        Parameters
+        ----------
+        handle : gb.ss.SharedMemoryHandle
+        name : str, optional
+            Name of the new Matrix.
+
+        Returns
+        -------
+        Matrix
+        """
+        return from_shared_memory(gb.Matrix, handle, name, opts)
+
+    def save(self, path, format=None, **opts):
+        """Save the Matrix to a directory of ``.npy`` files that can be loaded quickly.
+
+        Each buffer from ``Matrix.ss.export`` is saved to its own ``.npy`` file, and the
+        rest of the export info is saved to ``metadata.json``.  The Matrix is unpacked
+        and packed without copying, so it is unchanged.  Use ``Matrix.ss.load`` to load.
+
+        Parameters
+        ----------
+        path : str or Path
+            Directory to save to; it is created if necessary.
+        format : str, optional
+            The format to save; see ``Matrix.ss.export``.  This is the format that
+            ``Matrix.ss.load`` will create.
+
+        Examples
+        --------
+        >>> A.ss.save("A_data")
+        >>> A2 = Matrix.ss.load("A_data")
+        """
+        save(self, path, format, opts)
+
+    @classmethod
+    def load(cls, path, *, mmap=True, name=None, **opts):
+        """Load a Matrix that was saved with ``Matrix.ss.save``.
+
+        Parameters
+        ----------
+        path : str or Path
+            The directory given to ``Matrix.ss.save``.
+        mmap : bool, default True
+            If True, memory-map the files with ``np.load(..., mmap_mode="r")`` and
+            import from them with a single copy, so loading is bounded by reading the
+            pages of the files.  If False, read the files into memory and give ownership
+            of the arrays to SuiteSparse:GraphBLAS without copying.
+        name : str, optional
+            Name of the new Matrix.
+
+        Returns
+        -------
+        Matrix
+        """
+        return load(gb.Matrix, path, mmap, name, opts)
+
 
 @njit(parallel=True)
 def argsort_values(indptr, indices, values):  # pragma: no cover (numba)
@@ -4215,7 +4486,7 @@ def compact_indices(indptr, k):  # pragma: no cover (numba)
 
 
 @njit(parallel=True)
-def choose_random1(indptr):  # pragma: no cover (numba)
+def choose_random1(indptr, row_seeds=None):  # pragma: no cover (numba)
     choices = np.empty(indptr.size - 1, dtype=indptr.dtype)
     new_indptr = np.arange(indptr.size, dtype=indptr.dtype)
     for i in prange(indptr.size - 1):
@@ -4224,6 +4495,8 @@ def choose_random1(indptr):  # pragma: no cover (numba)
         if deg == 1:
             choices[i] = idx
         else:
+            if row_seeds is not None:
+                np.random.seed(row_seeds[i])
             choices[i] = np.random.randint(idx, idx + deg)
     return choices, new_indptr
 
@@ -4247,9 +4520,14 @@ def create_indptr(indptr, k):  # pragma: no cover (numba)
 
 # Assume we are HyperCSR or HyperCSC
 @njit(parallel=True)
-def choose_random(indptr, k):  # pragma: no cover (numba)
+def choose_random(indptr, k, row_seeds=None):  # pragma: no cover (numba)
+    """Choose k elements uniformly at random from each row.
+
+    If given, the random numbers of each row are seeded with ``row_seeds`` so the result
+    doesn't depend on which thread samples the row.
+    """
     if k == 1:
-        return choose_random1(indptr)
+        return choose_random1(indptr, row_seeds)
 
     # The results in choices don't need to be random.  In fact, it may
     # be nice to have them sorted if convenient to do so.
@@ -4263,6 +4541,8 @@ def choose_random(indptr, k):  # pragma: no cover (numba)
         else:
             curk = deg
         index = np.int64(new_indptr[i])
+        if row_seeds is not None:
+            np.random.seed(row_seeds[i])
         # We call np.random.randint `min(curk, deg - curk)` times
         if 2 * curk <= deg:
             if curk == 1:
@@ -4374,6 +4654,218 @@ def choose_last(indptr, k):  # pragma: no cover (numba)
     return choices, new_indptr
 
 
+@njit
+def _less(a, b):  # pragma: no cover (numba)
+    """Compare with NaN ordered last as in ``np.sort``."""
+    return a < b or (b != b and a == a)
+
+
+@njit
+def _select_kth(buf, kth):  # pragma: no cover (numba)
+    """Partially sort `buf` in-place (quickselect) so `buf[kth]` is in sorted position."""
+    lo = 0
+    hi = buf.size - 1
+    while lo < hi:
+        # Median of three as the pivot
+        a = buf[lo]
+        b = buf[(lo + hi) // 2]
+        c = buf[hi]
+        if _less(a, b):
+            pivot = b if _less(b, c) else (c if _less(a, c) else a)
+        else:
+            pivot = a if _less(a, c) else (c if _less(b, c) else b)
+        i = lo
+        j = hi
+        while i <= j:
+            while _less(buf[i], pivot):
+                i += 1
+            while _less(pivot, buf[j]):
+                j -= 1
+            if i <= j:
+                buf[i], buf[j] = buf[j], buf[i]
+                i += 1
+                j -= 1
+        if kth <= j:
+            hi = j
+        elif kth >= i:
+            lo = i
+        else:
+            break
+    return buf[kth]
+
+
+@njit
+def _select_extreme(values, curk, largest, choices, index, offset):  # pragma: no cover (numba)
+    """Choose the positions of the `curk` largest (or smallest) of `values`.
+
+    This is a partial selection that finds the k-th value in O(deg) and then scans
+    `values` to take everything beyond it, filling any remainder with ties.  NaN is
+    ordered last as in ``np.sort``.  Chosen positions stay in their original order.
+    """
+    if curk == 1:
+        best = 0
+        for j in range(1, values.size):
+            if _less(values[best], values[j]) if largest else _less(values[j], values[best]):
+                best = j
+        choices[index] = offset + best
+        return
+    buf = values.copy()
+    deg = buf.size
+    if largest:
+        kth = deg - curk
+        thresh = _select_kth(buf, kth)
+        nstrict = 0
+        for j in range(kth + 1, deg):
+            if _less(thresh, buf[j]):
+                nstrict += 1
+    else:
+        kth = curk - 1
+        thresh = _select_kth(buf, kth)
+        nstrict = 0
+        for j in range(kth):
+            if _less(buf[j], thresh):
+                nstrict += 1
+    nties = curk - nstrict
+    for j in range(deg):
+        v = values[j]
+        if _less(thresh, v) if largest else _less(v, thresh):
+            choices[index] = offset + j
+            index += 1
+        elif nties > 0 and not (_less(v, thresh) if largest else _less(thresh, v)):
+            choices[index] = offset + j
+            index += 1
+            nties -= 1
+
+
+@njit(parallel=True)
+def _choose_extreme(indptr, values, k, largest):  # pragma: no cover (numba)
+    new_indptr = create_indptr(indptr, k)
+    choices = np.empty(new_indptr[-1], dtype=indptr.dtype)
+    for i in prange(indptr.size - 1):
+        idx = np.int64(indptr[i])
+        deg = np.int64(indptr[i + 1]) - idx
+        index = np.int64(new_indptr[i])
+        if k == 0:
+            continue
+        if k < deg:
+            _select_extreme(values[idx : idx + deg], k, largest, choices, index, idx)
+        else:
+            for j in range(deg):
+                choices[index + j] = idx + j
+    return choices, new_indptr
+
+
+# Assume we are HyperCSR or HyperCSC
+@njit
+def choose_largest(indptr, values, k):  # pragma: no cover (numba)
+    return _choose_extreme(indptr, values, k, True)
+
+
+# Assume we are HyperCSR or HyperCSC
+@njit
+def choose_smallest(indptr, values, k):  # pragma: no cover (numba)
+    return _choose_extreme(indptr, values, k, False)
+
+
+# Assume we are HyperCSR or HyperCSC
+@njit(parallel=True)
+def choose_random_weighted(indptr, weights, k, row_seeds=None):  # pragma: no cover (numba)
+    """Weighted sampling without replacement (Efraimidis-Spirakis) of k elements per row.
+
+    Each element gets the random key ``log(u) / weight`` and the k largest keys are
+    chosen; elements with weight 0 have key ``-inf`` and are never chosen.  If given,
+    the random numbers of each row are seeded with ``row_seeds``.
+    """
+    nrows = indptr.size - 1
+    counts = np.empty(nrows, dtype=np.int64)
+    for i in prange(nrows):
+        count = 0
+        for j in range(indptr[i], indptr[i + 1]):
+            if weights[j] > 0:
+                count += 1
+        counts[i] = min(count, k)
+    new_indptr = np.empty(indptr.size, dtype=indptr.dtype)
+    new_indptr[0] = 0
+    new_indptr[1:] = np.cumsum(counts)
+    choices = np.empty(new_indptr[-1], dtype=indptr.dtype)
+    for i in prange(nrows):
+        idx = np.int64(indptr[i])
+        deg = np.int64(indptr[i + 1]) - idx
+        index = np.int64(new_indptr[i])
+        curk = counts[i]
+        if curk == 0:
+            continue
+        if row_seeds is not None:
+            np.random.seed(row_seeds[i])
+        keys = np.empty(deg, dtype=np.float64)
+        npositive = 0
+        for j in range(deg):
+            w = np.float64(weights[idx + j])
+            if w > 0:
+                keys[j] = np.log(1.0 - np.random.random()) / w
+                npositive += 1
+            else:
+                keys[j] = -np.inf
+        if curk < npositive:
+            _select_extreme(keys, curk, True, choices, index, idx)
+        else:
+            for j in range(deg):
+                if keys[j] > -np.inf:
+                    choices[index] = idx + j
+                    index += 1
+    return choices, new_indptr
+
+
+# Assume we are HyperCSR or HyperCSC
+@njit(parallel=True)
+def choose_with_replacement(indptr, weights, k, row_seeds=None):  # pragma: no cover (numba)
+    """Draw k elements with replacement from each row; repeated draws are chosen once.
+
+    Draws are uniform if `weights` is None, else proportional to `weights`.  If given,
+    the random numbers of each row are seeded with ``row_seeds``.
+    """
+    nrows = indptr.size - 1
+    draws = np.empty(nrows * k, dtype=indptr.dtype)
+    counts = np.zeros(nrows, dtype=np.int64)
+    for i in prange(nrows):
+        idx = np.int64(indptr[i])
+        deg = np.int64(indptr[i + 1]) - idx
+        start = i * k
+        if deg == 0 or k == 0:
+            continue
+        if row_seeds is not None:
+            np.random.seed(row_seeds[i])
+        if weights is None:
+            for j in range(k):
+                draws[start + j] = np.random.randint(idx, idx + deg)
+        else:
+            cumweights = np.cumsum(weights[idx : idx + deg].astype(np.float64))
+            total = cumweights[-1]
+            if total <= 0:
+                continue
+            for j in range(k):
+                pos = np.searchsorted(cumweights, np.random.random() * total, side="right")
+                draws[start + j] = idx + min(pos, deg - 1)
+        row = draws[start : start + k]
+        row.sort()
+        count = 1
+        for j in range(1, k):
+            if row[j] != row[count - 1]:
+                row[count] = row[j]
+                count += 1
+        counts[i] = count
+    new_indptr = np.empty(indptr.size, dtype=indptr.dtype)
+    new_indptr[0] = 0
+    new_indptr[1:] = np.cumsum(counts)
+    choices = np.empty(new_indptr[-1], dtype=indptr.dtype)
+    for i in prange(nrows):
+        index = np.int64(new_indptr[i])
+        start = i * k
+        for j in range(counts[i]):
+            choices[index + j] = draws[start + j]
+    return choices, new_indptr
+
+
 @njit
 def issorted(arr):  # pragma: no cover (numba)
     if arr.size > 1:
@@ -4397,9 +4889,10 @@ def indices_to_indptr(indices, size):  # pragma: no cover (numba)
     for i in range(indices.size):
         row = indices[i]
         if row != index:
-            indptr[index + one] = i
+            # Also fill in empty rows
+            indptr[index + one : row + one] = i
             index = row
-    indptr[index + one] = indices.size
+    indptr[index + one :] = indices.size
     return indptr
 
 
@@ -0,0 +1,177 @@
+"""Share exported Matrix and Vector buffers between processes with shared memory."""
+
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+if sys.version_info >= (3, 13):
+    _attach_kwargs = {"track": False}
+else:  # pragma: no cover (python < 3.13)
+    _attach_kwargs = {}
+
+
+def _tracker_id():
+    """Identify the resource tracker of this process by the pipe used to talk to it.
+
+    Processes started by multiprocessing inherit the pipe, so they share the tracker
+    of their parent; other processes start their own.
+    """
+    fd = getattr(getattr(resource_tracker, "_resource_tracker", None), "_fd", None)
+    if fd is None:  # pragma: no cover (safety)
+        return None
+    try:
+        stat = os.fstat(fd)
+    except OSError:  # pragma: no cover (safety)
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+class SharedMemoryHandle:
+    """The exported buffers of a Matrix or Vector in ``multiprocessing.shared_memory``.
+
+    Create with ``Matrix.ss.to_shared_memory()`` or ``Vector.ss.to_shared_memory()``.
+    A handle is small and may be pickled and sent to other processes, which use
+    ``Matrix.ss.from_shared_memory(handle)`` or ``Vector.ss.from_shared_memory(handle)``
+    to create a new object from the buffers.
+
+    The shared memory segments exist until :meth:`unlink` is called, which should be
+    done once by the process that created the handle after all other processes have
+    attached.  Using the handle as a context manager unlinks the segments on exit in
+    the process that created it and closes them in other processes.
+
+    >>> with A.ss.to_shared_memory() as handle:
+    ...     results = pool.map(func, [handle] * nworkers)
+    """
+
+    def __init__(self, collection, dtype, info, arrays):
+        self.collection = collection
+        self.dtype = dtype
+        self.info = info
+        self.buffers = {}
+        self._segments = {}
+        self._is_owner = True
+        self._tracker = None
+        try:
+            for key, array in arrays.items():
+                # Segments may not be empty
+                segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._segments[key] = segment
+                self.buffers[key] = (segment.name, array.dtype.str, array.shape)
+                np.copyto(np.ndarray(array.shape, array.dtype, segment.buf), array)
+            if getattr(shared_memory, "_USE_POSIX", False):
+                self._tracker = _tracker_id()
+        except BaseException:
+            self.unlink()
+            raise
+
+    @property
+    def nbytes(self):
+        """Total size of the shared memory segments in bytes."""
+        return sum(
+            np.dtype(dtype).itemsize * int(np.prod(shape))
+            for _, dtype, shape in self.buffers.values()
+        )
+
+    def _attach(self):
+        """Return the arrays in shared memory, attaching to segments if necessary."""
+        arrays = {}
+        for key, (segment_name, dtype, shape) in self.buffers.items():
+            if key not in self._segments:
+                segment = shared_memory.SharedMemory(name=segment_name, **_attach_kwargs)
+                if (
+                    not _attach_kwargs
+                    and getattr(shared_memory, "_USE_POSIX", False)
+                    and _tracker_id() != self._tracker
+                ):
+                    # Before Python 3.13, attaching registers the segment with the resource
+                    # tracker of this process, which would destroy it when this process
+                    # exits.  Only the tracker of the process that created it should.
+                    resource_tracker.unregister(segment._name, "shared_memory")
+                self._segments[key] = segment
+            arrays[key] = np.ndarray(shape, dtype, self._segments[key].buf)
+        return arrays
+
+    def close(self):
+        """Close access to the shared memory from this process without destroying it."""
+        segments = self._segments
+        self._segments = {}
+        for segment in segments.values():
+            segment.close()
+
+    def unlink(self):
+        """Close and destroy the shared memory segments.
+
+        After this, no process may attach to the segments.  Processes that already
+        created objects from the handle are unaffected.
+        """
+        for key, (segment_name, _, _) in self.buffers.items():
+            segment = self._segments.pop(key, None)
+            if segment is None:
+                try:
+                    segment = shared_memory.SharedMemory(name=segment_name)
+                except FileNotFoundError:
+                    continue
+            segment.close()
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._is_owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_segments"] = {}
+        state["_is_owner"] = False
+        return state
+
+    def __repr__(self):
+        return (
+            f"<gb.ss.SharedMemoryHandle of {self.collection} dtype={self.dtype} "
+            f"format={self.info['format']} nbytes={self.nbytes}>"
+        )
+
+
+def to_shared_memory(ss, format, opts):
+    """Implementation of ``Matrix.ss.to_shared_memory`` and ``Vector.ss.to_shared_memory``.
+
+    The data is unpacked (without copying), copied once into shared memory, and packed
+    back so the object is unchanged.
+    """
+    parent = ss._parent
+    info = ss.unpack(format, raw=True, **opts)
+    try:
+        arrays = {key: val for key, val in info.items() if isinstance(val, np.ndarray)}
+        meta = {key: val for key, val in info.items() if key not in arrays}
+        return SharedMemoryHandle(type(parent).__name__, parent.dtype, meta, arrays)
+    finally:
+        ss.pack_any(take_ownership=True, **info)
+
+
+def from_shared_memory(cls, handle, name, opts):
+    """Implementation of ``Matrix.ss.from_shared_memory`` and ``Vector.ss.from_shared_memory``.
+
+    SuiteSparse:GraphBLAS must own the memory of an object, so the buffers are copied
+    once by ``import_any``.  The segments are closed afterward if this process attached.
+    """
+    if not isinstance(handle, SharedMemoryHandle):
+        raise TypeError(f"Expected a SharedMemoryHandle; got {type(handle)}")
+    if handle.collection != cls.__name__:
+        raise TypeError(f"Can't create {cls.__name__} from shared {handle.collection}")
+    was_attached = bool(handle._segments)
+    arrays = handle._attach()
+    try:
+        return cls.ss.import_any(**handle.info, **arrays, dtype=handle.dtype, name=name, **opts)
+    finally:
+        del arrays
+        if not was_attached:
+            handle.close()
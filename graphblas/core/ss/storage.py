@@ -0,0 +1,69 @@
+"""Save exported Matrix and Vector buffers as ``.npy`` files that can be memory-mapped."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ...dtypes import lookup_dtype
+
+_METADATA = "metadata.json"
+_FORMAT_VERSION = 1
+
+
+def save(ss, path, format, opts):
+    """Implementation of ``Matrix.ss.save`` and ``Vector.ss.save``.
+
+    The data is unpacked (without copying), each buffer is written to ``{key}.npy``, and
+    the buffers are packed back so the object is unchanged.
+    """
+    parent = ss._parent
+    if parent.dtype._is_udt:
+        raise TypeError(f"{type(parent).__name__}.ss.save does not support user-defined types")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    info = ss.unpack(format, raw=True, **opts)
+    try:
+        buffers = sorted(key for key, val in info.items() if isinstance(val, np.ndarray))
+        for key in buffers:
+            np.save(path / f"{key}.npy", info[key], allow_pickle=False)
+        metadata = {
+            "format_version": _FORMAT_VERSION,
+            "collection": type(parent).__name__,
+            "dtype": parent.dtype.name,
+            "buffers": buffers,
+            "info": {key: val for key, val in info.items() if key not in buffers},
+        }
+    finally:
+        ss.pack_any(take_ownership=True, **info)
+    with (path / _METADATA).open("w") as f:
+        json.dump(metadata, f, default=lambda x: x.item())
+
+
+def load(cls, path, mmap, name, opts):
+    """Implementation of ``Matrix.ss.load`` and ``Vector.ss.load``.
+
+    With ``mmap=True``, buffers are memory-mapped and copied once by ``import_any``, so
+    only the pages of the files are read.  Otherwise, buffers are read into memory and
+    ownership is given to SuiteSparse:GraphBLAS without copying.
+    """
+    path = Path(path)
+    with (path / _METADATA).open() as f:
+        metadata = json.load(f)
+    if metadata.get("format_version") != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version: {metadata.get('format_version')}")
+    if metadata["collection"] != cls.__name__:
+        raise TypeError(f"Can't load {cls.__name__} from saved {metadata['collection']}")
+    mmap_mode = "r" if mmap else None
+    arrays = {
+        key: np.load(path / f"{key}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+        for key in metadata["buffers"]
+    }
+    return cls.ss.import_any(
+        **metadata["info"],
+        **arrays,
+        dtype=lookup_dtype(metadata["dtype"]),
+        take_ownership=not mmap,
+        name=name,
+        **opts,
+    )
@@ -0,0 +1,371 @@
+"""Matrices stored on disk as serialized tiles that are loaded one at a time."""
+
+import itertools
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ... import binary, monoid, semiring
+from ...dtypes import lookup_dtype
+from ...exceptions import DimensionMismatch
+from ..executor import Executor
+from ..matrix import Matrix, TransposedMatrix
+from ..operator import get_typed_op
+from ..scalar import Scalar
+from ..utils import normalize_chunks
+from ..vector import Vector
+
+_METADATA = "metadata.json"
+_FORMAT_VERSION = 1
+
+
+def _offsets(sizes):
+    return (0, *itertools.accumulate(sizes))
+
+
+def _tile_path(path, i, j):
+    return path / f"tile_{i}_{j}.grb"
+
+
+def _write_tile(path, i, j, tile, compression, level):
+    tile.ss.serialize(compression, level).tofile(_tile_path(path, i, j))
+    return tile._nvals
+
+
+def _write_metadata(path, dtype, chunks, nvals):
+    metadata = {
+        "format_version": _FORMAT_VERSION,
+        "dtype": dtype.name,
+        "chunks": [list(chunks[0]), list(chunks[1])],
+        "nvals": nvals,
+    }
+    with (path / _METADATA).open("w") as f:
+        json.dump(metadata, f)
+
+
+def _as_monoid(op, dtype, method_name):
+    op = get_typed_op(op, dtype, kind="binary|monoid")
+    if op.opclass == "BinaryOp" and op.monoid is not None:
+        op = op.monoid
+    if op.opclass != "Monoid":
+        raise TypeError(f"TiledMatrix.{method_name} requires a Monoid; got {op}")
+    return op
+
+
+class TiledMatrix:
+    """A Matrix stored in a directory as serialized tiles that are loaded lazily.
+
+    For matrices that don't fit in memory alongside their intermediate results.
+    Operations load each tile when it is needed and release it when done.  Tiles are
+    processed concurrently in a ``gb.Executor`` thread pool, and each of the
+    ``max_workers`` threads holds at most the tiles of one step: the two input tiles
+    and the result tile of element-wise operations, or one input tile and the partial
+    result for its band of rows (or columns) for ``mxv``, ``mxm``, and reductions.
+    Results that are returned in memory, such as from ``mxv``, are in addition to this.
+
+    Use :meth:`from_matrix` to split a Matrix into tiles and write them, and
+    ``TiledMatrix(path)`` to open a directory that was written before.  The directory
+    has a ``metadata.json`` file and a ``tile_{i}_{j}.grb`` file for each tile,
+    which is the result of ``Matrix.ss.serialize``.
+
+    >>> T = gb.ss.TiledMatrix.from_matrix(A, "A_tiles", chunks=(100_000, None))
+    >>> w = T.mxv(v)
+    >>> T2 = T.apply(gb.unary.abs, path="abs_tiles")
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of the tiles.
+    max_workers : int, optional
+        Maximum number of tiles to process at once; see ``gb.Executor``.
+    """
+
+    def __init__(self, path, *, max_workers=None):
+        self.path = Path(path)
+        with (self.path / _METADATA).open() as f:
+            metadata = json.load(f)
+        if metadata.get("format_version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported TiledMatrix format version: {metadata.get('format_version')}"
+            )
+        self.dtype = lookup_dtype(metadata["dtype"])
+        self.chunks = tuple(tuple(sizes) for sizes in metadata["chunks"])
+        self.row_offsets = _offsets(self.chunks[0])
+        self.col_offsets = _offsets(self.chunks[1])
+        self._nvals = metadata["nvals"]
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_matrix(cls, A, path, chunks, *, compression="default", level=None, max_workers=None):
+        """Split a Matrix into tiles with ``Matrix.ss.split`` and write them to ``path``.
+
+        Tiles are split from one band of rows at a time, so this only needs memory
+        for ``A`` and one band of tiles.
+
+        Parameters
+        ----------
+        A : Matrix
+        path : str or Path
+            Directory to write to; it is created if necessary.
+        chunks : int or tuple
+            The sizes of the tiles; see ``Matrix.ss.split``.
+        compression : str, optional
+            How to compress the tiles; see ``Matrix.ss.serialize``.
+        level : int, optional
+            The compression level; see ``Matrix.ss.serialize``.
+        max_workers : int, optional
+            Maximum number of tiles to process at once.
+
+        Returns
+        -------
+        TiledMatrix
+        """
+        if type(A) is TransposedMatrix:
+            A = A.new(name="A_temp")
+        elif type(A) is not Matrix:
+            raise TypeError(f"Expected a Matrix; got {type(A)}")
+        if A.dtype._is_udt:
+            raise TypeError("TiledMatrix does not support user-defined types")
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        chunks = normalize_chunks(chunks, A.shape)
+        row_offsets = _offsets(chunks[0])
+        nvals = []
+        for i, nrows in enumerate(chunks[0]):
+            start = row_offsets[i]
+            band = A[start : start + nrows, :].new(name="band")
+            tiles = band.ss.split((None, chunks[1]))[0]
+            del band
+            nvals.append(
+                [_write_tile(path, i, j, tile, compression, level) for j, tile in enumerate(tiles)]
+            )
+            del tiles
+        _write_metadata(path, A.dtype, chunks, nvals)
+        return cls(path, max_workers=max_workers)
+
+    @property
+    def nrows(self):
+        return self.row_offsets[-1]
+
+    @property
+    def ncols(self):
+        return self.col_offsets[-1]
+
+    @property
+    def shape(self):
+        return (self.nrows, self.ncols)
+
+    @property
+    def nvals(self):
+        return sum(map(sum, self._nvals))
+
+    @property
+    def ntiles(self):
+        """The number of tiles in each dimension."""
+        return (len(self.chunks[0]), len(self.chunks[1]))
+
+    def tile(self, i, j, *, name=None):
+        """Load tile ``(i, j)`` from disk as a new Matrix."""
+        data = np.fromfile(_tile_path(self.path, i, j), np.uint8)
+        return Matrix.ss.deserialize(data, self.dtype, name=name)
+
+    def to_matrix(self, *, name=None):
+        """Load all tiles and concatenate them into a new Matrix."""
+        m, n = self.ntiles
+        rv = Matrix(self.dtype, self.nrows, self.ncols, name=name)
+        rv.ss.concat([[self.tile(i, j) for j in range(n)] for i in range(m)])
+        return rv
+
+    def _map(self, func, items):
+        with Executor(self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def _new(self, path, dtype, chunks, func, compression, level):
+        """Create a TiledMatrix at ``path`` where tile ``(i, j)`` is ``func(i, j)``."""
+        path = Path(path)
+        if path.resolve() == self.path.resolve():
+            raise ValueError("path of the result must differ from the path of the input")
+        path.mkdir(parents=True, exist_ok=True)
+        m = len(chunks[0])
+        n = len(chunks[1])
+
+        def write(ij):
+            i, j = ij
+            return _write_tile(path, i, j, func(i, j), compression, level)
+
+        nvals = self._map(write, itertools.product(range(m), range(n)))
+        nvals = [nvals[i * n : (i + 1) * n] for i in range(m)]
+        _write_metadata(path, dtype, chunks, nvals)
+        return TiledMatrix(path, max_workers=self.max_workers)
+
+    def _check_other(self, other, method_name):
+        if isinstance(other, TiledMatrix):
+            if other.chunks != self.chunks:
+                raise DimensionMismatch(
+                    f"TiledMatrix.{method_name} requires tiles of the same sizes; "
+                    f"got {self.chunks} and {other.chunks}"
+                )
+            return other.dtype, other.tile
+        if not isinstance(other, (Matrix, TransposedMatrix)):
+            raise TypeError(f"Expected a TiledMatrix or Matrix; got {type(other)}")
+        if other.shape != self.shape:
+            raise DimensionMismatch(f"Expected shape {self.shape}; got {other.shape}")
+        row_offsets = self.row_offsets
+        col_offsets = self.col_offsets
+
+        def tile(i, j):
+            return other[
+                row_offsets[i] : row_offsets[i + 1], col_offsets[j] : col_offsets[j + 1]
+            ].new()
+
+        return other.dtype, tile
+
+    def _ewise(self, method_name, other, op, path, compression, level):
+        other_dtype, other_tile = self._check_other(other, method_name)
+
+        def func(i, j):
+            expr = getattr(self.tile(i, j), method_name)(other_tile(i, j), op)
+            return expr.new(dtype)
+
+        # Determine the result dtype from empty matrices instead of loading tiles
+        dtype = getattr(Matrix(self.dtype), method_name)(Matrix(other_dtype), op).dtype
+        return self._new(path, dtype, self.chunks, func, compression, level)
+
+    def ewise_add(self, other, op=monoid.plus, *, path, compression="default", level=None):
+        """Like ``Matrix.ewise_add`` for each tile; the result is written to ``path``.
+
+        ``other`` may be a TiledMatrix with tiles of the same sizes or an in-memory Matrix.
+        """
+        return self._ewise("ewise_add", other, op, path, compression, level)
+
+    def ewise_mult(self, other, op=binary.times, *, path, compression="default", level=None):
+        """Like ``Matrix.ewise_mult`` for each tile; the result is written to ``path``.
+
+        ``other`` may be a TiledMatrix with tiles of the same sizes or an in-memory Matrix.
+        """
+        return self._ewise("ewise_mult", other, op, path, compression, level)
+
+    def apply(self, op, right=None, *, left=None, path, compression="default", level=None):
+        """Like ``Matrix.apply`` for each tile; the result is written to ``path``."""
+        dtype = Matrix(self.dtype).apply(op, right, left=left).dtype
+
+        def func(i, j):
+            return self.tile(i, j).apply(op, right, left=left).new(dtype)
+
+        return self._new(path, dtype, self.chunks, func, compression, level)
+
+    def _multiply(self, other, op, path, compression, level):
+        method_name = "mxv" if other.ndim == 1 else "mxm"
+        if other.ndim == 1:
+            nrows = other._size
+        else:
+            nrows = other._nrows
+        if nrows != self.ncols:
+            raise DimensionMismatch(
+                f"TiledMatrix.{method_name} dimension mismatch: {self.shape} and {other.shape}"
+            )
+        op = get_typed_op(op, self.dtype, other.dtype, kind="semiring")
+        if op.opclass != "Semiring":
+            raise TypeError(f"TiledMatrix.{method_name} requires a Semiring; got {op}")
+        accum = op.monoid.binaryop
+        col_offsets = self.col_offsets
+        n = self.ntiles[1]
+
+        def row_band(i):
+            rv = None
+            for j in range(n):
+                start, stop = col_offsets[j], col_offsets[j + 1]
+                if other.ndim == 1:
+                    part = op(self.tile(i, j) @ other[start:stop].new())
+                else:
+                    part = op(self.tile(i, j) @ other[start:stop, :].new())
+                if rv is None:
+                    rv = part.new()
+                else:
+                    rv(accum=accum) << part
+            return rv
+
+        if path is None:
+            bands = self._map(row_band, range(self.ntiles[0]))
+            if other.ndim == 1:
+                rv = Vector(op.return_type, self.nrows)
+                rv.ss.concat(bands)
+            else:
+                rv = Matrix(op.return_type, self.nrows, other._ncols)
+                rv.ss.concat([[band] for band in bands])
+            return rv
+        if other.ndim == 1:
+            raise TypeError("path may only be given to TiledMatrix.mxm")
+        chunks = (self.chunks[0], (other._ncols,))
+        return self._new(path, op.return_type, chunks, lambda i, j: row_band(i), compression, level)
+
+    def mxv(self, other, op=semiring.plus_times):
+        """Like ``Matrix.mxv`` with an in-memory Vector; returns a new Vector."""
+        if not isinstance(other, Vector):
+            raise TypeError(f"Expected a Vector; got {type(other)}")
+        return self._multiply(other, op, None, None, None)
+
+    def mxm(self, other, op=semiring.plus_times, *, path=None, compression="default", level=None):
+        """Like ``Matrix.mxm`` with an in-memory Matrix.
+
+        Returns a new Matrix, or a new TiledMatrix with the same row tiles if ``path``
+        is given.
+        """
+        if not isinstance(other, (Matrix, TransposedMatrix)):
+            raise TypeError(f"Expected a Matrix; got {type(other)}")
+        return self._multiply(other, op, path, compression, level)
+
+    def reduce_rowwise(self, op=monoid.plus):
+        """Like ``Matrix.reduce_rowwise`` with a Monoid; returns a new Vector."""
+        op = _as_monoid(op, self.dtype, "reduce_rowwise")
+        n = self.ntiles[1]
+
+        def row_band(i):
+            rv = self.tile(i, 0).reduce_rowwise(op).new()
+            for j in range(1, n):
+                rv(accum=op.binaryop) << self.tile(i, j).reduce_rowwise(op)
+            return rv
+
+        rv = Vector(op.return_type, self.nrows)
+        rv.ss.concat(self._map(row_band, range(self.ntiles[0])))
+        return rv
+
+    def reduce_columnwise(self, op=monoid.plus):
+        """Like ``Matrix.reduce_columnwise`` with a Monoid; returns a new Vector."""
+        op = _as_monoid(op, self.dtype, "reduce_columnwise")
+        m = self.ntiles[0]
+
+        def col_band(j):
+            rv = self.tile(0, j).reduce_columnwise(op).new()
+            for i in range(1, m):
+                rv(accum=op.binaryop) << self.tile(i, j).reduce_columnwise(op)
+            return rv
+
+        rv = Vector(op.return_type, self.ncols)
+        rv.ss.concat(self._map(col_band, range(self.ntiles[1])))
+        return rv
+
+    def reduce_scalar(self, op=monoid.plus):
+        """Like ``Matrix.reduce_scalar`` with a Monoid; returns a new Scalar."""
+        op = _as_monoid(op, self.dtype, "reduce_scalar")
+        m, n = self.ntiles
+        results = self._map(
+            lambda ij: self.tile(*ij).reduce_scalar(op).new(),
+            itertools.product(range(m), range(n)),
+        )
+        rv = Scalar(op.return_type)
+        for result in results:
+            if not result._is_empty:
+                if rv._is_empty:
+                    rv << result
+                else:
+                    rv << op.binaryop(rv, result)
+        return rv
+
+    def __repr__(self):
+        m, n = self.ntiles
+        return (
+            f"<gb.ss.TiledMatrix nrows={self.nrows} ncols={self.ncols} dtype={self.dtype} "
+            f"ntiles=({m}, {n}) path={str(self.path)!r}>"
+        )
@@ -25,6 +25,8 @@ from .config import BaseConfig
 from .descriptor import get_descriptor
 from .matrix import _concat_mn, njit
 from .prefix_scan import prefix_scan
+from .shared import from_shared_memory, to_shared_memory
+from .storage import load, save
 
 ffi_new = ffi.new
 
@@ -1415,7 +1417,10 @@ class ss:
             - "first": choose the first k elements
             - "last": choose the last k elements
             - "largest": choose the k largest elements.  If tied, any may be chosen.
+              NaN is ordered after all numbers as in ``np.sort``, so NaN values are
+              chosen first.
             - "smallest": choose the k smallest elements.  If tied, any may be chosen.
+              NaN values are chosen last, only if there are fewer than k numbers.
         k : int
             The number of elements to choose
 
@@ -1720,6 +1725,101 @@ class ss:
         rv._size = rv.size
         return rv
 
+    def to_shared_memory(self, format=None, **opts):
+        """Copy the data of the Vector into ``multiprocessing.shared_memory`` segments.
+
+        The Vector is unpacked without copying, its buffers are copied once into shared
+        memory, and it is packed back, so it is unchanged.  The returned handle may be
+        pickled and sent to other processes, which can create a new Vector from it with
+        ``Vector.ss.from_shared_memory(handle)``.  This avoids pickling the data, which
+        is expensive for large objects.
+
+        The segments are not freed until ``handle.unlink()`` is called (or the handle is
+        used as a context manager in the creating process).
+
+        Examples
+        --------
+        >>> with v.ss.to_shared_memory() as handle:
+        ...     results = pool.map(func, [handle] * nworkers)
+
+        and in ``func``:
+
+        >>> v = Vector.ss.from_shared_memory(handle)
+
+        Parameters
+        ----------
+        format : str, optional
+            The format of the buffers; see ``Vector.ss.export``.
+
+        Returns
+        -------
+        gb.ss.SharedMemoryHandle
+        """
+        return to_shared_memory(self, format, opts)
+
+    @classmethod
+    def from_shared_memory(cls, handle, *, name=None, **opts):
+        """Create a new Vector from a handle returned by ``Vector.ss.to_shared_memory``.
+
+        The data is copied once from shared memory, because SuiteSparse:GraphBLAS must
+        own the memory of the new Vector.  This does not free the shared memory.
+
+        Parameters
+        ----------
+        handle : gb.ss.SharedMemoryHandle
+        name : str, optional
+            Name of the new Vector.
+
+        Returns
+        -------
+        Vector
+        """
+        return from_shared_memory(gb.Vector, handle, name, opts)
+
+    def save(self, path, format=None, **opts):
+        """Save the Vector to a directory of ``.npy`` files that can be loaded quickly.
+
+        Each buffer from ``Vector.ss.export`` is saved to its own ``.npy`` file, and the
+        rest of the export info is saved to ``metadata.json``.  The Vector is unpacked
+        and packed without copying, so it is unchanged.  Use ``Vector.ss.load`` to load.
+
+        Parameters
+        ----------
+        path : str or Path
+            Directory to save to; it is created if necessary.
+        format : str, optional
+            The format to save; see ``Vector.ss.export``.  This is the format that
+            ``Vector.ss.load`` will create.
+
+        Examples
+        --------
+        >>> v.ss.save("v_data")
+        >>> v2 = Vector.ss.load("v_data")
+        """
+        save(self, path, format, opts)
+
+    @classmethod
+    def load(cls, path, *, mmap=True, name=None, **opts):
+        """Load a Vector that was saved with ``Vector.ss.save``.
+
+        Parameters
+        ----------
+        path : str or Path
+            The directory given to ``Vector.ss.save``.
+        mmap : bool, default True
+            If True, memory-map the files with ``np.load(..., mmap_mode="r")`` and
+            import from them with a single copy, so loading is bounded by reading the
+            pages of the files.  If False, read the files into memory and give ownership
+            of the arrays to SuiteSparse:GraphBLAS without copying.
+        name : str, optional
+            Name of the new Vector.
+
+        Returns
+        -------
+        Vector
+        """
+        return load(gb.Vector, path, mmap, name, opts)
+
 
 @njit
 def random_choice(n, k):  # pragma: no cover (numba)
@@ -1,15 +1,17 @@
 import itertools
+import pickle
 import warnings
 
 import numpy as np
 
-from .. import backend, binary, monoid, select, semiring, unary
+from .. import backend, binary, config, monoid, select, semiring, unary
 from ..dtypes import _INDEX, FP64, INT64, lookup_dtype, unify
 from ..exceptions import DimensionMismatch, NoValue, check_status
 from . import _supports_udfs, automethods, ffi, lib, utils
 from .base import BaseExpression, BaseType, _check_mask, call
 from .descriptor import lookup as descriptor_lookup
 from .expr import _ALL_INDICES, AmbiguousAssignOrExtract, IndexerResolver, Updater
+from .groupby import groupby
 from .mask import Mask, StructuralMask, ValueMask
 from .operator import UNKNOWN_OPCLASS, find_opclass, get_semiring, get_typed_op, op_from_string
 from .scalar import (
@@ -227,9 +229,16 @@ class Vector(BaseType):
             return self._parent._name_html
         return super()._name_html
 
-    def __reduce__(self):
-        # TODO: we should probably use (or compare to) GraphBLAS serialize methods
+    def __reduce_ex__(self, protocol):
+        # With protocol 5, numpy arrays and PickleBuffers are pickled out-of-band if
+        # the pickler has a ``buffer_callback``, so the data isn't copied into the stream.
         if backend == "suitesparse":
+            compression = config.get("pickle_compression")
+            if compression is not None:
+                blob = self.ss.serialize(compression)
+                if protocol >= 5:
+                    blob = pickle.PickleBuffer(blob)
+                return self._deserialize_blob, (blob, self.dtype, self.name)
             pieces = self.ss.export(raw=True)
         else:
             indices, values = self.to_coo(sort=False)
@@ -239,10 +248,15 @@ class Vector(BaseType):
     @staticmethod
     def _deserialize(pieces, name):
         if backend == "suitesparse":
-            return Vector.ss.import_any(name=name, **pieces)
+            # Arrays unpickled in-band own their data, so GraphBLAS can take it without copying
+            return Vector.ss.import_any(name=name, take_ownership=True, **pieces)
         indices, values, dtype, size = pieces
         return Vector.from_coo(indices, values, dtype, size=size, name=name)
 
+    @staticmethod
+    def _deserialize_blob(blob, dtype, name):
+        return Vector.ss.deserialize(blob, dtype, name=name)
+
     @property
     def S(self):
         """Create a Mask based on the structure of the Vector."""
@@ -479,7 +493,7 @@ class Vector(BaseType):
         )
         return self.to_coo(dtype, indices=indices, values=values, sort=sort)
 
-    def to_coo(self, dtype=None, *, indices=True, values=True, sort=True):
+    def to_coo(self, dtype=None, *, indices=True, values=True, sort=True, index=None):
         """Extract the indices and values as a 2-tuple of numpy arrays.
 
         Parameters
@@ -492,6 +506,8 @@ class Vector(BaseType):
             Whether to return values; will return ``None`` for values if ``False``
         sort : bool, default=True
             Whether to require sorted indices.
+        index : :class:`~graphblas.io.NodeIndex`, optional
+            If given, return the node keys of the indices instead of indices.
 
         See Also
         --------
@@ -504,6 +520,9 @@ class Vector(BaseType):
         np.ndarray[dtype=uint64] : Indices
         np.ndarray : Values
         """
+        if index is not None:
+            indices, values = self.to_coo(dtype, indices=indices, values=values, sort=sort)
+            return None if indices is None else index.take(indices), values
         if sort and backend == "suitesparse":
             self.wait()  # sort in SS
         nvals = self._nvals
@@ -1742,6 +1761,41 @@ class Vector(BaseType):
             dtype=self.dtype,
         )
 
+    def groupby(self, labels, op=monoid.plus, *, ngroups=None, name=None):
+        """Aggregate the values of the Vector for each group in ``labels``.
+
+        The result has a value for each group with at least one value; group ``g`` is
+        reduced from the values at the indices ``i`` where ``labels[i] == g``.  Indices
+        without a label are ignored.
+
+        *Note*: This is not a standard GraphBLAS method.  Monoids and most Aggregators are
+        computed with a matrix multiply by an iso-valued indicator Matrix of the groups.
+
+        Parameters
+        ----------
+        labels : Vector or array-like of non-negative ints
+            Group label for each index; missing values in a Vector have no group.
+        op : Monoid, Aggregator, or list of Monoids and Aggregators, default=monoid.plus
+            Reduction operator.  If a list, aggregate with each and return a list.
+        ngroups : int, optional
+            Number of groups and size of the result.  Default is one more than the
+            largest label.
+        name : str, optional
+            Name of the new Vector.
+
+        Returns
+        -------
+        Vector or list of Vectors
+
+        Examples
+        --------
+        .. code-block:: python
+
+            total = v.groupby(community)
+            count, mean = v.groupby(community, [agg.count, agg.mean])
+        """
+        return groupby(self, labels, op, axis=None, ngroups=ngroups, name=name)
+
     ##################################
     # Extract and Assign index methods
     ##################################
@@ -1994,9 +2048,14 @@ class Vector(BaseType):
             size = 0
         return cls.from_coo(indices, values, dtype, size=size, name=name)
 
-    def to_dict(self):
+    def to_dict(self, *, index=None):
         """Return Vector as a dict in the form ``{index: val}``.
 
+        Parameters
+        ----------
+        index : :class:`~graphblas.io.NodeIndex`, optional
+            If given, use the node keys of the indices instead of indices.
+
         See Also
         --------
         to_coo
@@ -2007,7 +2066,7 @@ class Vector(BaseType):
         -------
         dict
         """
-        indices, values = self.to_coo(sort=False)
+        indices, values = self.to_coo(sort=False, index=index)
         return dict(zip(indices.tolist(), values.tolist()))
 
 
@@ -2119,6 +2178,7 @@ class VectorExpression(BaseExpression):
     ewise_union = wrapdoc(Vector.ewise_union)(property(automethods.ewise_union))
     gb_obj = wrapdoc(Vector.gb_obj)(property(automethods.gb_obj))
     get = wrapdoc(Vector.get)(property(automethods.get))
+    groupby = wrapdoc(Vector.groupby)(property(automethods.groupby))
     inner = wrapdoc(Vector.inner)(property(automethods.inner))
     isclose = wrapdoc(Vector.isclose)(property(automethods.isclose))
     isequal = wrapdoc(Vector.isequal)(property(automethods.isequal))
@@ -2207,6 +2267,7 @@ class VectorIndexExpr(AmbiguousAssignOrExtract):
     ewise_union = wrapdoc(Vector.ewise_union)(property(automethods.ewise_union))
     gb_obj = wrapdoc(Vector.gb_obj)(property(automethods.gb_obj))
     get = wrapdoc(Vector.get)(property(automethods.get))
+    groupby = wrapdoc(Vector.groupby)(property(automethods.groupby))
     inner = wrapdoc(Vector.inner)(property(automethods.inner))
     isclose = wrapdoc(Vector.isclose)(property(automethods.isclose))
     isequal = wrapdoc(Vector.isequal)(property(automethods.isequal))
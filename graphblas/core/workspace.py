@@ -0,0 +1,133 @@
+"""A bounded pool of temporary objects reused by aggregators and recipes.
+
+Aggregators and recipes such as ``Matrix.power`` create temporary Vectors and Matrices,
+such as the dense iso-valued vectors used to reduce with a semiring.  Iterative algorithms
+may do this thousands of times, so temporaries are returned to a pool keyed by how they
+were created, dtype, shape, and fill value, and are reused instead of being allocated
+and freed each time.  Temporaries with no fill value are cleared before being reused.
+
+At most ``maxsize`` objects are kept; set ``maxsize = 0`` to disable the pool.  Call
+:func:`clear` to free the objects in the pool.  Objects created while a ``Recorder`` is
+active are only reused while the same Recorder is active, so recorded calls (and traces
+of prepared functions) are self-contained; they are freed when the Recorder is deleted.
+"""
+
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from . import base
+
+maxsize = 64
+
+_lock = threading.Lock()
+_pool = OrderedDict()  # key -> list of objects, ordered from least to most recently used
+_size = 0
+_recorder_ids = weakref.WeakKeyDictionary()  # Recorder -> unique id used in pool keys
+_next_recorder_id = itertools.count(1).__next__
+
+
+@contextmanager
+def borrow(new, dtype, shape, fill=None, *, name=None):
+    """Borrow a temporary object from the pool for use within a ``with`` block.
+
+    The object must not be used after the ``with`` block, and it must not be modified
+    if ``fill`` is given.
+
+    Parameters
+    ----------
+    new : callable
+        Called as ``new(dtype, *shape, name=name)`` to create a new object, such as
+        ``Matrix`` or ``expr._new_vector``.
+    dtype :
+        Data type of the object.
+    shape : tuple
+        Shape of the object.
+    fill : scalar, optional
+        If given, every element of the object has this value.  Otherwise, it is empty.
+    name : str, optional
+        Name of the object.
+    """
+    if maxsize <= 0:
+        yield _new(new, dtype, shape, fill, name)
+        return
+    key = (getattr(new, "__func__", new), dtype, shape, fill, _recorder_id())
+    obj = _acquire(key)
+    if obj is None:
+        obj = _new(new, dtype, shape, fill, name)
+    elif name is not None:
+        obj.name = name
+    try:
+        yield obj
+    finally:
+        if fill is None:
+            obj.clear()
+        _release(key, obj)
+
+
+def clear():
+    """Free all objects in the pool."""
+    global _size
+    with _lock:
+        _pool.clear()
+        _size = 0
+
+
+def _recorder_id():
+    """Identify the active Recorder, if any, so only its own objects are reused."""
+    rec = base._recorder.get(base._prev_recorder)
+    if rec is None:
+        return None
+    with _lock:
+        rec_id = _recorder_ids.get(rec)
+        if rec_id is None:
+            rec_id = _recorder_ids[rec] = _next_recorder_id()
+            weakref.finalize(rec, _discard, rec_id)
+    return rec_id
+
+
+def _discard(rec_id):
+    """Free the objects created while a Recorder that has been deleted was active."""
+    global _size
+    with _lock:
+        for key in [key for key in _pool if key[-1] == rec_id]:
+            _size -= len(_pool.pop(key))
+
+
+def _new(new, dtype, shape, fill, name):
+    obj = new(dtype, *shape, name=name)
+    if fill is not None:
+        obj[...] = fill  # O(1) dense iso object in SuiteSparse
+    return obj
+
+
+def _acquire(key):
+    global _size
+    with _lock:
+        objs = _pool.get(key)
+        if not objs:
+            return None
+        obj = objs.pop()
+        if not objs:
+            del _pool[key]
+        _size -= 1
+        return obj
+
+
+def _release(key, obj):
+    global _size
+    with _lock:
+        while _size >= maxsize and _pool:
+            # Drop the least recently used object
+            oldest = next(iter(_pool))
+            objs = _pool[oldest]
+            objs.pop(0)
+            _size -= 1
+            if not objs:
+                del _pool[oldest]
+        if _size < maxsize:
+            _pool.setdefault(key, []).append(obj)
+            _pool.move_to_end(key)
+            _size += 1
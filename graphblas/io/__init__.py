@@ -1,6 +1,9 @@
+from ._arrow import from_arrow, to_arrow
 from ._awkward import from_awkward, to_awkward
+from ._edgelist import read_edgelist
 from ._matrixmarket import mmread, mmwrite
 from ._networkx import from_networkx, to_networkx
+from ._nodeindex import NodeIndex
 from ._numpy import from_numpy, to_numpy  # deprecated
 from ._scipy import from_scipy_sparse, to_scipy_sparse
 from ._sparse import from_pydata_sparse, to_pydata_sparse
@@ -0,0 +1,390 @@
+import itertools
+import json
+
+import numpy as np
+
+from .. import backend, binary
+from ..core.matrix import Matrix, TransposedMatrix
+from ..core.utils import output_type
+from ..core.vector import Vector
+from ..dtypes import lookup_dtype
+from ..exceptions import GraphblasException, IndexOutOfBound
+
+_METADATA_KEY = b"graphblas"
+
+
+def to_arrow(x, format=None, *, chunksize=None, give_ownership=False):
+    """Convert a Vector or Matrix to Apache Arrow data.
+
+    Vectors become a ``pyarrow.RecordBatch`` with columns "index" and "value".
+    Matrices in "coo" format become a ``pyarrow.RecordBatch`` with columns "row", "col",
+    and "value", and in "csr" or "csc" format become a ``pyarrow.LargeListArray`` with
+    one list per row or column of structs with fields "col" or "row" and "value".
+
+    Indices are int64, and buffers exported from SuiteSparse:GraphBLAS are used by Arrow
+    without copying other than to create the row indices of "coo" format.  Record batches
+    store the shape and dtype in the schema metadata so ``from_arrow`` can restore them.
+
+    Parameters
+    ----------
+    x : Vector or Matrix
+    format : str, optional
+        {"coo", "csr", "csc"} for Matrix; default is "coo".  Ignored for Vector.
+    chunksize : int, optional
+        If given, return a ``pyarrow.RecordBatchReader`` of record batches with
+        ``chunksize`` rows each, which are slices of the same data.  Not used for
+        "csr" or "csc" format.
+    give_ownership : bool, default False
+        Give the memory of ``x`` to Arrow instead of copying it once.
+        ** If True, this nullifies ``x``, which should no longer be used! **
+
+    Returns
+    -------
+    pyarrow.RecordBatch or pyarrow.RecordBatchReader or pyarrow.LargeListArray
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover (import)
+        raise ImportError("pyarrow is required to convert to Arrow") from None
+
+    if x.dtype._is_udt or x.dtype.np_type.kind == "c":
+        raise TypeError(f"Can't convert {x.dtype} dtype to Arrow")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"chunksize must be positive; got {chunksize}")
+    typ = output_type(x)
+    if typ is Vector:
+        indices, values = _vector_buffers(x, give_ownership)
+        names = ["index", "value"]
+        arrays = [pa.array(indices.view(np.int64)), pa.array(values)]
+        metadata = {"collection": "Vector", "shape": [x._size], "sorted": True}
+    elif typ is Matrix or typ is TransposedMatrix:
+        if format is None:
+            format = "coo"
+        format = format.lower()
+        if format not in {"coo", "csr", "csc"}:
+            raise ValueError(f'format must be "coo", "csr", or "csc"; got {format!r}')
+        is_rowwise, vectors, indptr, indices, values = _matrix_buffers(x, format, give_ownership)
+        if format != "coo":
+            struct = pa.StructArray.from_arrays(
+                [pa.array(indices.view(np.int64)), pa.array(values)],
+                names=["col" if is_rowwise else "row", "value"],
+            )
+            return pa.LargeListArray.from_arrays(pa.array(indptr.view(np.int64)), struct)
+        major = np.repeat(vectors, np.diff(indptr).astype(np.int64))
+        rows, cols = (major, indices) if is_rowwise else (indices, major)
+        names = ["row", "col", "value"]
+        arrays = [pa.array(rows.view(np.int64)), pa.array(cols.view(np.int64)), pa.array(values)]
+        metadata = {
+            "collection": "Matrix",
+            "shape": [x._nrows, x._ncols],
+            "sorted": "rowwise" if is_rowwise else "columnwise",
+        }
+    else:
+        raise TypeError(f"x must be a Vector or Matrix; got {type(x)}")
+    metadata["dtype"] = x.dtype.name
+    batch = pa.RecordBatch.from_arrays(
+        arrays, names=names, metadata={_METADATA_KEY: json.dumps(metadata).encode()}
+    )
+    if chunksize is None:
+        return batch
+    batches = [batch.slice(i, chunksize) for i in range(0, batch.num_rows, chunksize)]
+    return pa.RecordBatchReader.from_batches(batch.schema, batches)
+
+
+def from_arrow(data, dtype=None, *, nrows=None, ncols=None, size=None, dup_op=None, name=None):
+    """Create a Vector or Matrix from Apache Arrow data.
+
+    ``data`` may be a ``pyarrow.RecordBatch``, ``pyarrow.Table``, ``pyarrow.RecordBatchReader``,
+    or an iterable of record batches with columns "row", "col", and "value" for a Matrix
+    or "index" and "value" for a Vector (otherwise, the first three or two columns are used),
+    such as from ``to_arrow``, DuckDB, or Polars.  Each record batch is added to the result
+    with ``dup_op``, so record batches may be streamed.  ``data`` may also be a
+    ``pyarrow.ListArray`` or ``pyarrow.LargeListArray`` of structs as returned by
+    ``to_arrow(A, "csr")``, which is imported as the rows of a Matrix.
+
+    SuiteSparse:GraphBLAS must own the memory of a Matrix or Vector, so buffers are copied
+    once when imported.  Buffers that Arrow had to convert, such as int32 indices, are
+    given to SuiteSparse:GraphBLAS without another copy.
+
+    Parameters
+    ----------
+    data : pyarrow.RecordBatch, pyarrow.Table, pyarrow.RecordBatchReader, or pyarrow.ListArray
+    dtype :
+        Data type of the result.  If not provided, the dtype from the metadata written by
+        ``to_arrow`` or of the values is used.
+    nrows : int, optional
+        Number of rows of a Matrix.  If not provided, the shape from the metadata written by
+        ``to_arrow`` or the maximum row index is used.
+    ncols : int, optional
+        Number of columns of a Matrix, like ``nrows``.
+    size : int, optional
+        Size of a Vector, like ``nrows``.
+    dup_op : BinaryOp, optional
+        Function used to combine values if duplicate indices are found.
+        Leaving ``dup_op=None`` will raise an error if duplicates are found.
+    name : str, optional
+        Name of resulting Vector or Matrix
+
+    Returns
+    -------
+    :class:`~graphblas.Vector`
+    :class:`~graphblas.Matrix`
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover (import)
+        raise ImportError("pyarrow is required to convert from Arrow") from None
+
+    if dtype is not None:
+        dtype = lookup_dtype(dtype)
+    if isinstance(data, (pa.ListArray, pa.LargeListArray)):
+        return _from_list_array(data, dtype, nrows, ncols, name)
+    if isinstance(data, pa.RecordBatch):
+        batches = [data]
+        schema = data.schema
+    elif isinstance(data, pa.Table):
+        batches = data.to_batches()
+        schema = data.schema
+    elif isinstance(data, pa.RecordBatchReader):
+        batches = data
+        schema = data.schema
+    else:
+        batches = iter(data)
+        try:
+            first = next(batches)
+        except StopIteration:
+            raise ValueError("No record batches to convert from Arrow") from None
+        schema = first.schema
+        batches = itertools.chain([first], batches)
+    metadata = {}
+    if schema.metadata and _METADATA_KEY in schema.metadata:
+        metadata = json.loads(schema.metadata[_METADATA_KEY])
+    collection = metadata.get("collection")
+    if collection is None:
+        if len(schema.names) == 2:
+            collection = "Vector"
+        elif len(schema.names) >= 3:
+            collection = "Matrix"
+        else:
+            raise ValueError(f"Expected 2 or 3 columns to convert from Arrow; got {schema.names}")
+    if dtype is None and "dtype" in metadata:
+        dtype = lookup_dtype(metadata["dtype"])
+    if collection == "Vector":
+        names = ["index", "value"]
+        if size is None and "shape" in metadata:
+            (size,) = metadata["shape"]
+        shape = [size]
+    else:
+        names = ["row", "col", "value"]
+        if nrows is None and "shape" in metadata:
+            nrows = metadata["shape"][0]
+        if ncols is None and "shape" in metadata:
+            ncols = metadata["shape"][1]
+        shape = [nrows, ncols]
+    if all(col in schema.names for col in names):
+        positions = [schema.get_field_index(col) for col in names]
+    else:
+        positions = list(range(len(names)))
+    # Data from ``to_arrow`` has sorted indices without duplicates, but the metadata
+    # is kept by e.g. ``Table.sort_by``, so the order of each batch is checked
+    is_trusted = bool(metadata.get("sorted")) and metadata.get("shape") == shape
+    rv = None
+    accum = binary.first if dup_op is None else dup_op
+    for batch in batches:
+        columns = [batch.column(i) for i in positions]
+        indices = [_to_indices(col, names[i]) for i, col in enumerate(columns[:-1])]
+        values = _to_values(columns[-1])
+        if dtype is None:
+            dtype = lookup_dtype(values.dtype)
+        chunk_shape = [
+            dim if dim is not None else int(idx.max()) + 1 if idx.size > 0 else 0
+            for dim, idx in zip(shape, indices)
+        ]
+        for dim, idx in zip(chunk_shape, indices):
+            if idx.size > 0 and idx.max() >= dim:
+                raise IndexOutOfBound(f"Index out of range: {idx.max()} >= {dim}")
+        chunk = _from_coo(
+            collection, indices, values, dtype, chunk_shape, dup_op, is_trusted, metadata
+        )
+        if rv is None:
+            rv = chunk
+            continue
+        if collection == "Vector" and rv._size < chunk._size:
+            rv.resize(chunk._size)
+        elif collection == "Vector" and chunk._size < rv._size:
+            chunk.resize(rv._size)
+        elif collection == "Matrix" and rv.shape != chunk.shape:
+            new_shape = (max(rv._nrows, chunk._nrows), max(rv._ncols, chunk._ncols))
+            rv.resize(*new_shape)
+            chunk.resize(*new_shape)
+        if dup_op is None:
+            expected = rv._nvals + chunk._nvals
+            rv(accum) << chunk
+            if rv._nvals != expected:
+                raise ValueError("Duplicate indices found, must provide `dup_op` BinaryOp")
+        else:
+            rv(accum) << chunk
+    if rv is None:
+        if dtype is None:
+            dtype = lookup_dtype(schema.field(positions[-1]).type.to_pandas_dtype())
+        if collection == "Vector":
+            return Vector(dtype, size or 0, name=name)
+        return Matrix(dtype, nrows or 0, ncols or 0, name=name)
+    if name is not None:
+        rv.name = name
+    return rv
+
+
+def _to_indices(array, name):
+    """Convert an Arrow array of indices to a uint64 NumPy array without copying if possible."""
+    if array.null_count > 0:
+        raise ValueError(f"{name} column must not have nulls")
+    indices = array.to_numpy(zero_copy_only=False)
+    if indices.dtype.kind not in "iu":
+        raise TypeError(f"{name} column must be integers; got {indices.dtype}")
+    if indices.dtype.kind == "i":
+        if indices.size > 0 and indices.min() < 0:
+            raise IndexOutOfBound(f"{name} column must not be negative")
+        if indices.dtype.itemsize == 8:
+            return indices.view(np.uint64)
+    return indices.astype(np.uint64, copy=False)
+
+
+def _to_values(array):
+    if array.null_count > 0:
+        raise ValueError("value column must not have nulls")
+    return array.to_numpy(zero_copy_only=False)
+
+
+def _from_coo(collection, indices, values, dtype, shape, dup_op, is_trusted, metadata):
+    if collection == "Vector":
+        (size,) = shape
+        if is_trusted and backend == "suitesparse" and _is_sorted(indices[0]):
+            return Vector.ss.import_sparse(
+                size=size,
+                indices=indices[0],
+                values=values,
+                dtype=dtype,
+                sorted_index=True,
+                take_ownership=True,
+            )
+        return Vector.from_coo(indices[0], values, dtype, size=size, dup_op=dup_op)
+    nrows, ncols = shape
+    is_rowwise = metadata.get("sorted") == "rowwise"
+    # Importing sorted coordinates creates indptr, which is too large if hypersparse
+    if (
+        is_trusted
+        and backend == "suitesparse"
+        and (nrows if is_rowwise else ncols) <= values.size
+        and (_is_sorted(*indices) if is_rowwise else _is_sorted(*indices[::-1]))
+    ):
+        return Matrix.ss.import_coo(
+            nrows=nrows,
+            ncols=ncols,
+            rows=indices[0],
+            cols=indices[1],
+            values=values,
+            dtype=dtype,
+            sorted_rows=is_rowwise,
+            sorted_cols=not is_rowwise,
+            take_ownership=True,
+        )
+    return Matrix.from_coo(
+        indices[0], indices[1], values, dtype, nrows=nrows, ncols=ncols, dup_op=dup_op
+    )
+
+
+def _is_sorted(major, minor=None):
+    """Whether indices are sorted by ``major`` then ``minor`` without duplicates."""
+    if major.size < 2:
+        return True
+    increasing = major[1:] > major[:-1]
+    if minor is not None:
+        increasing |= (major[1:] == major[:-1]) & (minor[1:] > minor[:-1])
+    return bool(increasing.all())
+
+
+def _from_list_array(data, dtype, nrows, ncols, name):
+    if data.null_count > 0:
+        raise ValueError("List array must not have null lists")
+    if nrows is not None and nrows != len(data):
+        raise ValueError(f"nrows must be None or equal to len(data); expected {len(data)}")
+    offsets = data.offsets.to_numpy(zero_copy_only=False)
+    start = int(offsets[0])
+    indptr = offsets - start if start != 0 else offsets
+    struct = data.values.slice(start, int(offsets[-1]) - start)
+    indices, values = struct.flatten()
+    indices = _to_indices(indices, "index")
+    values = _to_values(values)
+    if dtype is None:
+        dtype = lookup_dtype(values.dtype)
+    if ncols is None:
+        ncols = int(indices.max()) + 1 if indices.size > 0 else 0
+    indptr = indptr.astype(np.uint64, copy=False) if indptr.dtype.itemsize < 8 else indptr
+    indptr = indptr.view(np.uint64)
+    if backend == "suitesparse":
+        return Matrix.ss.import_csr(
+            nrows=len(data),
+            ncols=ncols,
+            indptr=indptr,
+            col_indices=indices,
+            values=values,
+            dtype=dtype,
+            take_ownership=True,
+            secure_import=True,
+            name=name,
+        )
+    return Matrix.from_csr(indptr, indices, values, dtype, ncols=ncols, name=name)
+
+
+def _vector_buffers(v, give_ownership):
+    """Return (indices, values) of a Vector."""
+    if backend != "suitesparse":
+        if give_ownership:
+            raise GraphblasException("give_ownership=True is only supported by SuiteSparse")
+        return v.to_coo()
+    info = v.ss.export("sparse", sort=True, give_ownership=give_ownership)
+    values = info["values"]
+    if info["is_iso"]:
+        values = np.repeat(values, info["indices"].size)
+    return info["indices"], values
+
+
+def _matrix_buffers(A, format, give_ownership):
+    """Return (is_rowwise, vectors, indptr, indices, values) of a Matrix.
+
+    ``vectors`` are the indices of the rows or columns in ``indptr``.
+    """
+    if type(A) is TransposedMatrix:
+        if format == "csr":
+            format = "csc"
+        elif format == "csc":
+            format = "csr"
+        is_rowwise, *rest = _matrix_buffers(A._matrix, format, give_ownership)
+        return (not is_rowwise, *rest)
+    if backend != "suitesparse":
+        if give_ownership:
+            raise GraphblasException("give_ownership=True is only supported by SuiteSparse")
+        if format == "csc":
+            indptr, indices, values = A.to_csc()
+            return False, np.arange(A._ncols, dtype=np.uint64), indptr, indices, values
+        indptr, indices, values = A.to_csr()
+        return True, np.arange(A._nrows, dtype=np.uint64), indptr, indices, values
+    if format == "coo":
+        # Export in the current orientation; hypersparse stays hypersparse
+        is_rowwise = A.ss.orientation == "rowwise"
+        prefix = "hyper" if A.ss.format.startswith("hyper") else ""
+        format = f"{prefix}{'csr' if is_rowwise else 'csc'}"
+    else:
+        is_rowwise = format == "csr"
+    info = A.ss.export(format, sort=True, give_ownership=give_ownership)
+    indptr = info["indptr"]
+    if format.startswith("hyper"):
+        vectors = info["rows" if is_rowwise else "cols"]
+    else:
+        vectors = np.arange(indptr.size - 1, dtype=np.uint64)
+    indices = info["col_indices" if is_rowwise else "row_indices"]
+    values = info["values"]
+    if info["is_iso"]:
+        values = np.repeat(values, indices.size)
+    return is_rowwise, vectors, indptr, indices, values
@@ -0,0 +1,211 @@
+from pathlib import Path
+
+import numpy as np
+
+from .. import backend
+from ..core.matrix import Matrix
+from ..dtypes import lookup_dtype
+from ._matrixmarket import _NBANDS, _accumulate_bands, _stack_bands
+from ._nodeindex import NodeIndex
+
+_COMPRESSION_SUFFIXES = {".gz", ".bz2", ".zip", ".xz", ".zst"}
+
+
+def read_edgelist(
+    source,
+    src=0,
+    dst=1,
+    weight=None,
+    *,
+    dtype=None,
+    dup_op=None,
+    chunksize=1_000_000,
+    format=None,
+    index=None,
+    name=None,
+    **kwargs,
+):
+    """Create a square adjacency Matrix from an edge list in a CSV, TSV, or Parquet file.
+
+    The file is read ``chunksize`` rows at a time.  Node keys in the ``src`` and ``dst``
+    columns may be integers or strings and do not need to be contiguous; they are mapped
+    to indices ``0, 1, 2, ...`` in order of first appearance as they are read.  Like
+    ``mmread`` with ``chunksize``, each chunk is accumulated with ``dup_op`` into bands
+    of rows that are stacked at the end, so memory is about the size of the result plus
+    one chunk and one band.
+
+    CSV and TSV files are read with ``pandas.read_csv``, and Parquet files are read with
+    ``pyarrow.parquet.ParquetFile.iter_batches``.
+
+    Parameters
+    ----------
+    source : str or Path or file-like
+        Filename or file-like object to read.  Files may be compressed, such as ".csv.gz".
+    src : str or int, default=0
+        Name or position of the column of source nodes.
+    dst : str or int, default=1
+        Name or position of the column of destination nodes.
+    weight : str or int, optional
+        Name or position of the column of edge weights.
+        If not provided, all edges will have value 1.0, and duplicate edges are
+        combined with ``dup_op`` if given or ignored otherwise.
+    dtype :
+        Data type of the Matrix.  If not provided, the dtype of the weight column is used.
+    dup_op : BinaryOp, optional
+        Function used to combine values if duplicate edges are found.
+        Leaving ``dup_op=None`` will raise an error if duplicates are found and
+        ``weight`` is given; duplicates are ignored if ``weight`` is not given.
+    chunksize : int, default=1_000_000
+        Number of rows to read at a time.
+    format : str, optional
+        {"csv", "tsv", "parquet"}.  If not provided, this is inferred from the file extension.
+    index : NodeIndex, optional
+        Index of node keys to use and extend with new keys, such as to read several files
+        with the same indices.  If not provided, a new NodeIndex is created.
+    name : str, optional
+        Name of resulting Matrix
+    **kwargs
+        Additional keyword arguments passed to ``pandas.read_csv`` or ``iter_batches``.
+
+    Returns
+    -------
+    A : :class:`~graphblas.Matrix`
+        Square adjacency Matrix with an entry ``A[i, j]`` for each edge
+    keys : np.ndarray
+        The node key of each index, so edge ``A[i, j]`` is from ``keys[i]`` to ``keys[j]``
+
+    See Also
+    --------
+    NodeIndex
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive; got {chunksize}")
+    if format is None:
+        format = _infer_format(source)
+    format = format.lower()
+    columns = [src, dst] if weight is None else [src, dst, weight]
+    if format == "parquet":
+        chunks = _read_parquet(source, columns, chunksize, kwargs)
+    elif format in {"csv", "tsv"}:
+        if format == "tsv":
+            kwargs.setdefault("sep", "\t")
+        chunks = _read_csv(source, columns, chunksize, kwargs)
+    else:
+        raise ValueError(f'format must be "csv", "tsv", or "parquet"; got {format!r}')
+    if dtype is not None:
+        dtype = lookup_dtype(dtype)
+    if index is None:
+        index = NodeIndex()
+    bands = []
+    band_size = 1
+    for data in chunks:
+        # Interleave so keys are numbered in the order they appear in the file
+        ids = index.extend(np.column_stack([data[0], data[1]]).ravel())
+        n = data[0].size
+        if weight is None:
+            # Iso values can't be combined with dup_op
+            values = 1.0 if dup_op is None else np.ones(n)
+        else:
+            values = data[2]
+        if dtype is None:
+            dtype = lookup_dtype(values.dtype) if weight is not None else lookup_dtype(float)
+        band_size = _grow_bands(bands, band_size, len(index), dtype)
+        _accumulate_bands(
+            bands, band_size, ids[0::2], ids[1::2], values, dtype, dup_op, weight is not None
+        )
+    n_nodes = len(index)
+    if not bands:
+        A = Matrix(float if dtype is None else dtype, n_nodes, n_nodes, name=name)
+    elif len(bands) == 1:
+        A = bands[0]
+        if name is not None:
+            A.name = name
+    else:
+        A = _stack_bands(bands, n_nodes, n_nodes, dtype.np_type, name)
+    return A, index.keys
+
+
+def _grow_bands(bands, band_size, n, dtype):
+    """Resize and add bands of ``band_size`` rows in place to cover an n x n Matrix.
+
+    The number of nodes isn't known until the file is read, so the bands are merged in
+    pairs, doubling ``band_size``, to keep at most ``2 * _NBANDS`` bands.  Returns the
+    new ``band_size``.
+    """
+    if backend != "suitesparse":
+        if not bands:
+            bands.append(Matrix(dtype, n, n))
+        else:
+            bands[0].resize(n, n)
+        return max(n, 1)
+    if not bands:
+        band_size = max(1, -(-n // _NBANDS))
+    while -(-n // band_size) > 2 * _NBANDS:
+        ncols = bands[0]._ncols
+        merged = []
+        for i in range(0, len(bands), 2):
+            pair = bands[i : i + 2]
+            if len(pair) == 1:
+                merged.append(pair[0])
+            else:
+                nrows = pair[0]._nrows + pair[1]._nrows
+                merged.append(_stack_bands(pair, nrows, ncols, dtype.np_type, None))
+        bands[:] = merged
+        band_size *= 2
+    for i, band in enumerate(bands):
+        nrows = min(band_size, n - i * band_size)
+        if band._nrows != nrows or band._ncols != n:
+            band.resize(nrows, n)
+    for start in range(len(bands) * band_size, n, band_size):
+        bands.append(Matrix(dtype, min(band_size, n - start), n))
+    return band_size
+
+
+def _infer_format(source):
+    if not isinstance(source, (str, Path)):
+        raise ValueError("format must be given when reading from a file-like object")
+    suffixes = [suffix.lower() for suffix in Path(source).suffixes]
+    if suffixes and suffixes[-1] in _COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    if suffixes and suffixes[-1] in {".parquet", ".pq"}:
+        return "parquet"
+    if suffixes and suffixes[-1] in {".tsv", ".tab"}:
+        return "tsv"
+    return "csv"
+
+
+def _read_csv(source, columns, chunksize, kwargs):
+    """Yield the arrays of ``columns`` for each chunk of a CSV file."""
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover (import)
+        raise ImportError("pandas is required to read CSV and TSV edge lists") from None
+
+    if all(isinstance(col, str) for col in columns):
+        positions = None
+    else:
+        # Columns by position are returned in the order of the file
+        positions = sorted(set(columns))
+    with pd.read_csv(source, usecols=list(set(columns)), chunksize=chunksize, **kwargs) as reader:
+        for df in reader:
+            if positions is None:
+                yield [df[col].to_numpy() for col in columns]
+            else:
+                yield [df.iloc[:, positions.index(col)].to_numpy() for col in columns]
+
+
+def _read_parquet(source, columns, chunksize, kwargs):
+    """Yield the arrays of ``columns`` for each chunk of a Parquet file."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:  # pragma: no cover (import)
+        raise ImportError("pyarrow is required to read Parquet edge lists") from None
+
+    f = pq.ParquetFile(source)
+    names = f.schema_arrow.names
+    columns = [names[col] if isinstance(col, int) else col for col in columns]
+    for batch in f.iter_batches(batch_size=chunksize, columns=list(set(columns)), **kwargs):
+        yield [
+            batch.column(batch.schema.get_field_index(col)).to_numpy(zero_copy_only=False)
+            for col in columns
+        ]
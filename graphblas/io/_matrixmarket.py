@@ -1,9 +1,36 @@
-from .. import backend
-from ..core.matrix import Matrix
+import bz2
+import gzip
+import io
+import itertools
+import warnings
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from .. import backend, binary
+from ..core import _has_numba
+from ..core.matrix import Matrix, TransposedMatrix
+from ..exceptions import IndexOutOfBound
 from ._scipy import to_scipy_sparse
 
+if _has_numba:
+    from numba import njit, prange
+else:  # pragma: no cover (numba)
+
+    def njit(func=None, **kwargs):
+        if func is not None:
+            return func
+        return njit
+
+    prange = range
+
+_FIELDS = {"real", "double", "integer", "complex", "pattern"}
+_SYMMETRIES = {"general", "symmetric", "skew-symmetric", "hermitian"}
+_NBANDS = 16
 
-def mmread(source, engine="auto", *, dup_op=None, name=None, **kwargs):
+
+def mmread(source, engine="auto", *, dup_op=None, name=None, chunksize=None, **kwargs):
     """Create a GraphBLAS Matrix from the contents of a Matrix Market file.
 
     This uses `scipy.io.mmread
@@ -16,23 +43,41 @@ def mmread(source, engine="auto", *, dup_op=None, name=None, **kwargs):
     to the engine's ``mmread``. For example, ``parallelism=8`` will set the
     number of threads to use to 8 when using ``fast_matrix_market``.
 
+    To read large files with bounded memory, give ``chunksize`` to parse the file
+    ``chunksize`` lines at a time without scipy or fast_matrix_market.  Each chunk
+    is built into a Matrix and accumulated into the result with ``dup_op``, so
+    memory is about the size of the result plus one chunk.  Symmetric,
+    skew-symmetric, and hermitian files are expanded one chunk at a time.
+
     Parameters
     ----------
     source : str or file
-        Filename (.mtx or .mtz.gz) or file-like object
+        Filename (.mtx, .mtx.gz, or .mtx.bz2) or file-like object
     engine : {"auto", "scipy", "fmm", "fast_matrix_market"}, default "auto"
         How to read the matrix market file. "scipy" uses ``scipy.io.mmread``,
         "fmm" and "fast_matrix_market" uses ``fast_matrix_market.mmread``,
         and "auto" will use "fast_matrix_market" if available.
+        Ignored if ``chunksize`` is given.
     dup_op : BinaryOp, optional
         Aggregation function for duplicate coordinates (if found)
     name : str, optional
         Name of resulting Matrix
+    chunksize : int, optional
+        Number of lines to parse at a time.  If given, the file is read in chunks.
+        Around 100_000 usually keeps memory lowest without being slower.
 
     Returns
     -------
     :class:`~graphblas.Matrix`
     """
+    if chunksize is not None:
+        if kwargs:
+            raise TypeError(
+                f"Unexpected keyword arguments when chunksize is given: {', '.join(kwargs)}"
+            )
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive; got {chunksize}")
+        return _mmread_chunks(source, chunksize, dup_op, name)
     try:
         # scipy is currently needed for *all* engines
         from scipy.io import mmread
@@ -61,6 +106,267 @@ def mmread(source, engine="auto", *, dup_op=None, name=None, **kwargs):
     return Matrix.from_dense(array, name=name)
 
 
+def _open(source, mode="rb"):
+    """Open a filename or file-like object; return (file, whether to close it)."""
+    if hasattr(source, "read" if mode == "rb" else "write"):
+        return source, False
+    path = Path(source)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode), True
+    if path.suffix == ".bz2":
+        return bz2.open(path, mode), True
+    return path.open(mode), True
+
+
+def _read_header(f):
+    """Read the banner, comments, and size line; return (format, field, symmetry, sizes)."""
+    line = f.readline()
+    if isinstance(line, bytes):
+        line = line.decode()
+    banner = line.lower().split()
+    if len(banner) != 5 or banner[0] != "%%matrixmarket" or banner[1] != "matrix":
+        raise ValueError(f"Invalid Matrix Market banner: {line.strip()!r}")
+    _, _, format, field, symmetry = banner
+    if format not in {"coordinate", "array"}:
+        raise ValueError(f"Unknown Matrix Market format: {format!r}")
+    if field not in _FIELDS:
+        raise ValueError(f"Unknown Matrix Market field: {field!r}")
+    if symmetry not in _SYMMETRIES:
+        raise ValueError(f"Unknown Matrix Market symmetry: {symmetry!r}")
+    for line in f:
+        if isinstance(line, bytes):
+            line = line.decode()
+        line = line.strip()
+        if line and not line.startswith("%"):
+            break
+    else:
+        raise ValueError("Matrix Market file is missing the size line")
+    sizes = [int(x) for x in line.split()]
+    if len(sizes) != (3 if format == "coordinate" else 2):
+        raise ValueError(f"Invalid Matrix Market size line: {line!r}")
+    return format, field, symmetry, sizes
+
+
+def _line_dtype(format, field):
+    """The numpy dtype of each data line."""
+    if field == "complex":
+        values = [("real", np.float64), ("imag", np.float64)]
+    elif field == "integer":
+        values = [("values", np.int64)]
+    elif field == "pattern":
+        values = []
+    else:
+        values = [("values", np.float64)]
+    if format == "coordinate":
+        return np.dtype([("rows", np.int64), ("cols", np.int64), *values])
+    return np.dtype(values)
+
+
+def _read_chunks(f, format, field, chunksize):
+    """Yield arrays of the parsed data lines, ``chunksize`` lines at a time."""
+    dtype = _line_dtype(format, field)
+    while lines := list(itertools.islice(f, chunksize)):
+        with warnings.catch_warnings():
+            # numpy warns if there is no data, and parses integers that overflow as floats
+            warnings.simplefilter("ignore", UserWarning)
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                data = np.loadtxt(lines, dtype=dtype, comments="%", ndmin=1)
+            except DeprecationWarning:
+                raise ValueError("Matrix Market integer values must fit in int64") from None
+        del lines
+        if data.size > 0:
+            yield data
+
+
+def _values(data, field):
+    if field == "complex":
+        return data["real"] + 1j * data["imag"]
+    return data["values"]
+
+
+def _mirror(values, symmetry):
+    """Values of the mirrored entries of a symmetric, skew-symmetric, or hermitian Matrix."""
+    if symmetry == "skew-symmetric":
+        return -values
+    if symmetry == "hermitian":
+        return values.conj()
+    return values
+
+
+def _mmread_chunks(source, chunksize, dup_op, name):
+    f, close = _open(source)
+    try:
+        format, field, symmetry, sizes = _read_header(f)
+        chunks = _read_chunks(f, format, field, chunksize)
+        if format == "array":
+            return _read_array(chunks, field, symmetry, sizes, name)
+        return _read_coordinate(chunks, field, symmetry, sizes, dup_op, name)
+    finally:
+        if close:
+            f.close()
+
+
+def _read_coordinate(chunks, field, symmetry, sizes, dup_op, name):
+    nrows, ncols, nvals = sizes
+    if field == "integer":
+        dtype = np.int64
+    elif field == "complex":
+        dtype = np.complex128
+    else:
+        dtype = np.float64
+    # Accumulate into bands of rows so merging a chunk only copies one band at a time
+    nbands = max(1, min(_NBANDS if backend == "suitesparse" else 1, nrows))
+    band_size = -(-nrows // nbands)
+    # A single band is the result
+    names = [name] if nbands == 1 else [f"band_{i}" for i in range(nbands)]
+    bands = [
+        Matrix(dtype, min(band_size, nrows - start), ncols, name=band_name)
+        for band_name, start in zip(names, range(0, nrows, band_size))
+    ]
+    count = 0
+    for data in chunks:
+        count += data.size
+        rows = data["rows"] - 1
+        cols = data["cols"] - 1
+        if field == "pattern":
+            # Iso values can't be combined with dup_op
+            values = 1.0 if dup_op is None else np.ones(data.size)
+        else:
+            values = _values(data, field)
+        if symmetry != "general":
+            offdiag = rows != cols
+            mirror_rows = cols[offdiag]
+            mirror_cols = rows[offdiag]
+            if field != "pattern":
+                values = np.concatenate([values, _mirror(values[offdiag], symmetry)])
+            elif dup_op is not None:
+                values = np.ones(values.size + mirror_rows.size)
+            rows = np.concatenate([rows, mirror_rows])
+            cols = np.concatenate([cols, mirror_cols])
+        if rows.min() < 0 or rows.max() >= nrows:
+            bad = rows[(rows < 0) | (rows >= nrows)][0] + 1
+            raise IndexOutOfBound(f"Row index out of range in Matrix Market file: {bad}")
+        _accumulate_bands(bands, band_size, rows, cols, values, dtype, dup_op)
+    if count != nvals:
+        raise ValueError(f"Expected {nvals} entries in Matrix Market file; got {count}")
+    if len(bands) == 1:
+        return bands[0]
+    return _stack_bands(bands, nrows, ncols, dtype, name)
+
+
+def _accumulate_bands(bands, band_size, rows, cols, values, dtype, dup_op, check_dups=True):
+    """Accumulate entries into bands of ``band_size`` rows with ``dup_op``.
+
+    ``values`` may be a scalar for iso values.  If ``dup_op`` is None, duplicate indices
+    raise unless ``check_dups`` is False, in which case the first value is kept.
+    """
+    accum = binary.first if dup_op is None else dup_op
+    nbands = len(bands)
+    if nbands > 1:
+        band_ids = rows // band_size
+        order = np.argsort(band_ids, kind="stable")
+        rows = rows[order]
+        cols = cols[order]
+        if isinstance(values, np.ndarray):
+            values = values[order]
+        bounds = np.searchsorted(band_ids[order], np.arange(nbands + 1))
+    else:
+        bounds = [0, rows.size]
+    for i, band in enumerate(bands):
+        lo, hi = bounds[i], bounds[i + 1]
+        if lo == hi:
+            continue
+        chunk = Matrix.from_coo(
+            rows[lo:hi] - i * band_size,
+            cols[lo:hi],
+            values[lo:hi] if isinstance(values, np.ndarray) else values,
+            dtype,
+            nrows=band._nrows,
+            ncols=band._ncols,
+            dup_op=dup_op,
+            name="chunk",
+        )
+        if dup_op is None and check_dups:
+            expected = band._nvals + chunk._nvals
+            band(accum)[:, :] << chunk
+            if band._nvals != expected:
+                raise ValueError("Duplicate indices found, must provide `dup_op` BinaryOp")
+        else:
+            band(accum)[:, :] << chunk
+
+
+def _stack_bands(bands, nrows, ncols, dtype, name):
+    """Stack bands of rows into one Matrix while freeing each band after it is copied.
+
+    ``gb.ss.concat`` would need memory for all the bands and the result at once.
+    """
+    nvals = sum(band._nvals for band in bands)
+    indptr = np.empty(nrows + 1, np.uint64)
+    indptr[0] = 0
+    col_indices = np.empty(nvals, np.uint64)
+    values = np.empty(nvals, dtype)
+    sorted_cols = True
+    row = val = 0
+    for i in range(len(bands)):
+        band = bands[i]
+        bands[i] = None
+        band_nrows = band._nrows
+        info = band.ss.export("csr", give_ownership=True)
+        del band
+        band_nvals = info["col_indices"].size
+        indptr[row + 1 : row + band_nrows + 1] = info["indptr"][1:] + np.uint64(val)
+        col_indices[val : val + band_nvals] = info["col_indices"]
+        values[val : val + band_nvals] = info["values"]  # broadcasts if iso
+        sorted_cols = sorted_cols and info["sorted_cols"]
+        del info
+        row += band_nrows
+        val += band_nvals
+    return Matrix.ss.import_csr(
+        nrows=nrows,
+        ncols=ncols,
+        indptr=indptr,
+        col_indices=col_indices,
+        values=values,
+        sorted_cols=sorted_cols,
+        take_ownership=True,
+        name=name,
+    )
+
+
+def _read_array(chunks, field, symmetry, sizes, name):
+    if field == "pattern":
+        raise ValueError("Matrix Market files in array format can't have pattern field")
+    nrows, ncols = sizes
+    if symmetry == "general":
+        rows = cols = None
+        size = nrows * ncols
+    else:
+        # Column-major lower triangle (excluding the diagonal if skew-symmetric)
+        cols, rows = np.triu_indices(ncols, symmetry == "skew-symmetric", nrows)
+        size = rows.size
+    values = None
+    start = 0
+    for data in chunks:
+        chunk = _values(data, field)
+        if values is None:
+            values = np.empty(size, chunk.dtype)
+        if start + chunk.size > size:
+            raise ValueError(f"Expected {size} values in Matrix Market file; got more")
+        values[start : start + chunk.size] = chunk
+        start += chunk.size
+    if start != size:
+        raise ValueError(f"Expected {size} values in Matrix Market file; got {start}")
+    if values is None:
+        values = np.empty(0, np.int64 if field == "integer" else np.float64)
+    if rows is None:
+        return Matrix.from_dense(values.reshape(nrows, ncols, order="F"), name=name)
+    array = np.zeros((nrows, ncols), values.dtype)
+    array[cols, rows] = _mirror(values, symmetry)
+    array[rows, cols] = values  # the diagonal isn't mirrored
+    return Matrix.from_dense(array, name=name)
+
+
 def mmwrite(
     target,
     matrix,
@@ -70,6 +376,7 @@ def mmwrite(
     field=None,
     precision=None,
     symmetry=None,
+    chunksize=None,
     **kwargs,
 ):
     """Write a Matrix Market file from the contents of a GraphBLAS Matrix.
@@ -77,6 +384,11 @@ def mmwrite(
     This uses `scipy.io.mmwrite
     <https://docs.scipy.org/doc/scipy/reference/generated/scipy.io.mmwrite.html>`_.
 
+    To write large matrices, give ``chunksize`` to write ``chunksize`` entries at a
+    time directly from the CSR or CSC data of the Matrix without scipy or
+    fast_matrix_market, which avoids creating COO arrays for the whole Matrix.
+    Integer and pattern entries are formatted in parallel with numba if available.
+
     Parameters
     ----------
     target : str or file target
@@ -95,7 +407,20 @@ def mmwrite(
         Number of digits to write for real or complex values
     symmetry : str, optional
         {"general", "symmetric", "skew-symmetric", "hermetian"}
+        If given with ``chunksize``, only the lower triangle of the Matrix is written.
+    chunksize : int, optional
+        Number of entries to write at a time.  If given, the file is written in chunks
+        to a filename (.mtx, .mtx.gz, or .mtx.bz2) or a file-like object.
     """
+    if chunksize is not None:
+        if kwargs:
+            raise TypeError(
+                f"Unexpected keyword arguments when chunksize is given: {', '.join(kwargs)}"
+            )
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive; got {chunksize}")
+        _mmwrite_chunks(target, matrix, comment, field, precision, symmetry, chunksize)
+        return
     try:
         # scipy is currently needed for *all* engines
         from scipy.io import mmwrite
@@ -138,3 +463,214 @@ def mmwrite(
         symmetry=symmetry,
         **kwargs,
     )
+
+
+@contextmanager
+def _compressed_buffers(matrix):
+    """Yield the CSR or CSC data of a Matrix without copying if possible.
+
+    Yields ``(is_rowwise, vectors, indptr, indices, values, is_iso)``, where ``vectors``
+    are the indices of the rows or columns in ``indptr``.  With SuiteSparse, the Matrix
+    is unpacked and then packed again when done; bitmap and full matrices are unpacked
+    as CSR or CSC and converted back to their original format afterwards.
+    """
+    if type(matrix) is TransposedMatrix:
+        with _compressed_buffers(matrix._matrix) as (is_rowwise, *rest):
+            yield (not is_rowwise, *rest)
+        return
+    if backend != "suitesparse":
+        indptr, indices, values = matrix.to_csr(sort=False)
+        yield True, np.arange(matrix._nrows, dtype=np.uint64), indptr, indices, values, False
+        return
+    orig_format = format = matrix.ss.format
+    is_rowwise = format.endswith("r")
+    if format.startswith("hyper"):
+        pass
+    elif is_rowwise:
+        format = "csr"
+    else:
+        format = "csc"
+    info = matrix.ss.unpack(format, raw=True)
+    try:
+        if format.startswith("hyper"):
+            nvec = info["nvec"]
+            vectors = info["rows" if is_rowwise else "cols"][:nvec]
+        else:
+            nvec = matrix._nrows if is_rowwise else matrix._ncols
+            vectors = np.arange(nvec, dtype=np.uint64)
+        indptr = info["indptr"][: nvec + 1]
+        indices = info["col_indices" if is_rowwise else "row_indices"][: indptr[-1]]
+        values = info["values"] if info["is_iso"] else info["values"][: indptr[-1]]
+        yield is_rowwise, vectors, indptr, indices, values, info["is_iso"]
+    finally:
+        matrix.ss.pack_any(take_ownership=True, **info)
+        if orig_format.startswith(("bitmap", "full")):
+            sparsity_control = matrix.ss.config["sparsity_control"]
+            matrix.ss.config["sparsity_control"] = [orig_format[:-1]]
+            matrix.ss.config["sparsity_control"] = sparsity_control
+
+
+def _iter_chunks(buffers, chunksize, symmetry):
+    """Yield (rows, cols, values) for chunks of about ``chunksize`` entries.
+
+    Only the lower triangle is kept if ``symmetry`` is not "general".
+    """
+    is_rowwise, vectors, indptr, indices, values, is_iso = buffers
+    nvec = vectors.size
+    bounds = np.searchsorted(indptr, np.arange(0, indptr[-1], chunksize), side="right") - 1
+    bounds = np.unique(np.append(bounds, nvec))
+    for v0, v1 in zip(bounds[:-1], bounds[1:]):
+        lo, hi = indptr[v0], indptr[v1]
+        major = np.repeat(vectors[v0:v1], np.diff(indptr[v0 : v1 + 1]).astype(np.int64))
+        minor = indices[lo:hi]
+        chunk_values = values if is_iso else values[lo:hi]
+        rows, cols = (major, minor) if is_rowwise else (minor, major)
+        if symmetry != "general":
+            keep = rows > cols if symmetry == "skew-symmetric" else rows >= cols
+            rows = rows[keep]
+            cols = cols[keep]
+            if not is_iso:
+                chunk_values = chunk_values[keep]
+        if is_iso:
+            chunk_values = np.broadcast_to(chunk_values[:1], rows.shape)
+        yield rows, cols, chunk_values
+
+
+def _mmwrite_chunks(target, matrix, comment, field, precision, symmetry, chunksize):
+    kind = matrix.dtype.np_type.kind
+    if field is None:
+        if kind in "biu":
+            field = "integer"
+        elif kind == "f":
+            field = "real"
+        elif kind == "c":
+            field = "complex"
+        else:
+            raise ValueError(f"Can't write Matrix with dtype {matrix.dtype} to Matrix Market")
+    field = field.lower()
+    if field not in _FIELDS:
+        raise ValueError(f"Unknown Matrix Market field: {field!r}")
+    symmetry = "general" if symmetry is None else symmetry.lower()
+    if symmetry not in _SYMMETRIES:
+        raise ValueError(f"Unknown Matrix Market symmetry: {symmetry!r}")
+    if field == "complex":
+        value_format = "%.17g %.17g" if precision is None else f"%.{precision}e %.{precision}e"
+    elif field == "integer":
+        value_format = "%d"
+    else:
+        value_format = "%.17g" if precision is None else f"%.{precision}e"
+    f, close = _open(target, "wb")
+    try:
+        write = f.write
+        decode = isinstance(f, io.TextIOBase)
+        with _compressed_buffers(matrix) as buffers:
+            if symmetry == "general":
+                nvals = int(buffers[2][-1])
+            else:
+                nvals = sum(rows.size for rows, _, _ in _iter_chunks(buffers, chunksize, symmetry))
+            header = [f"%%MatrixMarket matrix coordinate {field} {symmetry}"]
+            header.extend(f"%{line}" for line in comment.split("\n"))
+            header.append(f"{matrix._nrows} {matrix._ncols} {nvals}\n")
+            write("\n".join(header) if decode else "\n".join(header).encode())
+            for rows, cols, values in _iter_chunks(buffers, chunksize, symmetry):
+                data = _format_lines(rows, cols, values, field, value_format)
+                write(data.decode() if decode else data)
+    finally:
+        if close:
+            f.close()
+
+
+def _format_lines(rows, cols, values, field, value_format):
+    """Format 1-based coordinates and values as bytes, one entry per line."""
+    if _has_numba and (
+        field == "pattern"
+        or (
+            field == "integer"
+            and (
+                values.dtype.kind in "bi"
+                or (values.dtype.kind == "u" and values.dtype.itemsize < 8)
+            )
+        )
+    ):
+        if field == "pattern":
+            values = np.empty(0, np.int64)
+        else:
+            values = values.astype(np.int64, copy=False)
+        return _format_int_lines(rows, cols, values, field != "pattern").tobytes()
+    rows = (rows + 1).tolist()
+    cols = (cols + 1).tolist()
+    if field == "pattern":
+        lines = map("%d %d\n".__mod__, zip(rows, cols))
+    elif field == "complex":
+        template = f"%d %d {value_format}\n".__mod__
+        lines = map(template, zip(rows, cols, values.real.tolist(), values.imag.tolist()))
+    else:
+        template = f"%d %d {value_format}\n".__mod__
+        lines = map(template, zip(rows, cols, values.tolist()))
+    return "".join(lines).encode()
+
+
+@njit
+def _magnitude(x):  # pragma: no cover (numba)
+    """Absolute value of int64 ``x`` as uint64, which can't overflow for the minimum."""
+    if x < 0:
+        return np.uint64(-(x + 1)) + np.uint64(1)
+    return np.uint64(x)
+
+
+@njit
+def _ndigits(x):  # pragma: no cover (numba)
+    ten = np.uint64(10)
+    n = 1
+    while x >= ten:
+        x //= ten
+        n += 1
+    return n
+
+
+@njit
+def _write_digits(out, end, x):  # pragma: no cover (numba)
+    """Write the digits of uint64 ``x`` ending before ``out[end]``."""
+    ten = np.uint64(10)
+    while True:
+        end -= 1
+        out[end] = 48 + x % ten
+        x //= ten
+        if x == 0:
+            return
+
+
+@njit(parallel=True, nogil=True)
+def _format_int_lines(rows, cols, values, has_values):  # pragma: no cover (numba)
+    n = rows.size
+    one = np.uint64(1)
+    lengths = np.empty(n + 1, np.int64)
+    lengths[0] = 0
+    for i in prange(n):
+        length = _ndigits(np.uint64(rows[i]) + one) + _ndigits(np.uint64(cols[i]) + one) + 2
+        if has_values:
+            val = values[i]
+            length += _ndigits(_magnitude(val)) + 1 + (val < 0)
+        lengths[i + 1] = length
+    offsets = np.cumsum(lengths)
+    out = np.empty(offsets[-1], np.uint8)
+    for i in prange(n):
+        end = offsets[i + 1] - 1
+        out[end] = 10  # newline
+        if has_values:
+            val = values[i]
+            mag = _magnitude(val)
+            start = end - _ndigits(mag)
+            _write_digits(out, end, mag)
+            if val < 0:
+                start -= 1
+                out[start] = 45  # minus sign
+            end = start - 1
+            out[end] = 32  # space
+        col = np.uint64(cols[i]) + one
+        start = end - _ndigits(col)
+        _write_digits(out, end, col)
+        end = start - 1
+        out[end] = 32  # space
+        _write_digits(out, end, np.uint64(rows[i]) + one)
+    return out
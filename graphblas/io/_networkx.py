@@ -31,7 +31,7 @@ def from_networkx(G, nodelist=None, dtype=None, weight="weight", name=None):
 
 
 # TODO: add parameters to allow different networkx classes and attribute names
-def to_networkx(m, edge_attribute="weight"):
+def to_networkx(m, edge_attribute="weight", *, index=None):
     """Create a networkx DiGraph from a square adjacency Matrix.
 
     Parameters
@@ -41,6 +41,8 @@ def to_networkx(m, edge_attribute="weight"):
     edge_attribute : str, optional
         Name of edge attribute from values of Matrix. If None, values will be skipped.
         Default is "weight".
+    index : NodeIndex, optional
+        If given, label nodes with their keys in ``index`` instead of indices.
 
     Returns
     -------
@@ -48,7 +50,7 @@ def to_networkx(m, edge_attribute="weight"):
     """
     import networkx as nx
 
-    rows, cols, vals = m.to_coo()
+    rows, cols, vals = m.to_coo(index=index)
     rows = rows.tolist()
     cols = cols.tolist()
     G = nx.DiGraph()
@@ -0,0 +1,199 @@
+from numbers import Number
+
+import numpy as np
+
+
+class NodeIndex:
+    """Translate between external node keys and GraphBLAS indices.
+
+    Each key is assigned an index ``0, 1, 2, ...`` in the order it is added.  Keys may be
+    integers or strings and do not need to be contiguous.  All methods are vectorized:
+    keys are kept in a sorted NumPy array with the index of each key, so lookups use
+    ``np.searchsorted`` instead of a Python dict.
+
+    >>> index = gb.io.NodeIndex(["a", "b", "c"])
+    >>> A = gb.Matrix.from_edgelist([("a", "b"), ("b", "d")], index=index)
+    >>> index.keys
+    array(['a', 'b', 'c', 'd'], dtype='<U1')
+    >>> rows, cols, values = A.to_coo(index=index)
+
+    Parameters
+    ----------
+    keys : array-like, optional
+        Unique keys to add to the index.
+
+    See Also
+    --------
+    graphblas.io.read_edgelist
+    """
+
+    def __init__(self, keys=None):
+        self._keys = []
+        self._sorted_keys = None
+        self._sorted_ids = None
+        self._size = 0
+        self._is_str = None
+        if keys is not None:
+            keys, _ = _asarray(keys)
+            self.extend(keys)
+            if self._size != keys.size:
+                raise ValueError("keys of NodeIndex must be unique")
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key):
+        return bool(self.get_indexer([key])[0] >= 0)
+
+    def __repr__(self):
+        return f"NodeIndex(size={self._size}, dtype={self.keys.dtype})"
+
+    @property
+    def keys(self):
+        """Array of the key of each index."""
+        if not self._keys:
+            return np.empty(0, np.int64)
+        if len(self._keys) > 1:
+            self._keys = [np.concatenate(self._keys)]
+        return self._keys[0]
+
+    def get_indexer(self, keys):
+        """Return the index of each key, or -1 for keys not in the index.
+
+        Parameters
+        ----------
+        keys : array-like
+
+        Returns
+        -------
+        np.ndarray[dtype=int64]
+        """
+        keys, is_str = _asarray(keys)
+        _check_is_str(self._is_str, is_str)
+        if self._sorted_keys is None:
+            return np.full(keys.shape, -1, np.int64)
+        sorted_keys, keys = _promote(self._sorted_keys, keys)
+        pos = np.searchsorted(sorted_keys, keys)
+        found = pos < sorted_keys.size
+        found[found] = sorted_keys[pos[found]] == keys[found]
+        return np.where(found, self._sorted_ids[np.minimum(pos, sorted_keys.size - 1)], -1)
+
+    def take(self, indices):
+        """Return the key of each index, such as from ``Matrix.to_coo()``.
+
+        Parameters
+        ----------
+        indices : array-like
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.keys[np.asarray(indices, np.int64)]
+
+    def extend(self, keys):
+        """Add keys that are not in the index and return the index of each key.
+
+        New keys are assigned indices in the order they first appear in ``keys``.
+
+        Parameters
+        ----------
+        keys : array-like
+
+        Returns
+        -------
+        np.ndarray[dtype=int64]
+        """
+        keys, is_str = _asarray(keys)
+        self._is_str = _check_is_str(self._is_str, is_str)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        if self._sorted_keys is None:
+            found = np.zeros(unique_keys.size, bool)
+            pos = np.zeros(unique_keys.size, np.intp)
+            unique_ids = np.empty(unique_keys.size, np.int64)
+        else:
+            self._sorted_keys, unique_keys = _promote(self._sorted_keys, unique_keys)
+            pos = np.searchsorted(self._sorted_keys, unique_keys)
+            found = pos < self._sorted_keys.size
+            found[found] = self._sorted_keys[pos[found]] == unique_keys[found]
+            unique_ids = np.empty(unique_keys.size, np.int64)
+            unique_ids[found] = self._sorted_ids[pos[found]]
+        new = ~found
+        if new.any():
+            # Number new keys in order of first appearance; the last assignment wins
+            first = np.empty(unique_keys.size, np.intp)
+            first[inverse[::-1]] = np.arange(inverse.size - 1, -1, -1)
+            order = np.argsort(first[new])
+            new_ids = np.empty(order.size, np.int64)
+            new_ids[order] = np.arange(self._size, self._size + order.size)
+            unique_ids[new] = new_ids
+            self._keys.append(unique_keys[new][order])
+            self._size += order.size
+            if self._sorted_keys is None:
+                self._sorted_keys = unique_keys
+                self._sorted_ids = unique_ids
+            else:
+                self._sorted_keys = np.insert(self._sorted_keys, pos[new], unique_keys[new])
+                self._sorted_ids = np.insert(self._sorted_ids, pos[new], new_ids)
+        return unique_ids[inverse].reshape(keys.shape)
+
+
+def _asarray(keys):
+    """Convert keys to an array without losing precision of large integers.
+
+    Returns the array and whether the keys are strings, or None if there are no keys.
+    """
+    if isinstance(keys, np.ndarray):
+        array = keys
+    else:
+        array = np.asarray(keys)
+        if array.dtype.kind in "fUS":
+            # NumPy converts lists mixing int64 and uint64 values (or ints and floats) to
+            # float64, and lists mixing numbers and strings to strings
+            objects = np.asarray(keys, dtype=object)
+            is_str = _is_str(objects)
+            if array.dtype.kind == "f" and any(
+                isinstance(key, (int, np.integer)) for key in objects.flat
+            ):
+                array = objects
+            return array, is_str
+    if array.dtype.kind == "O":
+        return array, _is_str(array)
+    return array, array.dtype.kind in "US" if array.size > 0 else None
+
+
+def _is_str(objects):
+    """Whether an object array has strings or numbers; raise TypeError if they are mixed."""
+    is_str = [isinstance(key, (str, bytes)) for key in objects.flat]
+    if not is_str:
+        return None
+    if all(is_str):
+        return True
+    if any(is_str) or not all(isinstance(key, Number) for key in objects.flat):
+        raise TypeError("keys of NodeIndex must be all strings or all numbers")
+    return False
+
+
+def _check_is_str(index_is_str, is_str):
+    """Raise if string keys are used with an index of numbers or vice versa."""
+    if index_is_str is None:
+        return is_str
+    if is_str is not None and is_str != index_is_str:
+        raise TypeError(
+            "keys of NodeIndex must be all strings or all numbers; got "
+            f"{'string' if is_str else 'number'} keys for an index with "
+            f"{'string' if index_is_str else 'number'} keys"
+        )
+    return index_is_str
+
+
+def _promote(sorted_keys, keys):
+    """Cast sorted keys and keys to a common dtype so they can be compared."""
+    if keys.dtype == sorted_keys.dtype:
+        return sorted_keys, keys
+    kinds = {sorted_keys.dtype.kind, keys.dtype.kind}
+    dtype = np.result_type(sorted_keys, keys)
+    if kinds & {"i", "u"} and dtype.kind not in "iu":
+        # Mixing int64 with uint64 or floats would lose precision as float64
+        dtype = np.dtype(object)
+    return sorted_keys.astype(dtype, copy=False), keys.astype(dtype, copy=False)
@@ -1,3 +1,7 @@
+from ..core.ss.adaptive import AdaptiveContext
+from ..core.ss.burble import BurbleCapture, BurbleRecord, parse_burble
+from ..core.ss.shared import SharedMemoryHandle
+from ..core.ss.tiled import TiledMatrix
 from ._core import _IS_SSGB7, about, concat, config, diag
 
 if not _IS_SSGB7:
@@ -0,0 +1,148 @@
+import pytest
+
+import graphblas as gb
+from graphblas import binary, monoid, unary
+from graphblas.core.deferred import _compute_chain
+
+
+@pytest.fixture
+def _defer():
+    with gb.config.set(defer=True):
+        yield
+
+
+@pytest.fixture
+def A():
+    return gb.Matrix.from_coo(
+        [0, 0, 1, 2, 2], [0, 2, 1, 0, 2], [1.0, -2, 3, -4, 5], nrows=3, ncols=3, name="A"
+    )
+
+
+@pytest.fixture
+def v():
+    return gb.Vector.from_coo([0, 2, 3], [1.0, -2, 3], size=4, name="v")
+
+
+def steps(expr):
+    assert expr.args[-2] is _compute_chain
+    return expr.args[-1][0]
+
+
+def test_defer_disabled(A):
+    expr = A.apply(unary.abs)
+    with pytest.raises(TypeError, match="autocompute"):
+        expr.select("tril")
+
+
+@pytest.mark.usefixtures("_defer")
+def test_chain_matches_eager(A, v):
+    expected = A.apply(unary.abs).new().select("tril").new().reduce_rowwise().new()
+    expr = A.apply(unary.abs).select("tril").reduce_rowwise()
+    assert type(expr) is gb.core.vector.VectorExpression
+    assert expr.size == 3
+    assert expr.dtype == gb.dtypes.FP64
+    assert expr.new().isequal(expected)
+    # Can compute again
+    assert expr.new().isequal(expected)
+    expected = A.ewise_mult(A, binary.times).new().select("valuegt", 2).new().reduce_scalar().new()
+    result = A.ewise_mult(A, binary.times).select("valuegt", 2).reduce_scalar().new()
+    assert result == expected
+    expected = v.apply(unary.ainv).new().ewise_mult(v, binary.plus).new()
+    assert v.apply(unary.ainv).ewise_mult(v, binary.plus).new().isequal(expected)
+    expected = A.mxm(A).new().mxv(v[:3].new()).new()
+    assert A.mxm(A).mxv(v[:3].new()).new().isequal(expected)
+    expected = A[:2, :].new().apply(unary.abs).new()
+    assert A[:2, :].apply(unary.abs).new().isequal(expected)
+
+
+@pytest.mark.usefixtures("_defer")
+def test_chain_repr(A):
+    expr = A.apply(unary.abs).select("tril").reduce_rowwise(monoid.max)
+    assert expr._format_expr() == (
+        "A.apply(unary.abs[FP64]).select(select.tril[BOOL], thunk=False)"
+        ".reduce_rowwise(monoid.max[FP64])"
+    )
+    assert "A.apply(unary.abs[FP64]).select(" in repr(expr)
+
+
+@pytest.mark.usefixtures("_defer")
+def test_chain_materialize(A):
+    expected = A.apply(unary.abs).new().select("triu").new()
+    expr = A.apply(unary.abs).select("triu")
+    assert expr.nvals == expected.nvals
+    assert expr.wait().isequal(expected)
+    assert expr.new().isequal(expected)
+    with gb.config.set(autocompute=True):
+        assert expr.isequal(expected)
+
+
+@pytest.mark.usefixtures("_defer")
+def test_positional_select_before_apply(A):
+    expr = A.apply(unary.abs).apply(binary.plus, right=1).select("tril")
+    s = steps(expr)
+    assert [step.method_name for step, _ in s] == ["select", "apply", "apply"]
+    assert s[0][0].args[0] is A
+    expected = A.apply(unary.abs).new().apply(binary.plus, right=1).new().select("tril").new()
+    assert expr.new().isequal(expected)
+    # Selecting by value must not be moved
+    expr = A.apply(unary.ainv).select("valuegt", 0)
+    assert [step.method_name for step, _ in steps(expr)] == ["apply", "select"]
+    assert expr.new().nvals == 2
+
+
+@pytest.mark.usefixtures("_defer")
+def test_apply_reduce_as_mxv(A):
+    for method in ["reduce_rowwise", "reduce_columnwise"]:
+        expected = getattr(A.apply(binary.times, right=2).new(), method)().new()
+        expr = getattr(A.apply(binary.times, right=2), method)()
+        s = steps(expr)
+        assert len(s) == 1
+        assert s[0][0].method_name == "mxv"
+        with gb.Recorder() as rec:
+            result = expr.new()
+        assert result.isequal(expected)
+        assert not any("apply" in line for line in rec.data)
+    # Left-bound scalar is not fused
+    expr = A.apply(binary.minus, left=2).reduce_rowwise()
+    assert [step.method_name for step, _ in steps(expr)] == ["apply", "reduce_rowwise"]
+    assert expr.new().isequal(A.apply(binary.minus, left=2).new().reduce_rowwise().new())
+
+
+@pytest.mark.usefixtures("_defer")
+def test_mask_pushdown(A):
+    M = gb.Matrix.from_coo([0, 2], [0, 2], [True, True], nrows=3, ncols=3, name="M")
+    expected = A.apply(unary.ainv).new().select("valuegt", -2).new(mask=M.S)
+    expr = A.apply(unary.ainv).select("valuegt", -2)
+    with gb.Recorder() as rec:
+        result = expr.new(mask=M.S)
+    assert result.isequal(expected)
+    assert all(", M, NULL" in line for line in rec.data if "apply" in line or "select" in line)
+    # Not element-wise, so the mask is only used for the output
+    expected = A.mxm(A).new().apply(unary.ainv).new(mask=M.S)
+    assert A.mxm(A).apply(unary.ainv).new(mask=M.S).isequal(expected)
+
+
+@pytest.mark.usefixtures("_defer")
+def test_ewise_add_as_accum(A):
+    B = gb.Matrix.from_coo([0, 1], [1, 1], [10.0, 20.0], nrows=3, ncols=3, name="B")
+    expected = A.apply(unary.abs).new().ewise_add(B, binary.minus).new()
+    C = gb.Matrix(float, 3, 3, name="C")
+    with gb.Recorder() as rec:
+        C << A.apply(unary.abs).ewise_add(B, binary.minus)
+    assert C.isequal(expected)
+    assert not any("eWiseAdd" in line for line in rec.data)
+    M = gb.Matrix.from_coo([0, 1], [1, 1], [True, True], nrows=3, ncols=3, name="M")
+    C(M.S, replace=True) << A.apply(unary.abs).ewise_add(B, monoid.plus)
+    expected = A.apply(unary.abs).new().ewise_add(B, monoid.plus).new(mask=M.S)
+    assert C.isequal(expected)
+    # Using the output as an input
+    expected = A.apply(unary.abs).new().ewise_add(A, binary.minus).new()
+    A << A.apply(unary.abs).ewise_add(A, binary.minus)
+    assert A.isequal(expected)
+
+
+@pytest.mark.usefixtures("_defer")
+def test_temporaries_cleared(A):
+    expr = A.apply(unary.abs).select("valuegt", 1).apply(unary.ainv)
+    expr.new()
+    assert all(temp.nvals == 0 for _, temp in steps(expr))
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import pytest
+
+import graphblas as gb
+from graphblas import binary, monoid, semiring
+
+
+@pytest.fixture
+def A():
+    return gb.Matrix.from_coo([0, 1, 2], [1, 2, 0], [1, 2, 3], nrows=3, ncols=3, name="A")
+
+
+def test_executor_new(A):
+    with gb.Executor(2) as executor:
+        futures = [executor.new(A.mxm(A, semiring.min_plus), name=f"C{i}") for i in range(4)]
+        future = executor.new(A.reduce_scalar(monoid.max))
+        results = [f.result() for f in futures]
+        assert future.result() == 3
+        assert executor.new(A @ A, float).result().dtype == "FP64"
+        with pytest.raises(TypeError, match="expects an expression"):
+            executor.new(A)
+    expected = A.mxm(A, semiring.min_plus).new()
+    for i, C in enumerate(results):
+        assert C.name == f"C{i}"
+        assert C.isequal(expected)
+    assert "max_workers=2" in repr(executor)
+
+
+def test_executor_update(A):
+    C = A.dup()
+    M = gb.Matrix.from_coo([0], [1], [True], nrows=3, ncols=3)
+    with gb.Executor(1) as executor:
+        assert executor.update(C, A.ewise_add(A, binary.plus)).result() is C
+        assert C.isequal(A.apply(binary.times, right=2).new())
+        assert executor.update(C(M.S, accum=binary.plus), A).result() is C
+        assert C[0, 1].new() == 3
+        assert executor.update(C[0, 1], 0).result() is C
+        assert C[0, 1].new() == 0
+        with pytest.raises(TypeError, match="Options"):
+            executor.update(C(M.S), A, accum=binary.plus)
+
+
+def test_executor_async(A):
+    async def main(executor):
+        C, D = await asyncio.gather(
+            executor.new_async(A.mxm(A)),
+            executor.new_async(A.T),
+        )
+        await executor.update_async(D, D.ewise_mult(D))
+        return C, D
+
+    with gb.Executor(2) as executor:
+        C, D = asyncio.run(main(executor))
+    assert C.isequal(A.mxm(A).new())
+    assert D.isequal(A.T.ewise_mult(A.T).new())
+
+
+def test_executor_recorder(A):
+    threads = set()
+    with gb.Executor(1) as executor, gb.Recorder() as rec:
+        executor.submit(lambda: threads.add(threading.current_thread().name)).result()
+        executor.new(A.apply(binary.plus, right=1), name="B").result()
+    assert threads.pop().startswith("graphblas")
+    assert rec.data == [
+        "GrB_Matrix_new(&B, GrB_INT64, 3, 3);",
+        "GrB_Matrix_apply_BinaryOp2nd_INT64(B, NULL, NULL, GrB_PLUS_INT64, A, 1, NULL);",
+    ]
+
+
+def test_executor_run(A):
+    graphs = [A.apply(binary.times, right=i).new() for i in range(1, 6)]
+    with gb.Executor(3) as executor:
+        results = executor.run([G.mxm(G) for G in graphs] + [lambda: 42])
+        assert results[-1] == 42
+        for G, C in zip(graphs, results):
+            assert C.isequal(G.mxm(G).new())
+        assert executor.run([]) == []
+        with pytest.raises(TypeError, match="expressions or callables"):
+            executor.run([A.T, A])
+
+
+@pytest.mark.skipif("gb.backend != 'suitesparse'")
+def test_executor_nthreads():
+    config = gb.ss.config
+    prev = config["nthreads"]
+    try:
+        config["nthreads"] = 8
+        executor = gb.Executor(3)
+        assert (executor.nthreads, executor._extra_threads) == (2, 2)
+        executor.shutdown()
+        config["nthreads"] = 2
+        executor = gb.Executor(4)
+        assert (executor.nthreads, executor._extra_threads) == (1, 0)
+        executor.shutdown()
+    finally:
+        config["nthreads"] = prev
+    assert gb.Executor(4, nthreads=3).nthreads == 3
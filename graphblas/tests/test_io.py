@@ -1,3 +1,4 @@
+import gzip
 from io import BytesIO, StringIO
 
 import numpy as np
@@ -35,6 +36,16 @@ try:
 except ImportError:  # pragma: no cover (import)
     fmm = None
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover (import)
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover (import)
+    pa = None
+
 suitesparse = gb.backend == "suitesparse"
 
 
@@ -359,6 +370,351 @@ def test_matrix_market_bad_engine():
         gb.io.mmread(mm_out, engine="bad_engine")
 
 
+@pytest.mark.skipif("not ss")
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 100])
+def test_mmread_chunksize(chunksize):
+    try:
+        from scipy.io.tests import test_mmio
+    except ImportError:
+        # Test files are mysteriously missing from some conda-forge builds
+        pytest.skip("scipy.io.tests.test_mmio unavailable :(")
+    examples = [name for name in dir(test_mmio) if name.endswith("_example")]
+    assert examples
+    for example in examples:
+        text = getattr(test_mmio, example)
+        if "over64bit" in example:
+            with pytest.raises(ValueError, match="int64"):
+                gb.io.mmread(StringIO(text), chunksize=chunksize)
+            continue
+        expected = gb.io.mmread(StringIO(text), "scipy")
+        for mm_in in [StringIO(text), BytesIO(text.encode())]:
+            M = gb.io.mmread(mm_in, chunksize=chunksize, name="M")
+            assert M.name == "M"
+            assert M.isequal(expected, check_dtype=True), example
+
+
+def test_mmread_chunksize_streaming(tmp_path):
+    string = """%%MatrixMarket matrix coordinate real general
+        % comment
+        3 3 4
+        1 3 1
+        2 2 2
+
+        3 1 3
+        3 1 4"""
+    for chunksize in [1, 2, 3, 10]:
+        with pytest.raises(ValueError, match="Duplicate indices found"):
+            gb.io.mmread(StringIO(string), chunksize=chunksize)
+        M = gb.io.mmread(StringIO(string), dup_op=gb.binary.plus, chunksize=chunksize)
+        assert M.isequal(Matrix.from_coo([0, 1, 2], [2, 1, 0], [1.0, 2, 7]), check_dtype=True)
+
+    # Pattern symmetric with many rows so that rows are split into bands
+    n = 100
+    rows = np.arange(n)
+    cols = (rows * 7) % n
+    lines = "\n".join(f"{i + 1} {j + 1}" for i, j in zip(rows, cols) if i >= j)
+    nvals = lines.count("\n") + 1
+    string = f"%%MatrixMarket matrix coordinate pattern symmetric\n{n} {n} {nvals}\n{lines}\n"
+    path = tmp_path / "pattern.mtx.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(string)
+    A = Matrix.from_coo(rows, cols, 1.0, nrows=n, ncols=n)
+    A = A.select("tril").new()
+    expected = A.ewise_add(A.T, gb.binary.first).new()
+    for chunksize in [1, 7, 1000]:
+        M = gb.io.mmread(path, chunksize=chunksize)
+        assert M.isequal(expected, check_dtype=True)
+        M = gb.io.mmread(str(path), chunksize=chunksize, dup_op=gb.binary.plus)
+        assert M.isequal(expected, check_dtype=True)
+
+    with pytest.raises(ValueError, match="chunksize must be positive"):
+        gb.io.mmread(StringIO(string), chunksize=0)
+    with pytest.raises(TypeError, match="parallelism"):
+        gb.io.mmread(StringIO(string), chunksize=10, parallelism=2)
+    with pytest.raises(ValueError, match="banner"):
+        gb.io.mmread(
+            StringIO("%%MatrixMarket tensor coordinate real general\n1 1 0\n"), chunksize=1
+        )
+    with pytest.raises(ValueError, match="Expected 2 entries"):
+        gb.io.mmread(
+            StringIO("%%MatrixMarket matrix coordinate real general\n2 2 2\n1 1 1.5\n"),
+            chunksize=1,
+        )
+    with pytest.raises(gb.exceptions.IndexOutOfBound, match="file: 3"):
+        gb.io.mmread(
+            StringIO("%%MatrixMarket matrix coordinate real general\n2 2 1\n3 1 1.5\n"),
+            chunksize=1,
+        )
+    with pytest.raises(gb.exceptions.IndexOutOfBound, match="file: 0"):
+        gb.io.mmread(
+            StringIO("%%MatrixMarket matrix coordinate real general\n2 2 2\n1 1 1\n0 1 1\n"),
+            chunksize=2,
+        )
+    # A single band of rows is named like any new Matrix
+    M = gb.io.mmread(
+        StringIO("%%MatrixMarket matrix coordinate real general\n1 3 1\n1 2 5\n"), chunksize=1
+    )
+    assert M.name
+    assert "M_" in repr(M)
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 1000])
+def test_mmwrite_chunksize(tmp_path, chunksize):
+    A = Matrix.from_coo([0, 1, 2, 2], [0, 1, 0, 3], [1, -25, 300, 4], nrows=3, ncols=4)
+    for dtype in ["BOOL", "INT8", "UINT16", "INT64", "FP32", "FP64", "FC64"]:
+        if dtype == "FC64" and not dtypes._supports_complex:
+            continue
+        B = A.dup(dtype=dtype)
+        if dtype == "FP64":
+            B[0, 0] = 1 / 3
+        for M, expected in [(B, B), (B.T, B.T.new())]:
+            mm_out = BytesIO()
+            gb.io.mmwrite(mm_out, M, chunksize=chunksize, comment="one\ntwo")
+            text = mm_out.getvalue().decode()
+            assert text.startswith("%%MatrixMarket matrix coordinate ")
+            assert "\n%one\n%two\n" in text
+            mm_out.seek(0)
+            assert gb.io.mmread(mm_out).isequal(expected, check_dtype=False), dtype
+    # Values too large for int64 are written exactly
+    U = Matrix.from_coo([0, 1], [1, 0], [2**64 - 1, 2**63], dtype="UINT64")
+    mm_out = BytesIO()
+    gb.io.mmwrite(mm_out, U, chunksize=chunksize)
+    assert mm_out.getvalue().endswith(b"2 2 2\n1 2 18446744073709551615\n2 1 9223372036854775808\n")
+    # Text file-like objects, iso values, and the pattern field
+    iso = Matrix(int, 3, 4)
+    iso(A.S) << 7
+    mm_out = StringIO()
+    gb.io.mmwrite(mm_out, iso, chunksize=chunksize)
+    mm_out.seek(0)
+    assert gb.io.mmread(mm_out).isequal(iso)
+    # The int64 minimum has no positive counterpart
+    M = Matrix.from_coo([0, 9], [0, 0], [np.iinfo(np.int64).min, np.iinfo(np.int64).max])
+    mm_out = BytesIO()
+    gb.io.mmwrite(mm_out, M, chunksize=chunksize)
+    assert mm_out.getvalue().endswith(b"\n1 1 -9223372036854775808\n10 1 9223372036854775807\n")
+    mm_out.seek(0)
+    assert gb.io.mmread(mm_out).isequal(M)
+    mm_out = BytesIO()
+    gb.io.mmwrite(mm_out, A, chunksize=chunksize, field="pattern")
+    mm_out.seek(0)
+    assert gb.io.mmread(mm_out).isequal(A.apply(gb.unary.one).new(), check_dtype=False)
+    # Only the lower triangle is written for symmetric files
+    S = Matrix.from_coo([0, 1, 1, 2], [0, 0, 1, 1], [1.5, 2, 3, 4], nrows=3, ncols=3)
+    S = S.ewise_add(S.T, gb.binary.first).new()
+    path = tmp_path / "symmetric.mtx.gz"
+    gb.io.mmwrite(path, S, chunksize=chunksize, symmetry="symmetric", precision=3)
+    with gzip.open(path, "rt") as f:
+        text = f.read()
+    assert "real symmetric\n%\n3 3 4\n" in text
+    assert "1 1 1.500e+00\n" in text
+    assert gb.io.mmread(path, chunksize=chunksize).isequal(S)
+    K = S.dup()
+    K << gb.select.offdiag(K)
+    K(K.select("triu").new().S) << gb.unary.ainv(K)
+    gb.io.mmwrite(str(path), K, chunksize=chunksize, symmetry="skew-symmetric")
+    assert gb.io.mmread(path).isequal(K)
+    # Empty and hypersparse
+    for M in [Matrix(float, 3, 4), Matrix.from_coo([5], [2], [1.5], nrows=2**50, ncols=10)]:
+        gb.io.mmwrite(path, M, chunksize=chunksize)
+        assert gb.io.mmread(path).isequal(M)
+    if suitesparse:
+        # Bitmap and full matrices keep their format
+        for sparsity in ["bitmap", "full"]:
+            M = Matrix.from_dense(np.arange(12).reshape(3, 4), missing_value=0)
+            if sparsity == "full":
+                M[0, 0] = 0
+            M.ss.config["sparsity_control"] = [sparsity]
+            M.ss.config["sparsity_control"] = "auto"
+            assert M.ss.format == f"{sparsity}r"
+            for T, expected in [(M, M), (M.T, M.T.new())]:
+                gb.io.mmwrite(path, T, chunksize=chunksize)
+                assert M.ss.format == f"{sparsity}r"
+                assert gb.io.mmread(path).isequal(expected)
+
+    with pytest.raises(ValueError, match="chunksize must be positive"):
+        gb.io.mmwrite(BytesIO(), A, chunksize=0)
+    with pytest.raises(TypeError, match="cols"):
+        gb.io.mmwrite(BytesIO(), A, chunksize=1, cols=4)
+    with pytest.raises(ValueError, match="field"):
+        gb.io.mmwrite(BytesIO(), A, chunksize=1, field="bad")
+    with pytest.raises(ValueError, match="symmetry"):
+        gb.io.mmwrite(BytesIO(), A, chunksize=1, symmetry="bad")
+
+
+@pytest.mark.skipif("not pd")
+@pytest.mark.parametrize("chunksize", [1, 2, 1000])
+def test_read_edgelist(tmp_path, chunksize):
+    text = "src,dst,w\nx,y,1.5\ny,z,2\nx,y,3\nw,x,4\n"
+    A, keys = gb.io.read_edgelist(
+        StringIO(text), "src", "dst", "w", dup_op=gb.binary.plus, chunksize=chunksize, format="csv"
+    )
+    np.testing.assert_array_equal(keys, ["x", "y", "z", "w"])
+    expected = Matrix.from_coo([0, 1, 3], [1, 2, 0], [4.5, 2, 4], nrows=4, ncols=4)
+    assert A.isequal(expected, check_dtype=True)
+    with pytest.raises(ValueError, match="Duplicate indices found"):
+        gb.io.read_edgelist(StringIO(text), "src", "dst", "w", chunksize=chunksize, format="csv")
+    A, keys = gb.io.read_edgelist(StringIO(text), "src", "dst", chunksize=chunksize, format="csv")
+    assert A.isequal(expected.apply(gb.unary.one).new(), check_dtype=True)
+    # Many new nodes in later chunks, so bands of rows are added and merged
+    rng = np.random.default_rng(0)
+    src = rng.integers(0, 1000, 300) * np.arange(1, 301)
+    dst = rng.integers(0, 1000, 300) * np.arange(1, 301)
+    w = rng.integers(0, 10, 300)
+    text = "".join(f"{s},{d},{x}\n" for s, d, x in zip(src, dst, w))
+    A, keys = gb.io.read_edgelist(
+        StringIO(text),
+        0,
+        1,
+        2,
+        dup_op=gb.binary.plus,
+        chunksize=chunksize,
+        format="csv",
+        header=None,
+    )
+    ids = gb.io.NodeIndex().extend(np.column_stack([src, dst]).ravel())
+    expected = Matrix.from_coo(
+        ids[0::2], ids[1::2], w, nrows=len(keys), ncols=len(keys), dup_op=gb.binary.plus
+    )
+    assert A.isequal(expected, check_dtype=True)
+    assert "M_" in repr(A)
+
+    # Sparse integer keys by position in a compressed TSV file without a header
+    path = tmp_path / "edges.tsv.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("2000000000000\t7\textra\n7\t-5\textra\n-5\t2000000000000\textra\n")
+    A, keys = gb.io.read_edgelist(path, 0, 1, chunksize=chunksize, header=None, name="A")
+    assert A.name == "A"
+    np.testing.assert_array_equal(keys, [2000000000000, 7, -5])
+    expected = Matrix.from_coo([0, 1, 2], [1, 2, 0], 1.0, nrows=3, ncols=3)
+    assert A.isequal(expected, check_dtype=True)
+    A, keys = gb.io.read_edgelist(
+        str(path), 1, 0, dtype=int, dup_op=gb.binary.plus, chunksize=chunksize, header=None
+    )
+    np.testing.assert_array_equal(keys, [7, 2000000000000, -5])
+    assert A.isequal(Matrix.from_coo([0, 2, 1], [1, 0, 2], 1, nrows=3, ncols=3))
+
+    A, keys = gb.io.read_edgelist(StringIO("a,b\n"), "a", "b", format="csv")
+    assert A.shape == (0, 0)
+    assert keys.size == 0
+    with pytest.raises(ValueError, match="chunksize must be positive"):
+        gb.io.read_edgelist(path, chunksize=0)
+    with pytest.raises(ValueError, match="format must be"):
+        gb.io.read_edgelist(path, format="json")
+    with pytest.raises(ValueError, match="format must be given"):
+        gb.io.read_edgelist(StringIO(text))
+
+
+def test_node_index():
+    index = gb.io.NodeIndex(["b", "a", "c"])
+    assert len(index) == 3
+    assert "a" in index
+    assert "z" not in index
+    np.testing.assert_array_equal(index.keys, ["b", "a", "c"])
+    np.testing.assert_array_equal(index.get_indexer(["c", "z", "b"]), [2, -1, 0])
+    np.testing.assert_array_equal(index.take([2, 0]), ["c", "b"])
+    np.testing.assert_array_equal(index.extend(["d", "a", "e", "d"]), [3, 1, 4, 3])
+    np.testing.assert_array_equal(index.keys, ["b", "a", "c", "d", "e"])
+    assert repr(index) == "NodeIndex(size=5, dtype=<U1)"
+    with pytest.raises(ValueError, match="unique"):
+        gb.io.NodeIndex([1, 2, 1])
+
+    empty = gb.io.NodeIndex()
+    assert len(empty) == 0
+    assert empty.keys.size == 0
+    np.testing.assert_array_equal(empty.get_indexer([1, 2]), [-1, -1])
+    # Large int64 and uint64 keys are compared exactly
+    index = gb.io.NodeIndex(np.array([-5, 2**62], np.int64))
+    np.testing.assert_array_equal(index.extend(np.array([2**63 + 1, 2**62], np.uint64)), [2, 1])
+    np.testing.assert_array_equal(index.get_indexer(np.array([2**63 + 1], np.uint64)), [2])
+    np.testing.assert_array_equal(index.get_indexer(np.array([2**62 + 1], np.int64)), [-1])
+    np.testing.assert_array_equal(index.extend([[-5, 7], [7, 8]]), [[0, 3], [3, 4]])
+    # Integer keys aren't compared as floats
+    index = gb.io.NodeIndex([5, 3])
+    np.testing.assert_array_equal(index.extend([2**63 + 1, 3, 7]), [2, 1, 3])
+    assert index.keys.tolist() == [5, 3, 2**63 + 1, 7]
+    np.testing.assert_array_equal(index.get_indexer([2**63, 2**63 + 1]), [-1, 2])
+    np.testing.assert_array_equal(index.extend(np.array([2.5, 3.0])), [4, 1])
+    np.testing.assert_array_equal(index.get_indexer([2.5, 7.0, 7.5]), [4, 3, -1])
+    assert index.keys.tolist() == [5, 3, 2**63 + 1, 7, 2.5]
+    index = gb.io.NodeIndex(np.array([2**53 + 1]))
+    np.testing.assert_array_equal(index.get_indexer(np.array([2.0**53])), [-1])
+    # Strings and numbers aren't mixed
+    index = gb.io.NodeIndex(["a", "b"])
+    with pytest.raises(TypeError, match="all strings or all numbers"):
+        index.extend([1, 2])
+    with pytest.raises(TypeError, match="all strings or all numbers"):
+        gb.io.NodeIndex([1]).get_indexer(["1"])
+    np.testing.assert_array_equal(index.keys, ["a", "b"])
+    for keys in [["a", 3], [1, "a"], np.array([1, "a"], object)]:
+        with pytest.raises(TypeError, match="all strings or all numbers"):
+            gb.io.NodeIndex().extend(keys)
+    index = gb.io.NodeIndex([5, 3])
+    index.extend([2**63 + 1])
+    assert index.keys.dtype == object
+    with pytest.raises(TypeError, match="all strings or all numbers"):
+        index.extend(["a"])
+    with pytest.raises(TypeError, match="all strings or all numbers"):
+        index.get_indexer(np.array(["a"], object))
+    np.testing.assert_array_equal(index.extend([7, 2**63 + 1]), [3, 2])
+    index = gb.io.NodeIndex()
+    index.extend([])
+    np.testing.assert_array_equal(index.extend(np.array(["x", "y"], object)), [0, 1])
+
+    # Integration with Matrix and Vector methods
+    index = gb.io.NodeIndex(["a", "b", "c"])
+    A = Matrix.from_edgelist([("a", "b", 1), ("b", "d", 2)], index=index)
+    assert A.shape == (4, 4)
+    assert A.isequal(Matrix.from_coo([0, 1], [1, 3], [1, 2], nrows=4, ncols=4))
+    rows, cols, values = A.to_coo(index=index)
+    np.testing.assert_array_equal(rows, ["a", "b"])
+    np.testing.assert_array_equal(cols, ["b", "d"])
+    np.testing.assert_array_equal(values, [1, 2])
+    rows, cols, values = A.T.to_coo(index=index, values=False)
+    np.testing.assert_array_equal(rows, ["b", "d"])
+    assert values is None
+    edges, values = A.to_edgelist(index=index)
+    np.testing.assert_array_equal(edges, [["a", "b"], ["b", "d"]])
+    assert A.to_dicts(index=index) == {"a": {"b": 1}, "b": {"d": 2}}
+    assert A.to_dicts("columnwise", index=index) == {"b": {"a": 1}, "d": {"b": 2}}
+    assert A.T.to_dicts(index=index) == {"b": {"a": 1}, "d": {"b": 2}}
+    v = A.reduce_columnwise().new()
+    assert v.to_dict(index=index) == {"b": 1, "d": 2}
+    indices, values = v.to_coo(index=index)
+    np.testing.assert_array_equal(indices, ["b", "d"])
+    B = Matrix.from_edgelist(np.array([["a", "e"]]), index=index, nrows=6, ncols=6)
+    assert B.shape == (6, 6)
+    assert len(index) == 5
+    if nx is not None:
+        G = gb.io.to_networkx(A, index=index)
+        assert set(G.edges(data="weight")) == {("a", "b", 1), ("b", "d", 2)}
+
+    # Reading several edge lists with the same index
+    if pd is not None:
+        A, keys = gb.io.read_edgelist(
+            StringIO("x,b\nb,x\n"), format="csv", index=index, header=None
+        )
+        assert A.shape == (6, 6)
+        assert keys is index.keys
+        np.testing.assert_array_equal(keys, ["a", "b", "c", "d", "e", "x"])
+        assert A.isequal(Matrix.from_coo([5, 1], [1, 5], 1.0, nrows=6, ncols=6))
+
+
+@pytest.mark.skipif("not pa")
+def test_read_edgelist_parquet(tmp_path):  # pragma: no cover (pyarrow)
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "edges.parquet"
+    table = pa.table({"w": [1.5, 2.0, 4.0], "src": ["x", "y", "w"], "dst": ["y", "z", "x"]})
+    pq.write_table(table, path, row_group_size=2)
+    for chunksize in [1, 2, 1000]:
+        A, keys = gb.io.read_edgelist(path, "src", "dst", "w", chunksize=chunksize)
+        np.testing.assert_array_equal(keys, ["x", "y", "z", "w"])
+        expected = Matrix.from_coo([0, 1, 3], [1, 2, 0], [1.5, 2, 4], nrows=4, ncols=4)
+        assert A.isequal(expected, check_dtype=True)
+        A, keys = gb.io.read_edgelist(path, 1, 2, chunksize=chunksize)
+        assert A.isequal(expected.apply(gb.unary.one).new(), check_dtype=True)
+
+
 @pytest.mark.skipif("not ss")
 def test_scipy_sparse():
     a = np.arange(12).reshape(3, 4)
@@ -376,6 +732,135 @@ def test_scipy_sparse():
                 assert (sa != sa2).nnz == 0
 
 
+@pytest.mark.skipif("not pa")
+@pytest.mark.parametrize("dtype", ["BOOL", "INT8", "UINT64", "FP32", "FP64"])
+def test_arrow_roundtrip(dtype):
+    A = Matrix.from_coo([0, 1, 3, 3], [1, 0, 0, 4], [1, 2, 3, 0], dtype=dtype, nrows=5, ncols=6)
+    batch = gb.io.to_arrow(A)
+    assert batch.schema.names == ["row", "col", "value"]
+    assert batch.column(0).type == pa.int64()
+    assert batch.column(0).to_pylist() == [0, 1, 3, 3]
+    assert batch.column(1).to_pylist() == [1, 0, 0, 4]
+    B = gb.io.from_arrow(batch, name="B")
+    assert B.name == "B"
+    assert B.isequal(A, check_dtype=True)
+    assert "M_" in repr(gb.io.from_arrow(batch))
+    assert gb.io.from_arrow(pa.Table.from_batches([batch])).isequal(A, check_dtype=True)
+    assert gb.io.from_arrow(gb.io.to_arrow(A.T)).isequal(A.T.new(), check_dtype=True)
+    for chunksize in [1, 3, 100]:
+        reader = gb.io.to_arrow(A, chunksize=chunksize)
+        assert isinstance(reader, pa.RecordBatchReader)
+        assert gb.io.from_arrow(reader).isequal(A, check_dtype=True)
+    # CSR and CSC as lists of structs
+    csr = gb.io.to_arrow(A, "csr")
+    assert len(csr) == 5
+    assert [field.name for field in csr.type.value_type] == ["col", "value"]
+    assert gb.io.from_arrow(csr, ncols=6).isequal(A, check_dtype=True)
+    assert gb.io.from_arrow(csr[1:]).isequal(A[1:, :5].new(), check_dtype=True)
+    csc = gb.io.to_arrow(A, "csc")
+    assert [field.name for field in csc.type.value_type] == ["row", "value"]
+    assert gb.io.from_arrow(csc, ncols=5).isequal(A.T.new(), check_dtype=True)
+    assert gb.io.from_arrow(gb.io.to_arrow(A.T, "csr"), ncols=5).isequal(A.T.new())
+    # Vectors
+    v = Vector.from_coo([1, 4], [1, 0], dtype=dtype, size=7)
+    batch = gb.io.to_arrow(v)
+    assert batch.schema.names == ["index", "value"]
+    assert gb.io.from_arrow(batch).isequal(v, check_dtype=True)
+    assert gb.io.from_arrow(gb.io.to_arrow(v, chunksize=1)).isequal(v, check_dtype=True)
+
+
+@pytest.mark.skipif("not pa")
+def test_arrow():
+    # Iso-valued and hypersparse
+    A = Matrix(int, 3, 4)
+    A(Matrix.from_coo([0, 2], [1, 3], 1, nrows=3, ncols=4).S) << 7
+    assert gb.io.from_arrow(gb.io.to_arrow(A)).isequal(A, check_dtype=True)
+    assert gb.io.from_arrow(gb.io.to_arrow(A, "csr"), ncols=4).isequal(A, check_dtype=True)
+    H = Matrix.from_coo([5, 2**40], [2, 0], [1.5, 2.5], nrows=2**50, ncols=10)
+    assert gb.io.from_arrow(gb.io.to_arrow(H)).isequal(H, check_dtype=True)
+    v = Vector(float, 2**50)
+    assert gb.io.from_arrow(gb.io.to_arrow(v)).isequal(v, check_dtype=True)
+    # Give ownership of the memory to Arrow
+    A = Matrix.from_coo([0, 1, 1], [1, 0, 2], [1.5, 2, 3])
+    B = A.dup()
+    batch = gb.io.to_arrow(B, give_ownership=True)
+    assert gb.io.from_arrow(batch).isequal(A)
+    B = A.dup()
+    csr = gb.io.to_arrow(B, "csr", give_ownership=True)
+    assert gb.io.from_arrow(csr).isequal(A)
+    v = Vector.from_coo([1, 3], [1, 2])
+    w = v.dup()
+    assert gb.io.from_arrow(gb.io.to_arrow(w, give_ownership=True)).isequal(v)
+
+    # Tables that keep the metadata of ``to_arrow`` but are no longer sorted
+    A = Matrix.from_coo([0, 0, 1, 2, 2], [1, 2, 0, 0, 2], [1, 5, 2, 4, 3], nrows=3, ncols=3)
+    table = pa.Table.from_batches([gb.io.to_arrow(A)])
+    assert gb.io.from_arrow(table.sort_by([("value", "descending")])).isequal(A)
+    assert gb.io.from_arrow(table.sort_by([("row", "descending")])).isequal(A)
+    assert gb.io.from_arrow(gb.io.to_arrow(A.T).sort_by([("col", "descending")])).isequal(A.T)
+    with pytest.raises(ValueError, match="Duplicate indices found"):
+        gb.io.from_arrow(pa.concat_tables([table, table]).combine_chunks())
+    v = Vector.from_coo([0, 2, 3], [1, 2, 3])
+    table = pa.Table.from_batches([gb.io.to_arrow(v)])
+    assert gb.io.from_arrow(table.take([2, 0, 1])).isequal(v)
+
+    # Data from other sources such as DuckDB or Polars
+    table = pa.table(
+        {
+            "value": pa.array([1, 2, 3, 4], pa.int32()),
+            "col": pa.array([2, 2, 0, 2], pa.int32()),
+            "row": pa.array([0, 1, 1, 0], pa.uint32()),
+        }
+    )
+    with pytest.raises(ValueError, match="Duplicate indices found"):
+        gb.io.from_arrow(table)
+    expected = Matrix.from_coo([0, 1, 1], [2, 2, 0], [5, 2, 3], dtype="INT32")
+    A = gb.io.from_arrow(table, dup_op=gb.binary.plus)
+    assert A.isequal(expected, check_dtype=True)
+    batches = table.to_batches(max_chunksize=1)
+    with pytest.raises(ValueError, match="Duplicate indices found"):
+        gb.io.from_arrow(batches)
+    A = gb.io.from_arrow(iter(batches), dup_op=gb.binary.plus)
+    assert A.isequal(expected, check_dtype=True)
+    A = gb.io.from_arrow(batches, "FP64", nrows=4, ncols=3, dup_op=gb.binary.plus)
+    expected.resize(4, 3)
+    assert A.isequal(expected.dup("FP64"), check_dtype=True)
+    table = pa.table({"i": [3, 1], "x": [0.5, 1.5]})
+    v = gb.io.from_arrow(table, size=5)
+    assert v.isequal(Vector.from_coo([3, 1], [0.5, 1.5], size=5), check_dtype=True)
+    lists = pa.array([[{"j": 1, "x": 2.5}], [], None])
+    with pytest.raises(ValueError, match="null"):
+        gb.io.from_arrow(lists)
+    lists = pa.array([[{"j": 1, "x": 2.5}], [], [{"j": 0, "x": 1.0}]])
+    A = gb.io.from_arrow(lists)
+    assert A.isequal(Matrix.from_coo([0, 2], [1, 0], [2.5, 1.0], nrows=3, ncols=2))
+
+    empty = pa.table({"row": pa.array([], pa.int64()), "col": [], "value": pa.array([], "f4")})
+    A = gb.io.from_arrow(empty, nrows=2, ncols=3)
+    assert A.isequal(Matrix("FP32", 2, 3), check_dtype=True)
+    with pytest.raises(ValueError, match="No record batches"):
+        gb.io.from_arrow([])
+    with pytest.raises(ValueError, match="Expected 2 or 3 columns"):
+        gb.io.from_arrow(pa.table({"a": [1]}))
+    with pytest.raises(ValueError, match="null"):
+        gb.io.from_arrow(pa.table({"index": [1, None], "value": [1, 2]}))
+    with pytest.raises(gb.exceptions.IndexOutOfBound):
+        gb.io.from_arrow(pa.table({"index": [1, -1], "value": [1, 2]}))
+    with pytest.raises(gb.exceptions.IndexOutOfBound):
+        gb.io.from_arrow(pa.table({"index": [1, 5], "value": [1, 2]}), size=3)
+    with pytest.raises(TypeError, match="integers"):
+        gb.io.from_arrow(pa.table({"index": [1.5], "value": [1]}))
+    with pytest.raises(TypeError, match="Vector or Matrix"):
+        gb.io.to_arrow(gb.Scalar.from_value(1))
+    with pytest.raises(ValueError, match="format"):
+        gb.io.to_arrow(expected, "bad")
+    with pytest.raises(ValueError, match="chunksize"):
+        gb.io.to_arrow(expected, chunksize=0)
+    if dtypes._supports_complex:
+        with pytest.raises(TypeError, match="Arrow"):
+            gb.io.to_arrow(Vector(complex, 2))
+
+
 @pytest.mark.skipif("not ak")
 @pytest.mark.xfail(np.__version__[:5] == "1.25.", reason="awkward bug with numpy 1.25")
 def test_awkward_roundtrip():
@@ -1,9 +1,11 @@
 import inspect
 import itertools
 import pickle
+import subprocess
 import sys
 import types
 import weakref
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -1562,6 +1564,81 @@ def test_reduce_agg_firstlast(A):
     assert s3.isequal(s1.value + s2.value)
 
 
+def test_reduce_agg_describe(A):
+    fields = {
+        "count": agg.count,
+        "sum": agg.sum,
+        "sum_of_squares": agg.sum_of_squares,
+        "min": agg.min,
+        "max": agg.max,
+    }
+    for method in ["reduce_rowwise", "reduce_columnwise"]:
+        for B in [A, A.T]:
+            w = getattr(B, method)(agg.describe).new()
+            assert w.size == (B.nrows if method == "reduce_rowwise" else B.ncols)
+            indices, values = w.to_coo()
+            for field, aggregator in fields.items():
+                expected = getattr(B, method)(aggregator).new()
+                result = Vector.from_coo(indices, values[field], size=w.size)
+                assert result.isequal(expected, check_dtype=False), (method, field)
+    w = A.reduce_rowwise(agg.describe).new()
+    indices, values = w.to_coo()
+    np.testing.assert_array_equal(values["first"], [2, 8, 1, 3, 7, 1, 5])
+    np.testing.assert_array_equal(values["last"], [3, 4, 1, 3, 7, 1, 3])
+    assert w.dtype == agg.describe[A.dtype].return_type
+    assert list(w.dtype.np_type.names) == [
+        "count",
+        "sum",
+        "sum_of_squares",
+        "min",
+        "max",
+        "first",
+        "last",
+    ]
+    w = A.reduce_rowwise(agg.describe).new(mask=Vector.from_coo([1, 3], True, size=7).S)
+    assert list(w.to_coo()[0]) == [1, 3]
+    s = A.reduce_scalar(agg.describe).new()
+    assert s.value.tolist() == (12, 47, 245, 1, 8, 2, 3)
+    B = Matrix(float, nrows=2, ncols=3)
+    assert B.reduce_scalar(agg.describe).new().is_empty
+    assert B.reduce_rowwise(agg.describe).new().nvals == 0
+    with pytest.raises(KeyError, match="describe does not work"):
+        Matrix(complex, 2, 2).reduce_rowwise(agg.describe)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_reduce_scalar_agg_paths(A, monkeypatch):
+    from graphblas.core.operator import agg as agg_module
+
+    plan = agg_module._plan_matrix_reduce
+    B = A.dup()
+    B.ss.config["format"] = "by_col"
+    iso = Matrix(float, A.nrows, A.ncols)
+    iso(A.S) << 1.5
+    names = ["count", "exists", "count_nonzero", "sum_of_squares", "hypot", "logaddexp"]
+    names += ["L1norm", "Linfnorm", "mean", "varp", "stds"]
+    for M in [A, A.T, B, iso]:
+        for name in names:
+            aggregator = getattr(agg, name)
+            expected = M.reduce_scalar(aggregator).new()
+            for path in ["values", "rowwise", "columnwise"]:
+                monkeypatch.setattr(agg_module, "_plan_matrix_reduce", lambda *args, p=path: p)
+                result = M.reduce_scalar(aggregator).new()
+                assert result.isclose(expected, check_dtype=True), (name, path)
+            monkeypatch.setattr(agg_module, "_plan_matrix_reduce", plan)
+    assert plan(semiring.plus_pair[int], A) == "structure"
+    assert plan(semiring.plus_pow[float], A) == "values"
+    assert plan(semiring.plus_first[float], iso) == "values"
+    D = Matrix.from_dense(np.ones((10, 100)))
+    assert plan(semiring.plus_first[float], D) == "rowwise"
+    D = Matrix.from_dense(np.ones((100, 10)))
+    D.ss.config["format"] = "by_col"
+    assert plan(semiring.plus_first[float], D) == "columnwise"
+    assert A.reduce_scalar(agg.count).new() == A.nvals
+    assert A.reduce_scalar(agg.exists).new() == 1
+    assert Matrix(int, 2, 2).reduce_scalar(agg.count).new().is_empty
+
+
 @pytest.mark.skipif("not suitesparse")
 def test_reduce_agg_firstlast_index(A):
     # reduce_rowwise
@@ -2286,6 +2363,12 @@ def test_ss_import_export(A, do_iso, methods):
     E = Matrix.ss.import_any(**info)
     assert E.isequal(D)
 
+    # Empty rows and columns, including at the end
+    F = Matrix.from_coo([1, 3, 3], [3, 1, 2], [1, 2, 3], nrows=5, ncols=5)
+    for format in ["coor", "cooc"]:
+        E = Matrix.ss.import_any(**F.ss.export(format))
+        assert E.isequal(F)
+
     info = D.ss.export("rowwise")
     assert info["format"] in {"csr", "dcsr", "bitmapr", "fullr"}
     info = D.ss.export("colwise")
@@ -2918,6 +3001,7 @@ def test_expr_is_like_matrix(A):
         "_assign_element",
         "_delete_element",
         "_deserialize",
+        "_deserialize_blob",
         "_extract_element",
         "_from_csx",
         "_from_obj",
@@ -2983,6 +3067,7 @@ def test_index_expr_is_like_matrix(A):
         "_assign_element",
         "_delete_element",
         "_deserialize",
+        "_deserialize_blob",
         "_extract_element",
         "_from_csx",
         "_from_obj",
@@ -3404,6 +3489,230 @@ def test_ss_lastk(A):
     assert B.isequal(A)
 
 
+@pytest.mark.skipif("not suitesparse")
+def test_ss_largestk(A):
+    B = A.ss.selectk("largest", 1)
+    # Row 3 has a tie, so either may be chosen
+    expected1 = Matrix.from_coo(
+        [0, 1, 2, 3, 4, 5, 6],
+        [3, 4, 5, 0, 5, 2, 3],
+        [3, 8, 1, 3, 7, 1, 7],
+        nrows=A.nrows,
+        ncols=A.ncols,
+    )
+    expected2 = Matrix.from_coo(
+        [0, 1, 2, 3, 4, 5, 6],
+        [3, 4, 5, 2, 5, 2, 3],
+        [3, 8, 1, 3, 7, 1, 7],
+        nrows=A.nrows,
+        ncols=A.ncols,
+    )
+    assert B.isequal(expected1) or B.isequal(expected2)
+
+    B = A.ss.selectk("largest", 2)
+    expected = A.dup()
+    del expected[6, 4]
+    assert B.isequal(expected)
+
+    B = A.ss.selectk("largest", 3)
+    assert B.isequal(A)
+
+    B = A.ss.selectk("largest", 2, order="col")
+    expected = A.dup()
+    del expected[5, 2]
+    assert B.isequal(expected)
+
+    B = A.ss.selectk("largest", 0)
+    assert B.isequal(Matrix(A.dtype, A.nrows, A.ncols))
+
+    with pytest.raises(ValueError, match="negative k is not allowed"):
+        A.ss.selectk("largest", -1)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_ss_smallestk(A):
+    B = A.ss.selectk("smallest", 1)
+    expected1 = Matrix.from_coo(
+        [0, 1, 2, 3, 4, 5, 6],
+        [1, 6, 5, 0, 5, 2, 4],
+        [2, 4, 1, 3, 7, 1, 3],
+        nrows=A.nrows,
+        ncols=A.ncols,
+    )
+    expected2 = Matrix.from_coo(
+        [0, 1, 2, 3, 4, 5, 6],
+        [1, 6, 5, 2, 5, 2, 4],
+        [2, 4, 1, 3, 7, 1, 3],
+        nrows=A.nrows,
+        ncols=A.ncols,
+    )
+    assert B.isequal(expected1) or B.isequal(expected2)
+
+    B = A.ss.selectk("smallest", 2)
+    expected = A.dup()
+    del expected[6, 3]
+    assert B.isequal(expected)
+
+    B = A.ss.selectk("smallest", 1, order="col")
+    expected = Matrix.from_coo(
+        [3, 0, 5, 0, 6, 2, 1],
+        [0, 1, 2, 3, 4, 5, 6],
+        [3, 2, 1, 3, 3, 1, 4],
+        nrows=A.nrows,
+        ncols=A.ncols,
+    )
+    assert B.isequal(expected)
+
+    # NaN is treated as the largest value
+    B = Matrix.from_coo([0, 0, 0, 0], [0, 1, 2, 3], [np.nan, 1.0, np.nan, 2.0])
+    C = B.ss.selectk("smallest", 2)
+    assert C.isequal(Matrix.from_coo([0, 0], [1, 3], [1.0, 2.0], nrows=1, ncols=4))
+    C = B.ss.selectk("smallest", 3)
+    assert C.nvals == 3
+    assert C[0, 1].new() == 1
+    assert C[0, 3].new() == 2
+    C = B.ss.selectk("largest", 2)
+    assert C.nvals == 2
+    assert C.apply(unary.isnan).new().reduce_scalar(monoid.land).new()
+    B = Matrix.from_coo(
+        [0, 0, 0, 1, 1, 1, 2, 2],
+        [0, 1, 2, 0, 1, 2, 0, 1],
+        [3.0, np.nan, -1.0, np.nan, np.nan, 5.0, 2.0, 4.0],
+    )
+    for M, order in [(B, "rowwise"), (B.T.new(), "columnwise")]:
+        C = M.ss.selectk("largest", 1, order=order)
+        C = C if order == "rowwise" else C.T.new()
+        expected = [[0, 1, 2], [1, 0, 1], [np.nan, np.nan, 4.0]]
+        for actual, exp in zip(C.to_coo(), expected):
+            np.testing.assert_array_equal(actual, exp)
+        C = M.ss.selectk("smallest", 1, order=order)
+        C = C if order == "rowwise" else C.T.new()
+        assert C.isequal(Matrix.from_coo([0, 1, 2], [2, 2, 0], [-1.0, 5.0, 2.0], ncols=3))
+        C = M.ss.selectk("smallest", 2, order=order)
+        C = C if order == "rowwise" else C.T.new()
+        expected = Matrix.from_coo([0, 0, 1, 1], [0, 2, 0, 1], [3.0, -1.0, 2.0, 4.0])
+        assert C[[0, 2], :].new().isequal(expected)
+        # Row 1 has one number, so one of its NaN values is also chosen
+        assert C[1, :].new().nvals == 2
+        assert C[1, 2].new() == 5
+        assert C[1, :2].new().apply(unary.isnan).new().reduce(monoid.lor).new()
+
+    # iso
+    B = A.dup()
+    B(B.S) << 1
+    C = B.ss.selectk("smallest", 2)
+    assert C.ss.is_iso
+    expected = A.ss.selectk("first", 2).reduce_rowwise(agg.count).new()
+    assert C.reduce_rowwise(agg.count).new().isequal(expected)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_ss_random_weighted(A):
+    B = A.ss.selectk("random_weighted", 1)
+    counts = B.reduce_rowwise(agg.count).new()
+    expected = Vector.from_coo(range(A.nrows), 1)
+    assert counts.isequal(expected)
+    assert B.ewise_mult(A, binary.eq).new().reduce_scalar(monoid.land).new()
+
+    B = A.ss.selectk("random_weighted", 3)
+    assert B.isequal(A)
+
+    # Elements with weight 0 are never chosen
+    W = Matrix.from_coo([0, 0, 0, 1, 1], [0, 1, 2, 0, 1], [0.0, 1.0, 0.0, 0.0, 0.0])
+    for _ in range(10):
+        B = W.ss.selectk("random_weighted", 2)
+        assert B.isequal(Matrix.from_coo([0], [1], [1.0], nrows=2, ncols=3))
+    W = Matrix.from_coo([0, 0], [0, 1], 0.0)
+    assert W.ss.selectk("random_weighted", 1).nvals == 0
+    W = Matrix.from_coo([0, 0], [0, 1], 2.0)
+    assert W.ss.selectk("random_weighted", 1).nvals == 1
+
+    with pytest.raises(ValueError, match="non-negative weights"):
+        Matrix.from_coo([0, 0], [0, 1], [1, -1]).ss.selectk("random_weighted", 1)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_ss_sample_neighbors(A):
+    S, frontier = A.ss.sample_neighbors([0, 6], 2)
+    assert S.shape == A.shape
+    counts = S.reduce_rowwise(agg.count).new()
+    assert counts.isequal(Vector.from_coo([0, 6], [2, 2], size=A.nrows))
+    assert S.ewise_mult(A, binary.eq).new().reduce_scalar(monoid.land).new()
+    assert frontier.dtype == bool
+    assert frontier.isequal(S.reduce_columnwise(monoid.any).new().apply(unary.one[bool]).new())
+
+    seeds = Vector.from_coo([1, 3], True, size=A.nrows)
+    S, frontier = A.ss.sample_neighbors(seeds, 5)
+    expected = Matrix.from_coo(
+        [1, 1, 3, 3], [4, 6, 0, 2], [8, 4, 3, 3], nrows=A.nrows, ncols=A.ncols
+    )
+    assert S.isequal(expected)
+    assert frontier.isequal(Vector.from_coo([0, 2, 4, 6], True, size=A.ncols))
+
+    S, frontier = A.ss.sample_neighbors([6], 3, replace=True)
+    assert 1 <= S.nvals <= 3
+    assert S.ewise_mult(A, binary.eq).new().reduce_scalar(monoid.land).new()
+
+    S1, _ = A.ss.sample_neighbors(range(A.nrows), 1, seed=42)
+    S2, _ = A.ss.sample_neighbors(range(A.nrows), 1, seed=42)
+    assert S1.isequal(S2)
+    assert S1.reduce_rowwise(agg.count).new().isequal(Vector.from_coo(range(A.nrows), 1))
+
+    # Elements with weight 0 are never chosen
+    W = A.apply(binary.isgt, 5).new(float)
+    for replace in [False, True]:
+        S, frontier = A.ss.sample_neighbors([1, 4, 6], 2, weights=W, replace=replace)
+        expected = Matrix.from_coo([1, 4, 6], [4, 5, 3], [8, 7, 7], nrows=A.nrows, ncols=A.ncols)
+        assert S.isequal(expected)
+        assert frontier.isequal(Vector.from_coo([3, 4, 5], True, size=A.ncols))
+    S, _ = A.ss.sample_neighbors([6], 3, weights=A)
+    assert S.nvals == 3
+
+    S, frontier = A.ss.sample_neighbors([0, 1], 0)
+    assert S.nvals == frontier.nvals == 0
+
+    with pytest.raises(ValueError, match="negative fanout"):
+        A.ss.sample_neighbors([0], -1)
+    with pytest.raises(IndexOutOfBound):
+        A.ss.sample_neighbors([A.nrows], 1)
+    with pytest.raises(DimensionMismatch):
+        A.ss.sample_neighbors(Vector(bool, A.nrows + 1), 1)
+    with pytest.raises(ValueError, match="same structure"):
+        A.ss.sample_neighbors([0], 1, weights=Matrix.from_coo([0], [0], 1, nrows=7, ncols=7))
+    with pytest.raises(ValueError, match="non-negative"):
+        A.ss.sample_neighbors([0], 1, weights=A.apply(unary.ainv).new())
+
+
+@pytest.mark.skipif("not suitesparse")
+@pytest.mark.parametrize("replace", [False, True])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_ss_sample_neighbors_seed(replace, weighted):
+    try:
+        import numba
+    except ImportError:  # pragma: no cover (import)
+        numba = None
+    rng = np.random.default_rng(0)
+    A = Matrix.from_dense(rng.random((40, 30)), missing_value=0)
+    weights = A if weighted else None
+    rows = [1, 5, 17, 33]
+    expected, _ = A.ss.sample_neighbors(rows, 3, replace=replace, weights=weights, seed=7)
+    # Each row is seeded on its own, so it doesn't matter which thread samples it
+    for row in rows:
+        S, _ = A.ss.sample_neighbors([row], 3, replace=replace, weights=weights, seed=7)
+        assert S[row, :].new().isequal(expected[row, :].new())
+    if numba is not None:
+        prev = numba.get_num_threads()
+        try:
+            for nthreads in range(1, numba.config.NUMBA_NUM_THREADS + 1):
+                numba.set_num_threads(nthreads)
+                S, _ = A.ss.sample_neighbors(rows, 3, replace=replace, weights=weights, seed=7)
+                assert S.isequal(expected)
+        finally:
+            numba.set_num_threads(prev)
+    S, _ = A.ss.sample_neighbors(rows, 3, replace=replace, weights=weights, seed=8)
+    assert not S.isequal(expected)
+
+
 @pytest.mark.skipif("not suitesparse")
 @pytest.mark.parametrize("do_iso", [False, True])
 @pytest.mark.slow
@@ -3825,6 +4134,34 @@ def test_reposition(A):
     assert result.isequal(expected)
 
 
+def test_groupby(A):
+    labels = np.array([0, 0, 1, 1, 3, 3, 3])
+    ops = [monoid.max, agg.count, agg.hypot, agg.logaddexp, agg.L1norm, agg.varp]
+    if suitesparse:
+        ops.append(agg.ss.argmax)
+    for B in [A, A.T]:
+        rows = B.groupby(labels, ops)
+        columns = B.groupby(Vector.from_coo(range(7), labels), ops, axis="columns")
+        for op, R, C in zip(ops, rows, columns):
+            assert R.shape == (4, 7)
+            assert C.shape == (7, 4)
+            for j in range(7):
+                expected = B[:, j].new().groupby(labels, op)
+                assert R[:, j].new().isclose(expected, check_dtype=True), (op, j)
+                expected = B[j, :].new().groupby(labels, op)
+                assert C[j, :].new().isclose(expected, check_dtype=True), (op, j)
+    C = A.groupby([0, 1, 0, 1, 0, 1, 0], axis="cols", ngroups=3, name="C")
+    assert C.name == "C"
+    assert C.isequal(A.mxm(Matrix.from_coo(range(7), [0, 1] * 3 + [0], True, ncols=3)).new())
+    with pytest.raises(DimensionMismatch, match="labels must have size 7"):
+        A.groupby(Vector(int, 3))
+    assert A.groupby(labels, axis=0).isequal(A.groupby(labels))
+    assert A.groupby(labels, axis=1).isequal(A.groupby(labels, axis="columns"))
+    for axis in ["depth", "C", 2, None]:
+        with pytest.raises(ValueError, match='axis must be "rows" or "columns"'):
+            A.groupby(labels, axis=axis)
+
+
 def test_to_coo_sort():
     # How can we get a matrix to a jumbled state in SS so that export won't be sorted?
     N = 1000000
@@ -3919,6 +4256,79 @@ def test_ss_serialize(A):
         Matrix.ss.deserialize(a[:-5])
 
 
+@pytest.mark.skipif("not suitesparse")
+def test_ss_shared_memory(A):
+    for format in [None, "csr", "hypercsc", "bitmapr", "coo"]:
+        with A.ss.to_shared_memory(format) as handle:
+            assert handle.collection == "Matrix"
+            assert handle.nbytes > 0
+            assert "Matrix" in repr(handle)
+            handle2 = pickle.loads(pickle.dumps(handle))
+            C = Matrix.ss.from_shared_memory(handle2, name="C")
+            assert C.name == "C"
+            assert C.isequal(A, check_dtype=True)
+            assert not handle2._segments  # closed after attaching
+            C = Matrix.ss.from_shared_memory(handle)
+            assert C.isequal(A, check_dtype=True)
+        assert A.isequal(C, check_dtype=True)  # A is unchanged
+    for B in [Matrix(int, 3, 4), Matrix.from_scalar(1.5, 2, 2)]:
+        with B.ss.to_shared_memory() as handle:
+            assert Matrix.ss.from_shared_memory(handle).isequal(B, check_dtype=True)
+    handle = A.ss.to_shared_memory()
+    handle.unlink()
+    handle.unlink()
+    with pytest.raises(FileNotFoundError):
+        Matrix.ss.from_shared_memory(handle)
+    with pytest.raises(TypeError, match="SharedMemoryHandle"):
+        Matrix.ss.from_shared_memory(A)
+    with Vector(int, 3).ss.to_shared_memory() as handle, pytest.raises(TypeError, match="Vector"):
+        Matrix.ss.from_shared_memory(handle)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_ss_shared_memory_other_process(A):
+    # A process not started by multiprocessing has its own resource tracker, which
+    # must not destroy the segments when the process exits.
+    code = (
+        "import pickle, sys\n"
+        "from graphblas import Matrix\n"
+        "handle = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(Matrix.ss.from_shared_memory(handle).nvals)\n"
+    )
+    with A.ss.to_shared_memory() as handle:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            input=pickle.dumps(handle),
+            capture_output=True,
+            check=True,
+            cwd=Path(gb.__file__).parent.parent,
+        )
+        assert result.stdout.decode().strip() == str(A.nvals)
+        assert b"resource_tracker" not in result.stderr
+        assert Matrix.ss.from_shared_memory(handle).isequal(A)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_ss_save_load(A, tmp_path):
+    for format in [None, "csr", "csc", "hypercsr", "hypercsc", "bitmapr", "coo"]:
+        path = tmp_path / str(format)
+        A.ss.save(path, format)
+        assert (path / "metadata.json").exists()
+        assert (path / "values.npy").exists()
+        for mmap in [True, False]:
+            C = Matrix.ss.load(path, mmap=mmap, name="C")
+            assert C.name == "C"
+            assert C.isequal(A, check_dtype=True)
+            if format not in {None, "coo"}:
+                assert C.ss.format == format
+    for i, B in enumerate([Matrix(int, 3, 4), Matrix.from_scalar(1.5, 2, 2)]):
+        B.ss.save(tmp_path / f"B{i}")
+        assert Matrix.ss.load(tmp_path / f"B{i}").isequal(B, check_dtype=True)
+    Vector(int, 3).ss.save(tmp_path / "v")
+    with pytest.raises(TypeError, match="Vector"):
+        Matrix.ss.load(tmp_path / "v")
+
+
 @pytest.mark.skipif("not suitesparse")
 def test_ss_config(A):
     d = {}
@@ -4393,3 +4803,111 @@ def test_power(A):
     B = A[:2, :3].new()
     with pytest.raises(DimensionMismatch):
         B.power(2)
+
+
+def test_closure(A):
+    # Reachability
+    expected = A.apply(unary.one[bool]).new()
+    result = expected.dup()
+    for _ in range(A.nrows):
+        result(binary.lor) << semiring.lor_land(result @ A)
+    expected << result
+    result = A.closure().new()
+    assert result.isequal(expected, check_dtype=True)
+    assert A.closure(max_iter=100).new().isequal(expected)
+    # All-pairs shortest path lengths
+    expected = A.dup()
+    for _ in range(A.nrows):
+        expected(binary.min) << semiring.min_plus(expected @ A)
+    result = A.closure(semiring.min_plus).new()
+    assert result.isequal(expected)
+    # Restricted to rows 0 and 6
+    mask = Matrix(bool, A.nrows, A.ncols)
+    mask[[0, 6], :] << True
+    result = A.closure(semiring.min_plus, mask=mask.S).new()
+    assert result.isequal(expected.dup(mask=mask.S))
+    # Non-idempotent monoid on a DAG
+    dag = A.select("triu", 1).new()
+    expected = dag.dup()
+    term = dag.dup()
+    for _ in range(A.nrows):
+        term << term @ dag
+        expected(binary.plus) << term
+    result = dag.closure(semiring.plus_times).new()
+    assert result.isequal(expected)
+    # Stop early; each iteration is one matrix multiplication
+    A2 = semiring.min_plus(A @ A).new()
+    A3 = semiring.min_plus(A2 @ A).new()
+    A4 = semiring.min_plus(A3 @ A).new()
+    upto2 = A.ewise_add(A2, binary.min).new()
+    upto3 = upto2.ewise_add(A3, binary.min).new()
+    upto4 = upto3.ewise_add(A4, binary.min).new()
+    # Repeated squaring doubles the path length each iteration
+    assert A.closure(semiring.min_plus, max_iter=1).new().isequal(upto2)
+    assert A.closure(semiring.min_plus, max_iter=2).new().isequal(upto4)
+    # Extending paths by one edge adds one to the path length each iteration
+    full = Matrix(bool, A.nrows, A.ncols)
+    full << True
+    assert A.closure(semiring.min_plus, max_iter=1, mask=full.S).new().isequal(upto2)
+    assert A.closure(semiring.min_plus, max_iter=2, mask=full.S).new().isequal(upto3)
+    result = A.closure(semiring.plus_times, max_iter=1).new()
+    assert result.isequal(A.ewise_add((A @ A).new()).new())
+    # Transpose
+    result = A.T.closure(semiring.min_plus).new()
+    assert result.isequal(A.T.new().closure(semiring.min_plus).new())
+    # Exceptional
+    with pytest.raises(TypeError, match="must be a positive integer"):
+        A.closure(max_iter=1.5)
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        A.closure(max_iter=0)
+    B = A[:2, :3].new()
+    with pytest.raises(DimensionMismatch):
+        B.closure()
+
+
+def test_power_series(A):
+    expected = A.dup()
+    term = A.dup()
+    for k in range(1, 8):
+        result = A.power_series(k).new()
+        assert result.isequal(expected, check_dtype=True)
+        term << term @ A
+        expected(binary.plus) << term
+    # Scaled by beta
+    expected = A.dup(float)
+    term = A.dup(float)
+    for k in range(1, 6):
+        result = A.power_series(k, beta=0.5).new()
+        assert result.dtype == float
+        assert result.isclose(expected)
+        term << semiring.plus_times(term @ A)
+        term << binary.times(term, 0.5)
+        expected(binary.plus) << term
+    # Other semiring
+    expected = A.dup()
+    term = A.dup()
+    for k in range(1, 5):
+        result = A.power_series(k, beta=1, op=semiring.min_plus).new()
+        assert result.isequal(expected)
+        term << semiring.min_plus(term @ A)
+        term << binary.plus(term, 1)
+        expected(binary.min) << term
+    # Masked
+    mask = Matrix.from_coo([0, 1, 2, 6], [0, 3, 6, 2], True, nrows=A.nrows, ncols=A.ncols)
+    for k in range(1, 5):
+        expected = A.power_series(k, beta=2).new()
+        result = A.power_series(k, beta=2, mask=mask.S).new()
+        assert result.isequal(expected.dup(mask=mask.S))
+        result = A.power_series(k, beta=2, mask=~mask.S).new()
+        assert result.isequal(expected.dup(mask=~mask.S))
+    # Transpose
+    result = A.T.power_series(3).new()
+    assert result.isequal(A.T.new().power_series(3).new())
+    # Exceptional
+    with pytest.raises(TypeError, match="must be a positive integer"):
+        A.power_series(1.5)
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        A.power_series(0)
+    B = A[:2, :3].new()
+    with pytest.raises(DimensionMismatch):
+        B.power_series(2)
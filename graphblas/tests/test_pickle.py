@@ -338,3 +338,25 @@ def test_udt(extra):
     any_udt = d["any[udt]"]
     assert any_udt is gb.binary.any[udt3]
     assert pickle.loads(pickle.dumps(gb.binary.first[udt, int])) is gb.binary.first[udt, int]
+
+
+@pytest.mark.skipif("not suitesparse")
+@pytest.mark.parametrize("compression", [None, "none", "lz4"])
+def test_out_of_band(compression):
+    A = gb.Matrix.from_coo([0, 1, 3], [1, 2, 0], [1.5, 2, 3], nrows=5, ncols=4, name="A")
+    v = gb.Vector.from_coo([0, 3], 7, size=5, name="v")
+    with gb.config.set(pickle_compression=compression):
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            A2, v2 = pickle.loads(pickle.dumps([A, v], protocol=protocol))
+            assert A2.isequal(A, check_dtype=True)
+            assert A2.name == "A"
+            assert v2.isequal(v, check_dtype=True)
+            assert v2.name == "v"
+        buffers = []
+        pkl = pickle.dumps([A, v], protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) >= 2
+    A2, v2 = pickle.loads(pkl, buffers=buffers)
+    assert A2.isequal(A, check_dtype=True)
+    assert v2.isequal(v, check_dtype=True)
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(pkl)
@@ -0,0 +1,144 @@
+import pytest
+
+import graphblas as gb
+from graphblas import binary, dtypes, monoid, semiring, unary
+
+
+@pytest.fixture
+def A():
+    return gb.Matrix.from_coo(
+        [0, 0, 1, 2, 2], [0, 2, 1, 0, 2], [1.0, -2, 3, -4, 5], nrows=3, ncols=3, name="A"
+    )
+
+
+@pytest.fixture
+def M():
+    return gb.Matrix.from_coo([0, 2], [0, 2], [True, True], nrows=3, ncols=3, name="M")
+
+
+def pipeline(A, M):
+    B = A.apply(unary.abs).new()
+    C = B.mxm(A, semiring.min_plus).new(mask=M.S)
+    return C, C.reduce_rowwise(monoid.max), C.reduce_scalar().new()
+
+
+def test_prepare_matches_eager(A, M):
+    f = gb.prepare(pipeline)
+    first = f(A, M)
+    assert len(f._traces) == 1
+    A2 = A.apply(binary.times, right=2).new()
+    for _ in range(2):
+        result = f(A2, M)
+        expected = pipeline(A2, M)
+        assert type(result) is tuple
+        assert result[0].isequal(expected[0])
+        assert result[1].isequal(expected[1].new())
+        assert result[2] == expected[2]
+    assert len(f._traces) == 1
+    # New objects are created for each call
+    assert result[0] is not first[0]
+    assert first[0].isequal(pipeline(A, M)[0])
+    assert repr(f) == "<PreparedFunction 'pipeline'>"
+
+
+def test_prepare_retrace(A, M):
+    @gb.prepare
+    def f(A, B):
+        return A.ewise_mult(B, binary.plus)
+
+    # Expressions are computed
+    result = f(A, A)
+    assert type(result) is gb.Matrix
+    assert result.isequal(A.ewise_mult(A, binary.plus).new())
+    # Aliased inputs are traced separately
+    B = A.dup()
+    result = f(A, B)
+    assert len(f._traces) == 2
+    B << unary.ainv(B)
+    assert f(A, B).isequal(A.ewise_mult(B, binary.plus).new())
+    assert f(A, B).reduce_scalar(monoid.max).new() == 0
+    # Different dtype or shape
+    f(A.dup(int), A.dup(int))
+    f(A[:2, :2].new(), A[:2, :2].new())
+    assert len(f._traces) == 4
+    f.clear()
+    assert not f._traces
+
+
+def test_prepare_update_input(A, M):
+    @gb.prepare
+    def f(C, A, M):
+        C(M.S, accum=binary.plus) << A.apply(unary.abs)
+
+    C = A.dup()
+    assert f(C, A, M) is None
+    C2 = A.dup()
+    f(C2, A, M)
+    assert C2.isequal(C)
+    expected = A.dup()
+    expected(M.S, accum=binary.plus) << A.apply(unary.abs)
+    assert C2.isequal(expected)
+
+
+def test_prepare_scalars(A):
+    @gb.prepare
+    def f(A, s):
+        return A.apply(binary.times, right=s).new().reduce_scalar().new()
+
+    s = gb.Scalar.from_value(2.0, is_cscalar=False)
+    assert f(A, s) == 6
+    s.value = 3
+    assert f(A, s) == 9
+    assert len(f._traces) == 1
+
+    @gb.prepare
+    def g(A):
+        return A[0, 2].new(is_cscalar=True)
+
+    A2 = A.dup()
+    A2[0, 2] = 7
+    assert g(A) == -2
+    assert g(A2) == 7
+    del A2[0, 2]
+    assert g(A2).is_empty
+
+    @gb.prepare
+    def h(A):
+        return A.reduce_scalar().new(is_cscalar=True)
+
+    with pytest.raises(TypeError, match="C scalars"):
+        h(A)
+
+
+def test_prepare_python_args(A):
+    @gb.prepare
+    def f(A, thunk):
+        return A.select("valuegt", thunk).new(dtype=dtypes.INT64)
+
+    assert f(A, 0).nvals == 3
+    assert f(A, 2).nvals == 2
+    assert f(A, 0).nvals == 3
+    assert len(f._traces) == 2
+    with pytest.raises(TypeError, match="expressions should be computed first"):
+        f(A.apply(unary.abs), 0)
+    with pytest.raises(TypeError, match="must be hashable"):
+        f(A, [0])
+
+    @gb.prepare
+    def g(A):
+        return A.nvals
+
+    with pytest.raises(TypeError, match="got int"):
+        g(A)
+
+
+def test_prepare_recorder(A, M):
+    f = gb.prepare(pipeline)
+    with gb.Recorder() as rec:
+        f(A, M)
+    traced = list(rec)
+    rec.clear()
+    with rec:
+        f(A, M)
+    assert list(rec) == traced
+    assert "GrB_mxm(M_1, M, NULL, GrB_MIN_PLUS_SEMIRING_FP64, M_0, A, GrB_DESC_S);" in traced
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+
+import graphblas as gb
+from graphblas import binary, semiring
+
+suitesparse = gb.backend == "suitesparse"
+
+
+@pytest.fixture
+def A():
+    return gb.Matrix.from_coo([0, 1, 2], [1, 2, 0], [1, 2, 3], nrows=3, ncols=3, name="A")
+
+
+def test_profiler(A):
+    with gb.Profiler() as prof:
+        assert prof.is_profiling
+        C = A.mxm(A, semiring.min_plus).new(name="C")
+        v = C.reduce_rowwise().new(name="v")
+    assert not prof.is_profiling
+    C.mxm(A).new()  # not profiled
+    assert [record.cfunc_name for record in prof] == [
+        "GrB_Matrix_new",
+        "GrB_mxm",
+        "GrB_Vector_new",
+        "GrB_Matrix_reduce_Monoid",
+    ]
+    assert len(prof) == 4
+    record = prof.records[1]
+    assert record.duration >= 0
+    assert record.callsite.startswith(__file__)
+    assert "(test_profiler)" in record.callsite
+    assert record.output["name"] == "C"
+    assert record.output["nvals"] == C.nvals
+    assert record.output["shape"] == (3, 3)
+    assert record.output["dtype"] == "INT64"
+    assert [info["name"] for info in record.inputs] == ["A", "A"]
+    assert record.inputs[0]["nvals"] == 3
+    if suitesparse:
+        assert record.output["format"] == C.ss.format
+    assert prof.records[3].output["nvals"] == v.nvals
+    assert prof.total_time == pytest.approx(sum(r.duration for r in prof))
+    assert "4 calls" in repr(prof)
+    prof.clear()
+    assert not list(prof)
+
+
+def test_profiler_nested(A):
+    outer = gb.Profiler()
+    with gb.Profiler(details=False) as inner, gb.Recorder() as rec:
+        A(A.S, accum=binary.plus) << A.apply(binary.times, right=2)
+    A.dup()
+    outer.stop()
+    assert not outer.is_profiling
+    assert len(inner) == len(rec.data) == 1
+    assert inner.records[0].output is None
+    assert inner.records[0].inputs == []
+    # Only one profiler profiles at a time
+    assert [record.cfunc_name for record in outer] == ["GrB_Matrix_dup"]
+
+
+def test_profiler_summary(A):
+    pytest.importorskip("pandas")
+    with gb.Profiler() as prof:
+        for _ in range(3):
+            A.mxm(A).new()
+    df = prof.summary()
+    assert list(df.columns) == ["count", "total", "mean", "max"]
+    assert df.loc["GrB_mxm", "count"] == 3
+    assert df.loc["GrB_Matrix_new", "count"] == 3
+    df = prof.summary(by="callsite")
+    assert len(df) == 1
+    assert df["count"].iloc[0] == 6
+    with pytest.raises(ValueError, match="callsite"):
+        prof.summary(by="bad")
+
+
+def test_profiler_chrome_trace(A, tmp_path):
+    with gb.Profiler() as prof:
+        A.ewise_mult(A).new(name="B")
+    path = tmp_path / "trace.json"
+    trace = prof.to_chrome_trace(path)
+    with path.open() as f:
+        assert json.load(f) == json.loads(json.dumps(trace))
+    events = trace["traceEvents"]
+    assert [event["name"] for event in events] == [
+        "GrB_Matrix_new",
+        "GrB_Matrix_eWiseMult_BinaryOp",
+    ]
+    assert events[0]["ts"] == 0
+    assert all(event["ph"] == "X" for event in events)
+    assert events[1]["args"]["output"]["name"] == "B"
+    assert len(events[1]["args"]["inputs"]) == 2
+    assert gb.Profiler(start=False).to_chrome_trace() == {
+        "traceEvents": [],
+        "displayTimeUnit": "ms",
+    }
+
+
+def test_profiler_prepared(A):
+    f = gb.prepare(lambda A: A.mxm(A).new(name="C"))
+    f(A)
+    with gb.Profiler() as prof:
+        f(A)
+    assert [record.cfunc_name for record in prof] == ["GrB_Matrix_new", "GrB_mxm"]
+    assert prof.records[1].output["name"] == "C"
+    assert [info["name"] for info in prof.records[1].inputs] == ["A", "A"]
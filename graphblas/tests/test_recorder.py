@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 
 import graphblas as gb
@@ -262,3 +264,64 @@ def test_ss_record_inner(switch):
             "  GrB_vxm((GrB_Vector)s_0, NULL, NULL, GrB_PLUS_TIMES_SEMIRING_INT64, v_0, "
             "(GrB_Matrix)v_0, NULL);"
         )
+
+
+def test_record_trace_replay():
+    A = gb.Matrix.from_coo([0, 1], [1, 1], [1, 2], name="A")
+    B = gb.Matrix.from_coo([0, 1], [0, 1], [3, 4], name="B")
+    rec = gb.Recorder(trace=True)
+    T = A.mxm(B).new(name="T")
+    C = T.apply(gb.binary.plus, right=1).new(name="C")
+    rec.stop()
+    assert len(rec.data) == 4
+    trace = rec.trace
+    assert [cfunc_name for cfunc_name, _ in trace] == [
+        "GrB_Matrix_new",
+        "GrB_mxm",
+        "GrB_Matrix_new",
+        "GrB_Matrix_apply_BinaryOp2nd_INT64",
+    ]
+    cfunc_name, args = trace[1]
+    assert args[0] == {"slot": 0, "name": "T", "input": False, "pointer": False}
+    assert args[1:4] == ["NULL", "NULL", "GrB_PLUS_TIMES_SEMIRING_INT64"]
+    assert args[4] == {"slot": 1, "name": "A", "input": True, "pointer": False}
+    assert args[5]["name"] == "B"
+    assert args[6] == "NULL"
+    assert trace[3][1][-2] == "1"
+
+    # Replay with the original inputs
+    result = rec.replay()
+    assert list(result.outputs) == ["T", "C"]
+    result = rec.replay(outputs=["C"])
+    assert list(result.outputs) == ["C"]
+    assert result.outputs["C"] is not C
+    assert result.outputs["C"].isequal(C)
+    assert [cfunc_name for cfunc_name, _ in result.times] == [cfunc_name for cfunc_name, _ in trace]
+    assert result.total_time == sum(time for _, time in result.times)
+    assert "4 calls" in repr(result)
+
+    # Replay with new inputs
+    A2 = A.apply(gb.unary.ainv).new()
+    result = rec.replay({"A": A2}, B=B)
+    assert result.outputs["C"].isequal(A2.mxm(B).new().apply(gb.binary.plus, right=1).new())
+    with gb.Recorder() as rec2:
+        rec.replay(A=A2)
+    assert len(rec2.data) == 4
+    with pytest.raises(ValueError, match="Unknown inputs"):
+        rec.replay(D=A2)
+    with pytest.raises(ValueError, match="Unknown outputs"):
+        rec.replay(outputs=["A"])
+    with pytest.raises(ValueError, match="same type, dtype, and shape"):
+        rec.replay(A=A2.dup(float))
+    with pytest.raises(ValueError, match="same type, dtype, and shape"):
+        rec.replay(A=A2[:1, :].new())
+    del B
+    gc.collect()
+    with pytest.raises(ValueError, match="no longer exists"):
+        rec.replay(A=A2)
+    with rec, pytest.raises(RuntimeError, match="while recording"):
+        rec.replay()
+    rec.clear()
+    assert rec.trace == []
+    with pytest.raises(ValueError, match="trace=True"):
+        gb.Recorder(start=False).replay()
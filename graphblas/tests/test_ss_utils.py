@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
@@ -5,6 +7,11 @@ from numpy.testing import assert_array_equal
 import graphblas as gb
 from graphblas import Matrix, Vector, backend
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover (import)
+    pd = None
+
 if backend != "suitesparse":
     pytest.skip("gb.ss and A.ss only available with suitesparse backend", allow_module_level=True)
 
@@ -234,3 +241,181 @@ def test_global_config():
     with pytest.raises(ValueError, match="Wrong number"):
         config["memory_pool"] = [1, 2]
     assert "format" in repr(config)
+
+
+def test_burble_capture(capfd):
+    A = Matrix.from_coo([0, 1, 2], [1, 2, 0], [1, 2, 3], nrows=3, ncols=3, name="A")
+    B = Matrix.from_dense([[1, 2], [3, 4]])
+    prev = gb.ss.config["burble"]
+    with gb.ss.BurbleCapture() as burble:
+        assert burble.is_capturing
+        assert gb.ss.config["burble"]
+        A.mxm(A).new()
+        print("not burble", flush=True)
+        B.mxm(B.T).new()
+    assert not burble.is_capturing
+    assert gb.ss.config["burble"] == prev
+    assert capfd.readouterr().out == "not burble\n"
+    records = [record for record in burble if record.cfunc_name == "GrB_mxm"]
+    assert len(records) == 2
+    assert records[0].function == "GrB_mxm"
+    assert records[0].methods == ("saxpy",)
+    assert records[1].methods == ("dot",)
+    assert all(record.time >= 0 for record in records)
+    assert records[0].callsite.startswith(__file__)
+    assert "(test_burble_capture)" in records[0].callsite
+    assert burble.total_time >= sum(record.time for record in records)
+    assert "GrB_mxm" in repr(burble)
+    starts = [record.start for record in records]
+    assert starts == sorted(starts)
+    trace = burble.to_chrome_trace()
+    assert len(trace["traceEvents"]) == len(burble.records)
+    assert all(event["ts"] >= 0 for event in trace["traceEvents"])
+    if pd is not None:
+        df = burble.summary()
+        assert df.loc["GrB_mxm", "count"] == 2
+        assert burble.summary(by="callsite")["count"].sum() == len(burble.records)
+        with pytest.raises(ValueError, match="`by` argument"):
+            burble.summary(by="bad")
+
+
+def test_parse_burble():
+    text = (
+        "hello [ GrB_mxm C=A*B, saxpy (sparse to bitmap) [ GrB_transpose (transpose)\n"
+        "   1e-06 sec ] (jit: load) \n   7.82e-05 sec ]\n"
+        " [ GrB_eWiseAdd (transpose) (jit: compile and load)\n   2e-06 sec ]\n [ incomplete"
+    )
+    records = gb.ss.parse_burble(text)
+    assert [record.function for record in records] == [
+        "GrB_transpose",
+        "GrB_mxm",
+        "GrB_eWiseAdd",
+    ]
+    transpose, mxm, ewise_add = records
+    assert transpose.depth == 1
+    assert transpose.conversions == ()
+    assert transpose.jit_hit is None
+    assert mxm.depth == 0
+    assert mxm.time == 7.82e-05
+    assert mxm.methods == ("saxpy",)
+    assert mxm.conversions == ("sparse to bitmap",)
+    assert mxm.jit == "load"
+    assert mxm.jit_hit
+    assert ewise_add.jit == "compile and load"
+    assert not ewise_add.jit_hit
+    assert ewise_add.conversions == ("transpose",)
+
+
+def test_adaptive_context():
+    config = gb.ss.config
+    prev = config["nthreads"]
+    v = Vector.from_coo([0, 1], [1, 2], size=10)
+    A = Matrix.from_dense(np.ones((40, 40)))
+    seen = []
+    try:
+        config["nthreads"] = 4
+        with gb.ss.AdaptiveContext(work_per_thread=1000) as context:
+            assert context.is_engaged
+            v.ewise_add(v).new()
+            seen.append(config["nthreads"])
+            A.mxm(A).new()
+            seen.append(config["nthreads"])
+            with gb.Profiler() as prof:
+                v.apply(gb.unary.ainv).new()
+            seen.append(config["nthreads"])
+        assert not context.is_engaged
+        assert seen == [1, 4, 1]
+        assert len(prof) == 2
+        assert config["nthreads"] == 4
+        context = gb.ss.AdaptiveContext(False, work_per_thread=10, max_nthreads=3)
+        assert [context.nthreads_for(work) for work in [0, 10, 11, 25, 1000]] == [1, 1, 2, 3, 3]
+        assert "max_nthreads=3" in repr(context)
+    finally:
+        config["nthreads"] = prev
+    with pytest.raises(ValueError, match="positive"):
+        gb.ss.AdaptiveContext(work_per_thread=0)
+
+
+def test_adaptive_context_calibrate(tmp_path):
+    yaml = pytest.importorskip("yaml")
+    path = tmp_path / "adaptive_context.yaml"
+    with gb.config.set({"adaptive_context": gb.config.get("adaptive_context")}):
+        context = gb.ss.AdaptiveContext.calibrate(sizes=[16, 64], repeat=1, path=path)
+        assert not context.is_engaged
+        with path.open() as f:
+            settings = yaml.safe_load(f)["adaptive_context"]
+        assert settings["work_per_thread"] == context.work_per_thread
+        assert settings["max_nthreads"] == gb.ss.config["nthreads"]
+        assert gb.config.get("adaptive_context") == settings
+        assert gb.ss.AdaptiveContext(False).work_per_thread == context.work_per_thread
+    context = gb.ss.AdaptiveContext.calibrate(sizes=[16], repeat=1, save=False)
+    assert context.work_per_thread in {16, 32}
+
+
+def test_tiled_matrix(tmp_path, monkeypatch):
+    from graphblas import binary, monoid, unary
+
+    A = Matrix.from_coo(
+        [0, 1, 3, 4, 6, 7, 9, 9],
+        [0, 5, 2, 8, 1, 9, 3, 9],
+        [1.0, 2, 3, 4, 5, 6, 7, 8],
+        nrows=10,
+        ncols=10,
+    )
+    T = gb.ss.TiledMatrix.from_matrix(A, tmp_path / "A", (4, 3), max_workers=2)
+    assert T.shape == (10, 10)
+    assert T.dtype == A.dtype
+    assert T.nvals == A.nvals
+    assert T.chunks == ((4, 4, 2), (3, 3, 3, 1))
+    assert T.ntiles == (3, 4)
+    assert T.tile(2, 3).isequal(A[8:, 9:].new())
+    assert T.to_matrix().isequal(A)
+    assert "ntiles=(3, 4)" in repr(T)
+    T = gb.ss.TiledMatrix(tmp_path / "A")
+    assert T.to_matrix().isequal(A)
+
+    v = Vector.from_coo(np.arange(10), np.arange(10.0))
+    assert T.mxv(v).isequal((A @ v).new())
+    B = Matrix.from_coo([0, 2, 9], [1, 0, 1], [1.0, 2, 3], nrows=10, ncols=2)
+    assert T.mxm(B).isequal((A @ B).new())
+    assert T.mxm(B, gb.semiring.min_plus).isequal(A.mxm(B, gb.semiring.min_plus).new())
+    C = T.mxm(B, path=tmp_path / "AB")
+    assert C.chunks == ((4, 4, 2), (2,))
+    assert C.to_matrix().isequal((A @ B).new())
+
+    # Each tile is loaded once; the result dtype is found without loading tiles
+    loads = []
+    tile = gb.ss.TiledMatrix.tile
+    monkeypatch.setattr(
+        gb.ss.TiledMatrix, "tile", lambda self, i, j: loads.append((i, j)) or tile(self, i, j)
+    )
+    expected = A.ewise_add(A.T, binary.max).new()
+    result = T.ewise_add(A.T, binary.max, path=tmp_path / "add")
+    assert sorted(loads) == sorted(itertools.product(range(3), range(4)))
+    assert result.to_matrix().isequal(expected)
+    loads.clear()
+    result = T.apply(binary.gt, 4, path=tmp_path / "gt")
+    assert len(loads) == 12
+    monkeypatch.undo()
+    expected = A.ewise_mult(A).new()
+    assert T.ewise_mult(T, path=tmp_path / "mult").to_matrix().isequal(expected)
+    expected = A.apply(unary.ainv).new()
+    assert T.apply(unary.ainv, path=tmp_path / "ainv").to_matrix().isequal(expected)
+    expected = A.apply(binary.gt, 4).new()
+    result = T.apply(binary.gt, 4, path=tmp_path / "gt")
+    assert result.dtype == gb.dtypes.BOOL
+    assert result.to_matrix().isequal(expected)
+
+    assert T.reduce_rowwise().isequal(A.reduce_rowwise().new())
+    assert T.reduce_columnwise(binary.max).isequal(A.reduce_columnwise(binary.max).new())
+    assert T.reduce_scalar(monoid.min).isequal(A.reduce_scalar(monoid.min).new())
+    assert T.reduce_scalar().value == 36
+
+    with pytest.raises(TypeError, match="Monoid"):
+        T.reduce_rowwise(binary.minus)
+    with pytest.raises(gb.exceptions.DimensionMismatch):
+        T.mxv(Vector(float, 9))
+    with pytest.raises(gb.exceptions.DimensionMismatch):
+        T.ewise_add(C, path=tmp_path / "bad")
+    with pytest.raises(ValueError, match="path"):
+        T.apply(unary.ainv, path=tmp_path / "A")
@@ -982,6 +982,14 @@ def test_reduce_agg_firstlast(v):
     assert s == 1
 
 
+def test_reduce_agg_describe(v):
+    s = v.reduce(agg.describe).new()
+    assert s.value.tolist() == (4, 4, 6, 0, 2, 1, 0)
+    assert Vector(int, size=4).reduce(agg.describe).new().is_empty
+    w = Vector.from_coo([0, 1, 2], [1.5, np.nan, -1.0])
+    assert w.reduce(agg.describe).new().value.tolist()[3:] == (-1.0, 1.5, 1.5, -1.0)
+
+
 @pytest.mark.skipif("not suitesparse")
 def test_reduce_agg_firstlast_index(v):
     assert v.reduce(agg.ss.first_index).new() == 1
@@ -1634,6 +1642,7 @@ def test_expr_is_like_vector(v):
         "_assign_element",
         "_delete_element",
         "_deserialize",
+        "_deserialize_blob",
         "_extract_element",
         "_from_obj",
         "_name_counter",
@@ -1684,6 +1693,7 @@ def test_index_expr_is_like_vector(v):
         "_assign_element",
         "_delete_element",
         "_deserialize",
+        "_deserialize_blob",
         "_extract_element",
         "_from_obj",
         "_name_counter",
@@ -2382,6 +2392,37 @@ def test_reposition(v):
         assert result.isequal(expected)
 
 
+def test_groupby(v):
+    labels = [0, 1, 0, 1, 1, 2, 0]
+    expected = Vector.from_coo([0, 1], [0, 4], size=3)
+    assert v.groupby(labels).isequal(expected)
+    assert v.groupby(np.array(labels), monoid.plus, name="w").name == "w"
+    assert v.groupby(labels, "plus", ngroups=5).isequal(Vector.from_coo([0, 1], [0, 4], size=5))
+    count, mean, largest = v.groupby(labels, [agg.count, agg.mean, binary.max])
+    assert count.isequal(Vector.from_coo([0, 1], [1, 3], size=3))
+    assert mean.isclose(Vector.from_coo([0, 1], [0, 4 / 3], size=3))
+    assert largest.isequal(Vector.from_coo([0, 1], [0, 2], size=3))
+    assert v.groupby(labels, agg.logaddexp).isclose(
+        Vector.from_coo([0, 1], [0, np.log(2 * np.e + np.e**2)], size=3)
+    )
+    # Indices without a label are ignored
+    assert v.groupby(Vector.from_coo([1, 4, 6], [0, 0, 1])).isequal(Vector.from_coo([0, 1], [3, 0]))
+    if suitesparse:
+        first, argmax = v.groupby(labels, [agg.ss.first, agg.ss.argmax])
+        assert first.isequal(Vector.from_coo([0, 1], [0, 1], size=3))
+        assert argmax.isequal(Vector.from_coo([0, 1], [6, 4], size=3))
+    with pytest.raises(DimensionMismatch, match="labels must have size 7"):
+        v.groupby([0, 1])
+    with pytest.raises(TypeError, match="labels must be integers"):
+        v.groupby(np.zeros(7))
+    with pytest.raises(ValueError, match="non-negative"):
+        v.groupby([0, 1, 0, 1, 1, -2, 0])
+    with pytest.raises(ValueError, match="less than ngroups=2"):
+        v.groupby(labels, ngroups=2)
+    with pytest.raises(TypeError, match="Monoid"):
+        v.groupby(labels, semiring.plus_times)
+
+
 def test_to_coo_sort():
     # How can we get a vector to a jumbled state in SS so that export won't be sorted?
     N = 1000000
@@ -2473,6 +2514,32 @@ def test_ss_serialize(v):
         Vector.ss.deserialize(a[:-5])
 
 
+@pytest.mark.skipif("not suitesparse")
+def test_ss_shared_memory(v):
+    for format in [None, "sparse", "bitmap", "full"]:
+        w = v if format != "full" else Vector.from_dense([1, 2, 3])
+        with w.ss.to_shared_memory(format) as handle:
+            handle = pickle.loads(pickle.dumps(handle))
+            u = Vector.ss.from_shared_memory(handle, name="u")
+            assert u.name == "u"
+            assert u.isequal(w, check_dtype=True)
+    with Vector(float, 4).ss.to_shared_memory() as handle:
+        assert Vector.ss.from_shared_memory(handle).isequal(Vector(float, 4), check_dtype=True)
+
+
+@pytest.mark.skipif("not suitesparse")
+def test_ss_save_load(v, tmp_path):
+    for format in [None, "sparse", "bitmap"]:
+        v.ss.save(tmp_path / str(format), format)
+        for mmap in [True, False]:
+            w = Vector.ss.load(tmp_path / str(format), mmap=mmap, name="w")
+            assert w.name == "w"
+            assert w.isequal(v, check_dtype=True)
+    u = Vector.from_dense([True, False])
+    u.ss.save(tmp_path / "u")
+    assert Vector.ss.load(tmp_path / "u").isequal(u, check_dtype=True)
+
+
 @pytest.mark.skipif("not suitesparse")
 def test_ss_config(v):
     d = {}
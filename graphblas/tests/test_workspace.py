@@ -0,0 +1,102 @@
+import pytest
+
+import graphblas as gb
+from graphblas import agg
+from graphblas.core import workspace
+
+
+@pytest.fixture
+def A():
+    return gb.Matrix.from_coo([0, 1, 2, 2], [1, 2, 0, 1], [1, 2, 3, 4], nrows=3, ncols=3)
+
+
+@pytest.fixture(autouse=True)
+def empty_workspace():
+    workspace.clear()
+    yield
+    workspace.clear()
+
+
+def test_borrow():
+    with workspace.borrow(gb.Vector, int, (5,), 7, name="init") as v:
+        assert v.name == "init"
+        assert v.nvals == 5
+        assert v.reduce().new() == 35
+    assert workspace._size == 1
+    with workspace.borrow(gb.Vector, int, (5,), 7) as w:
+        assert w is v
+        assert workspace._size == 0
+        # Different keys don't reuse the same object
+        with workspace.borrow(gb.Vector, int, (5,), 8) as x:
+            assert x is not v
+            assert x.reduce().new() == 40
+        with workspace.borrow(gb.Vector, float, (5,)) as x:
+            assert x is not v
+            x << 1
+    assert workspace._size == 3
+    # Objects without a fill value are cleared before being reused
+    with workspace.borrow(gb.Vector, float, (5,)) as y:
+        assert y is x
+        assert y.nvals == 0
+    workspace.clear()
+    assert workspace._size == 0
+    with workspace.borrow(gb.Vector, int, (5,), 7) as w:
+        assert w is not v
+
+
+def test_borrow_maxsize(monkeypatch):
+    monkeypatch.setattr(workspace, "maxsize", 2)
+    for size in range(1, 5):
+        with workspace.borrow(gb.Matrix, int, (size, 1), 0):
+            pass
+    assert workspace._size == 2
+    assert [key[2] for key in workspace._pool] == [(3, 1), (4, 1)]
+    monkeypatch.setattr(workspace, "maxsize", 0)
+    with workspace.borrow(gb.Matrix, int, (4, 1), 0) as M:
+        assert M.nvals == 4
+    assert workspace._size == 2
+
+
+def test_aggregators_reuse(A):
+    count = A.reduce_rowwise(agg.count).new()
+    mean = A.reduce_scalar(agg.mean).new()
+    assert workspace._size > 0
+    first = gb.Vector.from_coo([0, 1, 2], [3, 1, 2])
+    argmax = gb.Vector.from_coo([0, 1, 2], [2, 2, 1])
+    for _ in range(3):
+        assert A.reduce_rowwise(agg.count).new().isequal(count)
+        assert A.reduce_scalar(agg.mean).new() == mean
+        assert A.reduce_columnwise(agg._deprecated["first"]).new().isequal(first)
+        assert A.reduce_columnwise(agg._deprecated["argmax"]).new().isequal(argmax)
+    size = workspace._size
+    A.reduce_scalar(agg.mean).new()
+    assert workspace._size == size
+
+
+def test_recorder(A):
+    A.reduce_rowwise(agg.count).new()
+    size = workspace._size
+    assert size > 0
+    with gb.Recorder() as rec:
+        A.reduce_rowwise(agg.count).new()
+        A.reduce_rowwise(agg.count).new()
+    # Objects from outside of the recording aren't reused, so the record is self-contained
+    assert workspace._size == 2 * size
+    assert sum("GrB_Vector_new" in line for line in rec) == 3  # init vector and two results
+    assert sum("GrB_Vector_assign" in line or "GxB_Vector_subassign" in line for line in rec) == 1
+    A.reduce_rowwise(agg.count).new()
+    assert workspace._size == 2 * size
+    # Objects created while recording are freed with the Recorder
+    del rec
+    assert workspace._size == size
+
+
+def test_power(A):
+    expected = A.dup()
+    for n in range(2, 8):
+        expected = expected.mxm(A).new()
+        assert A.power(n).new().isequal(expected)
+    size = workspace._size
+    assert size == 2  # "Squares" and "Power"
+    assert A.power(7).new().isequal(expected)
+    assert workspace._size == size
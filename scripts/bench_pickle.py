@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Benchmark the ways to pickle a Matrix.
+
+This compares pickling the buffers from ``Matrix.ss.export`` in-band (protocol 4),
+the same buffers out-of-band (protocol 5 with a ``buffer_callback``), and the blob from
+``Matrix.ss.serialize`` with ``gb.config["pickle_compression"]`` set, in-band and out-of-band.
+"""
+
+import argparse
+import pickle
+import time
+
+import numpy as np
+
+import graphblas as gb
+
+METHODS = {
+    "export, protocol 4": (None, 4),
+    "export, protocol 5 oob": (None, 5),
+    "serialize none, protocol 5 oob": ("none", 5),
+    "serialize lz4, protocol 4": ("lz4", 4),
+    "serialize lz4, protocol 5 oob": ("lz4", 5),
+    "serialize zstd, protocol 5 oob": ("zstd", 5),
+}
+
+
+def matrices(nvals, seed=42):
+    """Yield (description, Matrix) of various sizes and formats."""
+    rng = np.random.default_rng(seed)
+    for n in [nvals // 100, nvals // 5, 10 * nvals]:
+        rows = rng.integers(0, n, nvals)
+        cols = rng.integers(0, n, nvals)
+        A = gb.Matrix.from_coo(
+            rows, cols, rng.random(nvals), nrows=n, ncols=n, dup_op=gb.binary.plus
+        )
+        yield f"{n}x{n} {A.ss.format}", A
+        B = gb.Matrix(float, n, n)
+        B(A.S) << 1.5
+        yield f"{n}x{n} {B.ss.format} iso", B
+
+
+def roundtrip(A, compression, protocol):
+    buffers = []
+    buffer_callback = buffers.append if protocol >= 5 else None
+    with gb.config.set(pickle_compression=compression):
+        start = time.perf_counter()
+        data = pickle.dumps(A, protocol=protocol, buffer_callback=buffer_callback)
+        dumps = time.perf_counter() - start
+    size = len(data) + sum(buf.raw().nbytes for buf in buffers)
+    start = time.perf_counter()
+    pickle.loads(data, buffers=buffers)
+    loads = time.perf_counter() - start
+    return dumps, loads, size
+
+
+def main(nvals, repeat):
+    print(f"{'matrix':<32}{'method':<34}{'dumps':>10}{'loads':>10}{'total':>10}{'MB':>10}")
+    for desc, A in matrices(nvals):
+        for method, (compression, protocol) in METHODS.items():
+            results = [roundtrip(A, compression, protocol) for _ in range(repeat)]
+            dumps = min(r[0] for r in results)
+            loads = min(r[1] for r in results)
+            total = min(r[0] + r[1] for r in results)
+            size = results[0][2] / 2**20
+            print(f"{desc:<32}{method:<34}{dumps:10.5f}{loads:10.5f}{total:10.5f}{size:10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nvals", type=int, default=1_000_000, help="values per matrix")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per timing")
+    args = parser.parse_args()
+    main(args.nvals, args.repeat)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Benchmark the ways to reduce a Matrix to a Scalar with semiring aggregators.
+
+For each matrix and aggregator, this times every path in
+``graphblas.core.operator.agg._plan_matrix_reduce`` and the path the planner chooses,
+then reports how much slower the planned path is than the fastest path.
+"""
+
+import argparse
+import time
+from functools import partial
+
+import numpy as np
+
+import graphblas as gb
+from graphblas import agg
+from graphblas.core.operator import agg as agg_module
+
+PATHS = ["values", "rowwise", "columnwise"]
+AGGREGATORS = [
+    getattr(agg, name)
+    for name in ["count", "sum_of_squares", "count_nonzero", "hypot", "mean", "varp"]
+]
+# Like `agg.sum`, but uses the `plus_first` semiring, which is also used by `agg.L1norm`
+# when numba is not installed.
+AGGREGATORS.append(
+    agg_module.Aggregator(
+        "sum_first", semiring=gb.semiring.plus_first, semiring2=gb.semiring.plus_first
+    )
+)
+
+
+def matrices(nvals, seed=42):
+    """Yield (description, Matrix) of various shapes, formats, and orientations."""
+    rng = np.random.default_rng(seed)
+    for nrows, ncols in [
+        (2**40, 2**40),
+        (100 * nvals, 100 * nvals),
+        (nvals, nvals),
+        (nvals // 10, nvals // 10),
+        (nvals // 100, nvals // 100),
+        (nvals // 1000, nvals // 1000),
+        (10, 10 * nvals),
+        (10 * nvals, 10),
+    ]:
+        rows = rng.integers(0, nrows, nvals)
+        cols = rng.integers(0, ncols, nvals)
+        A = gb.Matrix.from_coo(
+            rows, cols, rng.random(nvals), nrows=nrows, ncols=ncols, dup_op=gb.binary.plus
+        )
+        yield f"{nrows}x{ncols} {A.ss.format}", A
+        if nrows != ncols:
+            continue
+        B = A.dup()
+        B.ss.config["format"] = "by_col"
+        yield f"{nrows}x{ncols} {B.ss.format}", B
+        C = gb.Matrix(float, nrows, ncols)
+        C(A.S) << 1.5
+        yield f"{nrows}x{ncols} {C.ss.format} iso", C
+
+
+def reduce_scalar(A, aggregator):
+    return A.reduce_scalar(aggregator).new()
+
+
+def timeit(func, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(nvals, repeat):
+    planner = agg_module._plan_matrix_reduce
+    header = f"{'matrix':<36}{'aggregator':<16}" + "".join(f"{p:>12}" for p in PATHS)
+    print(f"{header}{'planned':>22}{'slowdown':>10}")
+    worst = 1
+    try:
+        for desc, A in matrices(nvals):
+            for aggregator in AGGREGATORS:
+                name = aggregator.name
+                times = {}
+                for path in PATHS:
+                    agg_module._plan_matrix_reduce = lambda semiring, A, path=path: path
+                    times[path] = timeit(partial(reduce_scalar, A, aggregator), repeat)
+                choices = set()
+
+                def record_plan(semiring, A, choices=choices):
+                    choices.add(path := planner(semiring, A))
+                    return path
+
+                agg_module._plan_matrix_reduce = record_plan
+                planned = timeit(partial(reduce_scalar, A, aggregator), repeat)
+                choice = "/".join(sorted(choices))
+                slowdown = planned / min(times.values())
+                worst = max(worst, slowdown)
+                row = f"{desc:<36}{name:<16}" + "".join(f"{times[p]:12.5f}" for p in PATHS)
+                print(f"{row}{choice:>12}{planned:10.5f}{slowdown:10.2f}")
+    finally:
+        agg_module._plan_matrix_reduce = planner
+    print(f"Worst slowdown of planned path compared to fastest path: {worst:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nvals", type=int, default=1_000_000, help="values per matrix")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per timing")
+    args = parser.parse_args()
+    main(args.nvals, args.repeat)